@@ -8,13 +8,17 @@ from pathlib import Path
 
 from homeassistant.components.http import StaticPathConfig, async_register_static_paths
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
 
+from .cache import STORAGE_VERSION as CACHE_STORAGE_VERSION, storage_key
 from .const import DOMAIN, FRONTEND_SCRIPT_URL
 from .coordinator import ArgosCoordinator
+from .router import ServerRouter
 from .services import async_register_services
+from .websocket_api import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -79,7 +83,10 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     except Exception:  # noqa: BLE001
         _LOGGER.debug("Could not auto-register Lovelace resource; add manually")
 
-    async_register_services(hass)
+    # One router for services and the card, so load balancing sees every call
+    router = ServerRouter()
+    async_register_services(hass, router)
+    async_register_websocket_commands(hass, router)
 
     return True
 
@@ -89,10 +96,23 @@ async def async_setup_entry(
 ) -> bool:
     """Set up Argos Translate from a config entry."""
     coordinator = ArgosCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Setup is retried with a new coordinator — don't leak its session
+        await coordinator.async_close_session()
+        raise
 
     entry.runtime_data = ArgosTranslateData(coordinator=coordinator)
 
+    # Entries are not unloaded when Home Assistant stops
+    async def _async_close_session(_event: Event) -> None:
+        await coordinator.async_close_session()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
@@ -101,4 +121,14 @@ async def async_unload_entry(
     hass: HomeAssistant, entry: ArgosTranslateConfigEntry
 ) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await entry.runtime_data.coordinator.async_close_session()
+    return unload_ok
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, entry: ArgosTranslateConfigEntry
+) -> None:
+    """Remove the persistent translation cache of a deleted config entry."""
+    await Store(hass, CACHE_STORAGE_VERSION, storage_key(entry.entry_id)).async_remove()
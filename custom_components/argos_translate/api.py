@@ -3,15 +3,36 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
 import logging
+import random
+import time
 from typing import Any
 
 import aiohttp
 
-from .const import DEFAULT_TIMEOUT
+from .const import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_DETECT_TIMEOUT,
+    DEFAULT_LANGUAGES_TIMEOUT,
+    DEFAULT_RETRIES,
+    DEFAULT_TRANSLATE_TIMEOUT,
+    RETRY_BACKOFF,
+    RETRY_BACKOFF_MAX,
+    TRANSLATE_CHARS_PER_SECOND,
+)
+from .metrics import RequestMetrics
 
 _LOGGER = logging.getLogger(__name__)
 
+# Statuses a proxy or a restarting server answers with before the request
+# reaches the translation models
+RETRY_STATUSES = frozenset({502, 503})
+# Endpoints cheap and safe to repeat after a timeout; a /translate that timed
+# out may still be running on the server, so it is not sent again
+RETRY_TIMEOUT_ENDPOINTS = frozenset({"/detect", "/languages"})
+
 
 class CannotConnectError(Exception):
     """Raised when a connection or timeout error occurs."""
@@ -29,6 +50,50 @@ class TranslationError(Exception):
     """
 
 
+class _RetryableError(Exception):
+    """Wraps a CannotConnectError for a failure that is safe to retry."""
+
+    def __init__(self, error: CannotConnectError) -> None:
+        """Initialize with the error raised once retries run out."""
+        super().__init__(str(error))
+        self.error = error
+
+
+@dataclass(frozen=True, slots=True)
+class TimeoutProfile:
+    """Connect and read timeouts for one kind of request, in seconds.
+
+    connect bounds opening the TCP connection, so an unreachable host fails
+    fast whatever the endpoint. read bounds the wait for the response and
+    grows by read_per_char for every character sent, so long texts get the
+    time the models need to translate them.
+    """
+
+    connect: float
+    read: float
+    read_per_char: float = 0.0
+
+    def read_timeout(self, chars: int = 0) -> float:
+        """Return the read timeout for a request carrying chars characters."""
+        return self.read + chars * self.read_per_char
+
+    def client_timeout(self, chars: int = 0) -> aiohttp.ClientTimeout:
+        """Return the aiohttp timeout for one attempt."""
+        return aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=self.connect,
+            sock_read=self.read_timeout(chars),
+        )
+
+    def deadline(self, chars: int = 0, attempts: int = 1) -> float:
+        """Return the budget shared by every attempt of one call.
+
+        Each of the attempts gets a full connect and read timeout, so a retry
+        after a read timeout still has the time it needs.
+        """
+        return attempts * (self.connect + self.read_timeout(chars))
+
+
 class ArgosTranslateApiClient:
     """API client for LibreTranslate server."""
 
@@ -39,45 +104,163 @@ class ArgosTranslateApiClient:
         api_key: str,
         session: aiohttp.ClientSession,
         use_ssl: bool = False,
-        timeout: int = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        languages_timeout: float = DEFAULT_LANGUAGES_TIMEOUT,
+        detect_timeout: float = DEFAULT_DETECT_TIMEOUT,
+        translate_timeout: float = DEFAULT_TRANSLATE_TIMEOUT,
     ) -> None:
         """Initialize the API client."""
         scheme = "https" if use_ssl else "http"
         self._base_url = f"{scheme}://{host}:{port}"
         self._api_key = api_key
         self._session = session
-        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._retries = retries
+        self._connect_timeout = connect_timeout
+        self._languages_timeout = TimeoutProfile(connect_timeout, languages_timeout)
+        self._detect_timeout = TimeoutProfile(connect_timeout, detect_timeout)
+        self._translate_timeout = TimeoutProfile(
+            connect_timeout, translate_timeout, 1 / TRANSLATE_CHARS_PER_SECOND
+        )
+        # Attempts sent again after a retryable failure, and calls that still
+        # failed once their retries or deadline ran out
+        self.retry_count = 0
+        self.retry_exhausted_count = 0
+        self.metrics = RequestMetrics()
 
     async def _request(
-        self, method: str, endpoint: str, **kwargs: Any
+        self,
+        method: str,
+        endpoint: str,
+        profile: TimeoutProfile,
+        chars: int = 0,
+        **kwargs: Any,
+    ) -> Any:
+        """Make a request to the LibreTranslate API, retrying transient failures.
+
+        Each attempt gets the connect and read timeouts of profile, scaled to
+        the chars characters sent. A reset connection (typically a pooled
+        keep-alive connection the server already closed) and HTTP 502/503 are
+        retried on every endpoint; read timeouts only on
+        RETRY_TIMEOUT_ENDPOINTS. Retries wait a jittered exponential backoff
+        and all attempts share a deadline worth one full attempt per try, so
+        a call never takes longer than its budget: a retry that would start
+        after it is not made, and one still running when it expires fails.
+
+        The duration and outcome of every call, retries included, are
+        recorded in self.metrics under its endpoint.
+        """
+        start = time.monotonic()
+        try:
+            result = await self._request_with_retries(
+                method, endpoint, profile, chars, **kwargs
+            )
+        except Exception:
+            self.metrics.record(endpoint, time.monotonic() - start, error=True)
+            raise
+        self.metrics.record(endpoint, time.monotonic() - start, chars)
+        return result
+
+    async def _request_with_retries(
+        self,
+        method: str,
+        endpoint: str,
+        profile: TimeoutProfile,
+        chars: int,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a request until it succeeds, fails for good, or runs out of time."""
+        loop = asyncio.get_running_loop()
+        expires_at = loop.time() + profile.deadline(chars, self._retries + 1)
+        timeout = profile.client_timeout(chars)
+        attempt = 0
+        while True:
+            try:
+                async with asyncio.timeout_at(expires_at):
+                    return await self._send(method, endpoint, timeout, **kwargs)
+            except asyncio.TimeoutError as err:
+                if attempt:
+                    self.retry_exhausted_count += 1
+                raise CannotConnectError("Request timed out") from err
+            except _RetryableError as retryable:
+                # Full jitter keeps clients that failed together from
+                # retrying together
+                delay = random.uniform(
+                    0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF * 2**attempt)
+                )
+                if attempt >= self._retries or loop.time() + delay >= expires_at:
+                    if attempt:
+                        self.retry_exhausted_count += 1
+                    raise retryable.error from retryable.__cause__
+                self.retry_count += 1
+                _LOGGER.debug(
+                    "Retrying %s %s in %.2fs: %s", method, endpoint, delay, retryable
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        timeout: aiohttp.ClientTimeout,
+        **kwargs: Any,
     ) -> Any:
-        """Make a request to the LibreTranslate API."""
+        """Make one attempt at a request.
+
+        The response is always used as a context manager and its body read,
+        including for error statuses, so the connection is released back to
+        the pool for reuse instead of being leaked or closed.
+        """
         url = f"{self._base_url}{endpoint}"
         try:
-            response = await self._session.request(
+            async with self._session.request(
                 method,
                 url,
-                timeout=self._timeout,
+                timeout=timeout,
                 **kwargs,
-            )
-        except aiohttp.ClientConnectionError as err:
-            raise CannotConnectError(f"Connection error: {err}") from err
-        except aiohttp.ClientError as err:
-            raise CannotConnectError(f"Client error: {err}") from err
-        except asyncio.TimeoutError as err:
-            raise CannotConnectError("Request timed out") from err
+            ) as response:
+                if response.status >= 400:
+                    # Drain the (small) error body so the connection can be reused
+                    await response.read()
 
-        if response.status in (401, 403):
-            raise InvalidAuthError(
-                f"Authentication failed (HTTP {response.status})"
-            )
+                if response.status in (401, 403):
+                    raise InvalidAuthError(
+                        f"Authentication failed (HTTP {response.status})"
+                    )
 
-        if response.status >= 400:
-            raise TranslationError(
-                f"Server returned HTTP {response.status}: {response.reason}"
-            )
+                if response.status in RETRY_STATUSES:
+                    raise _RetryableError(
+                        CannotConnectError(
+                            f"Server unavailable (HTTP {response.status})"
+                        )
+                    )
 
-        return await response.json()
+                if response.status >= 400:
+                    raise TranslationError(
+                        f"Server returned HTTP {response.status}: {response.reason}"
+                    )
+
+                return await response.json()
+        except aiohttp.ConnectionTimeoutError as err:
+            # Not retried: a host that does not accept connections is down
+            raise CannotConnectError("Connection timed out") from err
+        except asyncio.TimeoutError as err:
+            error = CannotConnectError("Request timed out")
+            if endpoint in RETRY_TIMEOUT_ENDPOINTS:
+                raise _RetryableError(error) from err
+            raise error from err
+        except aiohttp.ClientConnectionError as err:
+            error = CannotConnectError(f"Connection error: {err}")
+            # A reset or dropped connection, unlike a refused one, says
+            # nothing about whether the server is up
+            if isinstance(
+                err, (aiohttp.ServerDisconnectedError, aiohttp.ClientOSError)
+            ) and not isinstance(err, aiohttp.ClientConnectorError):
+                raise _RetryableError(error) from err
+            raise error from err
+        except aiohttp.ClientError as err:
+            raise CannotConnectError(f"Client error: {err}") from err
 
     async def async_test_connection(self) -> bool:
         """Test connection by fetching languages from LibreTranslate.
@@ -85,17 +268,33 @@ class ArgosTranslateApiClient:
         Returns True if server is reachable and has language models installed.
         Raises CannotConnectError if unreachable or no languages installed.
         """
-        languages = await self._request("GET", "/languages")
+        languages = await self._request("GET", "/languages", self._languages_timeout)
         if not languages:
             raise CannotConnectError("No languages installed on server")
         return True
 
+    async def async_probe(self, timeout: float) -> None:
+        """Check the server is up with a small request and a short read timeout.
+
+        Fetches /frontend/settings, a few hundred bytes, instead of the full
+        language list. Raises CannotConnectError if the server does not
+        answer in time; any HTTP response means it is alive.
+        """
+        try:
+            await self._request(
+                "GET",
+                "/frontend/settings",
+                TimeoutProfile(self._connect_timeout, timeout),
+            )
+        except (InvalidAuthError, TranslationError):
+            pass
+
     async def async_get_languages(self) -> list[dict[str, Any]]:
         """Fetch available languages from LibreTranslate.
 
         Returns list of language dicts: [{code, name, targets}, ...]
         """
-        return await self._request("GET", "/languages")
+        return await self._request("GET", "/languages", self._languages_timeout)
 
     async def async_translate(
         self, text: str, source: str, target: str
@@ -113,7 +312,49 @@ class ArgosTranslateApiClient:
         }
         if self._api_key:
             payload["api_key"] = self._api_key
-        return await self._request("POST", "/translate", json=payload)
+        return await self._request(
+            "POST", "/translate", self._translate_timeout, len(text), json=payload
+        )
+
+    async def async_translate_many(
+        self,
+        texts: list[str],
+        source: str,
+        target: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[dict[str, Any]]:
+        """Translate several texts, sending up to batch_size texts per request.
+
+        LibreTranslate accepts a list for 'q' and returns lists for
+        'translatedText' (and 'detectedLanguage' when source is 'auto').
+        Returns one result dict per input text, in input order, shaped like
+        the async_translate response.
+        """
+        results: list[dict[str, Any]] = []
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start : start + batch_size]
+            payload: dict[str, Any] = {
+                "q": batch,
+                "source": source,
+                "target": target,
+            }
+            if self._api_key:
+                payload["api_key"] = self._api_key
+            response = await self._request(
+                "POST",
+                "/translate",
+                self._translate_timeout,
+                sum(len(text) for text in batch),
+                json=payload,
+            )
+
+            detected = response.get("detectedLanguage")
+            for index, translated in enumerate(response["translatedText"]):
+                result: dict[str, Any] = {"translatedText": translated}
+                if detected:
+                    result["detectedLanguage"] = detected[index]
+                results.append(result)
+        return results
 
     async def async_detect_languages(self, text: str) -> list[dict[str, Any]]:
         """Detect language candidates for text using LibreTranslate /detect endpoint.
@@ -124,4 +365,6 @@ class ArgosTranslateApiClient:
         payload: dict[str, str] = {"q": text}
         if self._api_key:
             payload["api_key"] = self._api_key
-        return await self._request("POST", "/detect", json=payload)
+        return await self._request(
+            "POST", "/detect", self._detect_timeout, json=payload
+        )
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
+from typing import Any
+
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
@@ -13,9 +16,13 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import ArgosTranslateConfigEntry
-from .const import DOMAIN
+from .const import DOMAIN, PROBE_INTERVAL
 from .coordinator import ArgosCoordinator
 
+PARALLEL_UPDATES = 0
+# Health probe interval, independent of the /languages refresh
+SCAN_INTERVAL = timedelta(seconds=PROBE_INTERVAL)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -28,7 +35,12 @@ async def async_setup_entry(
 
 
 class ArgosStatusSensor(CoordinatorEntity[ArgosCoordinator], BinarySensorEntity):
-    """Binary sensor showing LibreTranslate server connectivity."""
+    """Binary sensor showing LibreTranslate server connectivity.
+
+    Polled on its own short interval to run a lightweight health probe, so an
+    outage or recovery shows up within seconds instead of at the next
+    /languages refresh.
+    """
 
     _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
@@ -50,7 +62,25 @@ class ArgosStatusSensor(CoordinatorEntity[ArgosCoordinator], BinarySensorEntity)
             manufacturer="LibreTranslate",
         )
 
+    @property
+    def should_poll(self) -> bool:
+        """Poll to run the health probe between coordinator refreshes."""
+        return True
+
+    async def async_update(self) -> None:
+        """Probe the server."""
+        await self.coordinator.async_probe()
+
     @property
     def is_on(self) -> bool:
         """Return True if the server is reachable."""
         return self.coordinator.last_update_success
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the circuit state.
+
+        The probe round-trip time is left to diagnostics: as an attribute it
+        would change, and write a new state, on nearly every probe.
+        """
+        return {"circuit": self.coordinator.breaker.state}
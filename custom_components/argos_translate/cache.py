@@ -0,0 +1,219 @@
+"""Translation result cache for Argos Translate."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30
+
+type CacheKey = tuple[str, str, str]
+
+
+def storage_key(entry_id: str) -> str:
+    """Return the .storage key holding the persistent cache of a config entry."""
+    return f"{DOMAIN}.cache.{entry_id}"
+
+
+class TranslationCache:
+    """Bounded in-memory LRU cache with a per-entry TTL.
+
+    Keys are (text, source, target) tuples; values are the raw LibreTranslate
+    response dicts. A max_size of 0 disables the cache, a ttl of 0 keeps
+    entries until they are evicted by size or cleared.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """Initialize the cache."""
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[CacheKey, tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries (including expired ones)."""
+        return len(self._entries)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        """Return whether key has an unexpired entry, without counting a lookup."""
+        entry = self._entries.get(key)
+        return entry is not None and not (0 < entry[0] <= time.monotonic())
+
+    def get(self, key: CacheKey) -> dict[str, Any] | None:
+        """Return the cached result for key, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at and expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: CacheKey, value: dict[str, Any], age: float = 0.0) -> None:
+        """Store a result, evicting the least recently used entry when full.
+
+        age is how many seconds ago the result was translated, for results
+        promoted from the persistent tier; it shortens the entry's TTL.
+        """
+        if self._max_size <= 0:
+            return
+
+        expires_at = time.monotonic() + self._ttl - age if self._ttl > 0 else 0.0
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+
+class PersistentTranslationCache:
+    """Translation cache tier persisted under .storage via the Store helper.
+
+    Each entry keeps the wall-clock time it was written, so the same TTL as
+    the memory tier applies across restarts (a ttl of 0 keeps entries until
+    evicted).
+
+    The stored file is loaded lazily on first lookup. Writes drop the oldest
+    entries beyond the entry limit and schedule a delayed save; Store builds
+    the data to write on the event loop when the delay expires, so a burst
+    of writes costs one copy of the entries rather than one per write.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, max_entries: int, ttl: float = 0
+    ) -> None:
+        """Initialize the persistent cache."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, storage_key(entry_id)
+        )
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: OrderedDict[CacheKey, tuple[float, dict[str, Any]]] | None = (
+            None
+        )
+        self._fingerprint: str | None = None
+        self._load_lock = asyncio.Lock()
+        self._dirty = False
+
+    async def _async_load(self) -> OrderedDict[CacheKey, tuple[float, dict[str, Any]]]:
+        """Load the stored cache on first use."""
+        if self._entries is not None:
+            return self._entries
+
+        async with self._load_lock:
+            if self._entries is not None:
+                return self._entries
+
+            entries: OrderedDict[CacheKey, tuple[float, dict[str, Any]]] = (
+                OrderedDict()
+            )
+            stored = await self._store.async_load() or {}
+            if self._fingerprint is None or stored.get("fingerprint") == self._fingerprint:
+                for text, source, target, result, written_at in stored.get(
+                    "entries", []
+                ):
+                    entries[(text, source, target)] = (written_at, result)
+            self._entries = entries
+            if stored.get("entries") and not entries:
+                _LOGGER.debug("Installed languages changed; discarding stored cache")
+                self._async_schedule_save()
+            return entries
+
+    async def async_get(self, key: CacheKey) -> tuple[dict[str, Any], float] | None:
+        """Return the stored result for key and its age in seconds.
+
+        Loads the cache if needed; returns None on a miss or an expired entry.
+        """
+        entries = await self._async_load()
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        written_at, value = entry
+        age = max(0.0, time.time() - written_at)
+        if self._ttl > 0 and age >= self._ttl:
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return value, age
+
+    def __contains__(self, key: CacheKey) -> bool:
+        """Return whether key has an unexpired entry; False until loaded."""
+        if self._entries is None or (entry := self._entries.get(key)) is None:
+            return False
+        return not (self._ttl > 0 and time.time() - entry[0] >= self._ttl)
+
+    @callback
+    def async_set(self, key: CacheKey, value: dict[str, Any]) -> None:
+        """Store a result and schedule a background save.
+
+        Ignored until the cache has been loaded, so a save can never replace
+        the file with a partial view of it.
+        """
+        if self._entries is None or self._max_entries <= 0:
+            return
+        self._entries[key] = (time.time(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        self._async_schedule_save()
+
+    @callback
+    def async_set_fingerprint(self, fingerprint: str) -> None:
+        """Record the installed-language fingerprint, clearing stale entries."""
+        if fingerprint == self._fingerprint:
+            return
+        previous = self._fingerprint
+        self._fingerprint = fingerprint
+        if previous is not None and self._entries:
+            self._entries.clear()
+            self._async_schedule_save()
+
+    async def async_flush(self) -> None:
+        """Write any pending changes immediately."""
+        if self._dirty:
+            self._dirty = False
+            await self._store.async_save(self._snapshot())
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Mark the cache dirty and schedule a delayed background save."""
+        self._dirty = True
+        self._store.async_delay_save(self._snapshot, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the data to store, built from the current entries."""
+        assert self._entries is not None
+        return {
+            "fingerprint": self._fingerprint,
+            "entries": [
+                [text, source, target, result, written_at]
+                for (text, source, target), (written_at, result) in (
+                    self._entries.items()
+                )
+            ],
+        }
@@ -0,0 +1,80 @@
+"""Split long texts into chunks that translate well on their own."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import re
+
+# Tried in turn on pieces still too long: blank lines between texts,
+# sentence ends, then any whitespace. A single line break is hard wrapping,
+# not a text break, and only counts as whitespace.
+_BREAKS = (
+    re.compile(r"(\s*\n[^\S\n]*\n\s*)"),
+    re.compile(r"((?<=[.!?…。！？])\s+)"),
+    re.compile(r"(\s+)"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkedText:
+    """A text cut into chunks, with the whitespace between them kept verbatim.
+
+    separators has one more item than chunks: the leading whitespace, the
+    whitespace after each chunk but the last, and the trailing whitespace.
+    """
+
+    chunks: tuple[str, ...]
+    separators: tuple[str, ...]
+
+    def join(self, translated: Iterable[str]) -> str:
+        """Reassemble the text from the translation of each chunk, in order."""
+        parts = [self.separators[0]]
+        for chunk, separator in zip(translated, self.separators[1:], strict=True):
+            parts.append(chunk)
+            parts.append(separator)
+        return "".join(parts)
+
+
+def split_text(text: str, max_chars: int) -> ChunkedText:
+    """Split text into chunks of at most max_chars characters.
+
+    Whole paragraphs, separated by blank lines, are packed greedily into
+    each chunk; a paragraph longer than max_chars is packed with whole
+    sentences, a sentence longer than that with whole words, and a word
+    longer than that is cut. Single line breaks stay inside a chunk, so
+    hard-wrapped text is not split line by line.
+    """
+    body = text.strip()
+    if not body:
+        return ChunkedText((), (text,))
+    start = len(text) - len(text.lstrip())
+    pieces = _split(body, max_chars)
+    separators = (text[:start], *pieces[1::2], text[start + len(body) :])
+    return ChunkedText(tuple(pieces[::2]), separators)
+
+
+def _split(text: str, max_chars: int, level: int = 0) -> list[str]:
+    """Return text as alternating chunks and separators."""
+    if len(text) <= max_chars:
+        return [text]
+    if level == len(_BREAKS):
+        pieces: list[str] = []
+        for start in range(0, len(text), max_chars):
+            if pieces:
+                pieces.append("")
+            pieces.append(text[start : start + max_chars])
+        return pieces
+
+    parts = _BREAKS[level].split(text)
+    pieces = []
+    current = parts[0]
+    for separator, part in zip(parts[1::2], parts[2::2], strict=True):
+        if len(current) + len(separator) + len(part) <= max_chars:
+            current += separator + part
+        else:
+            pieces.extend(_split(current, max_chars, level + 1))
+            pieces.append(separator)
+            current = part
+    pieces.extend(_split(current, max_chars, level + 1))
+    return pieces
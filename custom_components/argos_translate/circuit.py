@@ -0,0 +1,88 @@
+"""Circuit breaker for calls to one LibreTranslate server."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import time
+
+from .api import CannotConnectError, InvalidAuthError, TranslationError
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(CannotConnectError):
+    """Raised instead of calling a server whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Fail fast while a server is down instead of waiting out its timeout.
+
+    Closed: calls go through. A connection failure, or the coordinator
+    marking the server offline, opens the circuit. Open: calls raise
+    CircuitOpenError at once until reset_timeout has passed. Half-open: a
+    single trial call goes through while the others keep failing fast; it
+    closes the circuit if the server answers and reopens it if not.
+    """
+
+    def __init__(self, reset_timeout: float) -> None:
+        """Initialize the breaker."""
+        self.state = STATE_CLOSED
+        self._reset_timeout = reset_timeout
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def trip(self) -> None:
+        """Open the circuit.
+
+        Tripping an already open circuit keeps its original timer, so a
+        stream of fast-failed calls cannot postpone the next trial forever.
+        """
+        if self.state != STATE_OPEN:
+            self.state = STATE_OPEN
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def reset(self) -> None:
+        """Close the circuit — the server answered."""
+        self.state = STATE_CLOSED
+        self._trial_in_flight = False
+
+    @contextmanager
+    def attempt(self) -> Iterator[None]:
+        """Guard one call to the server, raising CircuitOpenError if not allowed."""
+        trial = self._admit()
+        try:
+            yield
+        except CannotConnectError:
+            self.trip()
+            raise
+        except (InvalidAuthError, TranslationError):
+            # The server answered, even if it refused the request
+            self.reset()
+            raise
+        except BaseException:
+            # Cancelled or failed locally: the trial proved nothing
+            if trial:
+                self._trial_in_flight = False
+            raise
+        else:
+            self.reset()
+
+    def _admit(self) -> bool:
+        """Let a call through or raise; return True for a half-open trial."""
+        if self.state == STATE_CLOSED:
+            return False
+        if self.state == STATE_OPEN:
+            remaining = self._opened_at + self._reset_timeout - time.monotonic()
+            if remaining > 0:
+                raise CircuitOpenError(
+                    f"Server unavailable; next attempt in {remaining:.0f}s"
+                )
+            self.state = STATE_HALF_OPEN
+        if self._trial_in_flight:
+            raise CircuitOpenError("Server unavailable; waiting for a trial request")
+        self._trial_in_flight = True
+        return True
@@ -22,7 +22,43 @@ from .api import (
     CannotConnectError as ApiCannotConnect,
     InvalidAuthError as ApiInvalidAuth,
 )
-from .const import CONF_USE_SSL, DEFAULT_PORT, DOMAIN
+from .const import (
+    CONF_BATCH_SIZE,
+    CONF_CACHE_SIZE,
+    CONF_CACHE_TTL,
+    CONF_CHUNK_SIZE,
+    CONF_CONNECT_TIMEOUT,
+    CONF_DEDICATED_SESSION,
+    CONF_DETECT_TIMEOUT,
+    CONF_DNS_CACHE_TTL,
+    CONF_KEEPALIVE_TIMEOUT,
+    CONF_LANGUAGES_TIMEOUT,
+    CONF_MAX_CONCURRENT,
+    CONF_MINIMAL_ATTRIBUTES,
+    CONF_PERSISTENT_CACHE_SIZE,
+    CONF_POOL_SIZE,
+    CONF_RETRIES,
+    CONF_TRANSLATE_TIMEOUT,
+    CONF_USE_SSL,
+    CONF_WEIGHT,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_DETECT_TIMEOUT,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_LANGUAGES_TIMEOUT,
+    DEFAULT_MAX_CONCURRENT,
+    DEFAULT_PERSISTENT_CACHE_SIZE,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_PORT,
+    DEFAULT_RETRIES,
+    DEFAULT_TRANSLATE_TIMEOUT,
+    DEFAULT_WEIGHT,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,6 +73,28 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Tuning settings stored in entry.options; everything else in the options
+# form is connection data and is merged into entry.data.
+OPTION_DEFAULTS: dict[str, Any] = {
+    CONF_CACHE_SIZE: DEFAULT_CACHE_SIZE,
+    CONF_CACHE_TTL: DEFAULT_CACHE_TTL,
+    CONF_PERSISTENT_CACHE_SIZE: DEFAULT_PERSISTENT_CACHE_SIZE,
+    CONF_BATCH_SIZE: DEFAULT_BATCH_SIZE,
+    CONF_CHUNK_SIZE: DEFAULT_CHUNK_SIZE,
+    CONF_DEDICATED_SESSION: False,
+    CONF_POOL_SIZE: DEFAULT_POOL_SIZE,
+    CONF_KEEPALIVE_TIMEOUT: DEFAULT_KEEPALIVE_TIMEOUT,
+    CONF_DNS_CACHE_TTL: DEFAULT_DNS_CACHE_TTL,
+    CONF_MAX_CONCURRENT: DEFAULT_MAX_CONCURRENT,
+    CONF_WEIGHT: DEFAULT_WEIGHT,
+    CONF_RETRIES: DEFAULT_RETRIES,
+    CONF_CONNECT_TIMEOUT: DEFAULT_CONNECT_TIMEOUT,
+    CONF_LANGUAGES_TIMEOUT: DEFAULT_LANGUAGES_TIMEOUT,
+    CONF_DETECT_TIMEOUT: DEFAULT_DETECT_TIMEOUT,
+    CONF_TRANSLATE_TIMEOUT: DEFAULT_TRANSLATE_TIMEOUT,
+    CONF_MINIMAL_ATTRIBUTES: False,
+}
+
 
 class CannotConnect(Exception):
     """Error to indicate we cannot connect."""
@@ -129,6 +187,10 @@ class ArgosTranslateConfigFlow(ConfigFlow, domain=DOMAIN):
 class OptionsFlowHandler(OptionsFlow):
     """Handle options flow for Argos Translate."""
 
+    def _option(self, key: str) -> Any:
+        """Return the current value of a tuning option, or its default."""
+        return self.config_entry.options.get(key, OPTION_DEFAULTS[key])
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -136,8 +198,16 @@ class OptionsFlowHandler(OptionsFlow):
         errors: dict[str, str] = {}
 
         if user_input is not None:
+            # Split tuning settings (entry.options) from connection data
+            options = {**self.config_entry.options}
+            connection: dict[str, Any] = {}
+            for key, value in user_input.items():
+                if key in OPTION_DEFAULTS:
+                    options[key] = value
+                else:
+                    connection[key] = value
             # Merge with existing data to include CONF_NAME
-            merged = {**self.config_entry.data, **user_input}
+            merged = {**self.config_entry.data, **connection}
             try:
                 await _async_validate_connection(self.hass, merged)
             except CannotConnect:
@@ -151,17 +221,18 @@ class OptionsFlowHandler(OptionsFlow):
                 errors["base"] = "unknown"
             else:
                 self.hass.config_entries.async_update_entry(
-                    self.config_entry, data=merged
+                    self.config_entry, data=merged, options=options
                 )
                 # Reload so coordinator rebuilds with new connection credentials.
                 # Triggers: async_unload_entry -> async_setup_entry -> new coordinator
                 # with new ArgosTranslateApiClient from updated entry.data.
-                # Note: credentials stored in entry.data (not entry.options) because
-                # ArgosCoordinator.__init__ reads entry.data exclusively.
+                # Note: credentials stay in entry.data; tuning settings live in
+                # entry.options and are written before the reload so the new
+                # coordinator picks them up.
                 await self.hass.config_entries.async_reload(
                     self.config_entry.entry_id
                 )
-                return self.async_create_entry(data={})
+                return self.async_create_entry(data=options)
 
         return self.async_show_form(
             step_id="init",
@@ -183,6 +254,74 @@ class OptionsFlowHandler(OptionsFlow):
                         CONF_API_KEY,
                         default=self.config_entry.data.get(CONF_API_KEY, ""),
                     ): str,
+                    vol.Optional(
+                        CONF_CACHE_SIZE,
+                        default=self._option(CONF_CACHE_SIZE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_CACHE_TTL,
+                        default=self._option(CONF_CACHE_TTL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_PERSISTENT_CACHE_SIZE,
+                        default=self._option(CONF_PERSISTENT_CACHE_SIZE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_BATCH_SIZE,
+                        default=self._option(CONF_BATCH_SIZE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_CHUNK_SIZE,
+                        default=self._option(CONF_CHUNK_SIZE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_DEDICATED_SESSION,
+                        default=self._option(CONF_DEDICATED_SESSION),
+                    ): bool,
+                    vol.Optional(
+                        CONF_POOL_SIZE,
+                        default=self._option(CONF_POOL_SIZE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_KEEPALIVE_TIMEOUT,
+                        default=self._option(CONF_KEEPALIVE_TIMEOUT),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_DNS_CACHE_TTL,
+                        default=self._option(CONF_DNS_CACHE_TTL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_MAX_CONCURRENT,
+                        default=self._option(CONF_MAX_CONCURRENT),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_WEIGHT,
+                        default=self._option(CONF_WEIGHT),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_RETRIES,
+                        default=self._option(CONF_RETRIES),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=5)),
+                    vol.Optional(
+                        CONF_CONNECT_TIMEOUT,
+                        default=self._option(CONF_CONNECT_TIMEOUT),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+                    vol.Optional(
+                        CONF_LANGUAGES_TIMEOUT,
+                        default=self._option(CONF_LANGUAGES_TIMEOUT),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+                    vol.Optional(
+                        CONF_DETECT_TIMEOUT,
+                        default=self._option(CONF_DETECT_TIMEOUT),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+                    vol.Optional(
+                        CONF_TRANSLATE_TIMEOUT,
+                        default=self._option(CONF_TRANSLATE_TIMEOUT),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_MINIMAL_ATTRIBUTES,
+                        default=self._option(CONF_MINIMAL_ATTRIBUTES),
+                    ): bool,
                 }
             ),
             errors=errors,
@@ -4,15 +4,69 @@ DOMAIN = "argos_translate"
 
 DEFAULT_PORT = 5000
 DEFAULT_SCAN_INTERVAL = 300
-DEFAULT_TIMEOUT = 30
+MAX_SCAN_INTERVAL = 3600
+RETRY_SCAN_INTERVAL = 30
+DEFAULT_CONNECT_TIMEOUT = 1
+DEFAULT_LANGUAGES_TIMEOUT = 2
+DEFAULT_DETECT_TIMEOUT = 5
+DEFAULT_TRANSLATE_TIMEOUT = 30
+# Translation speed assumed when extending the translate timeout for long
+# texts; a slow CPU-only server translates in the low hundreds of characters
+# per second
+TRANSLATE_CHARS_PER_SECOND = 50
+PROBE_INTERVAL = 15
+PROBE_TIMEOUT = 5
+CIRCUIT_RESET_TIMEOUT = 30
+DEFAULT_RETRIES = 2
+RETRY_BACKOFF = 0.5
+RETRY_BACKOFF_MAX = 4.0
+DEFAULT_CACHE_SIZE = 500
+DEFAULT_CACHE_TTL = 86400
+DEFAULT_PERSISTENT_CACHE_SIZE = 5000
+DEFAULT_BATCH_SIZE = 25
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_POOL_SIZE = 10
+DEFAULT_KEEPALIVE_TIMEOUT = 60
+DEFAULT_DNS_CACHE_TTL = 300
+DEFAULT_MAX_CONCURRENT = 2
+DEFAULT_WEIGHT = 1
+DETECTION_CONFIDENCE_THRESHOLD = 50.0
+# Minutes of requests the latency and throughput sensors are computed over
+METRICS_WINDOW = 5
 
 CONF_USE_SSL = "use_ssl"
 CONF_NAME = "name"
+CONF_CACHE_SIZE = "cache_size"
+CONF_CACHE_TTL = "cache_ttl"
+CONF_PERSISTENT_CACHE_SIZE = "persistent_cache_size"
+CONF_BATCH_SIZE = "batch_size"
+CONF_CHUNK_SIZE = "chunk_size"
+CONF_DEDICATED_SESSION = "dedicated_session"
+CONF_POOL_SIZE = "pool_size"
+CONF_KEEPALIVE_TIMEOUT = "keepalive_timeout"
+CONF_DNS_CACHE_TTL = "dns_cache_ttl"
+CONF_MAX_CONCURRENT = "max_concurrent"
+CONF_WEIGHT = "weight"
+CONF_RETRIES = "retries"
+CONF_CONNECT_TIMEOUT = "connect_timeout"
+CONF_LANGUAGES_TIMEOUT = "languages_timeout"
+CONF_DETECT_TIMEOUT = "detect_timeout"
+CONF_TRANSLATE_TIMEOUT = "translate_timeout"
+CONF_MINIMAL_ATTRIBUTES = "minimal_attributes"
 
 SERVICE_TRANSLATE = "translate"
 SERVICE_DETECT = "detect"
+SERVICE_TRANSLATE_BATCH = "translate_batch"
 ATTR_TEXT = "text"
+ATTR_TEXTS = "texts"
 ATTR_SOURCE = "source"
 ATTR_TARGET = "target"
+ATTR_INCLUDE_CANDIDATES = "include_candidates"
+ATTR_PIVOT = "pivot"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_STRATEGY = "strategy"
+
+STRATEGY_LEAST_OUTSTANDING = "least_outstanding"
+STRATEGY_ROUND_ROBIN = "round_robin"
 
 FRONTEND_SCRIPT_URL = f"/{DOMAIN}/{DOMAIN}-card.js"
@@ -2,18 +2,71 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Callable, Coroutine, Mapping
+import hashlib
+import json
 import logging
+import time
 from datetime import timedelta
 from typing import Any
 
+import aiohttp
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY, CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.json import json_bytes, json_dumps
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.ssl import get_default_context
 
 from .api import ArgosTranslateApiClient, CannotConnectError
-from .const import CONF_USE_SSL, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .cache import CacheKey, PersistentTranslationCache, TranslationCache
+from .chunking import ChunkedText, split_text
+from .circuit import CircuitBreaker
+from .const import (
+    CIRCUIT_RESET_TIMEOUT,
+    CONF_BATCH_SIZE,
+    CONF_CACHE_SIZE,
+    CONF_CACHE_TTL,
+    CONF_CHUNK_SIZE,
+    CONF_CONNECT_TIMEOUT,
+    CONF_DEDICATED_SESSION,
+    CONF_DETECT_TIMEOUT,
+    CONF_DNS_CACHE_TTL,
+    CONF_KEEPALIVE_TIMEOUT,
+    CONF_LANGUAGES_TIMEOUT,
+    CONF_MAX_CONCURRENT,
+    CONF_PERSISTENT_CACHE_SIZE,
+    CONF_POOL_SIZE,
+    CONF_RETRIES,
+    CONF_TRANSLATE_TIMEOUT,
+    CONF_USE_SSL,
+    CONF_WEIGHT,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_DETECT_TIMEOUT,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_LANGUAGES_TIMEOUT,
+    DEFAULT_MAX_CONCURRENT,
+    DEFAULT_PERSISTENT_CACHE_SIZE,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_RETRIES,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TRANSLATE_TIMEOUT,
+    DEFAULT_WEIGHT,
+    DOMAIN,
+    MAX_SCAN_INTERVAL,
+    PROBE_TIMEOUT,
+    RETRY_SCAN_INTERVAL,
+)
+from .languages import LanguageIndex
+from .scheduler import PRIORITY_INTERACTIVE, RequestScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,42 +81,402 @@ class ArgosCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=entry,
             name=DOMAIN,
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # Refreshes that return the same data object don't notify entities
+            always_update=False,
         )
-        self.config_entry = entry
-        session = async_get_clientsession(hass)
+        # A dedicated session gets its own connection pool tuned for this one
+        # server instead of sharing HA's instance-wide connector.
+        self._dedicated_session: aiohttp.ClientSession | None = None
+        if entry.options.get(CONF_DEDICATED_SESSION, False):
+            session = self._dedicated_session = _create_dedicated_session(
+                entry.options
+            )
+        else:
+            session = async_get_clientsession(hass)
         self.client = ArgosTranslateApiClient(
             host=entry.data[CONF_HOST],
             port=entry.data[CONF_PORT],
             api_key=entry.data.get(CONF_API_KEY, ""),
             session=session,
             use_ssl=entry.data.get(CONF_USE_SSL, False),
+            retries=entry.options.get(CONF_RETRIES, DEFAULT_RETRIES),
+            connect_timeout=entry.options.get(
+                CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT
+            ),
+            languages_timeout=entry.options.get(
+                CONF_LANGUAGES_TIMEOUT, DEFAULT_LANGUAGES_TIMEOUT
+            ),
+            detect_timeout=entry.options.get(
+                CONF_DETECT_TIMEOUT, DEFAULT_DETECT_TIMEOUT
+            ),
+            translate_timeout=entry.options.get(
+                CONF_TRANSLATE_TIMEOUT, DEFAULT_TRANSLATE_TIMEOUT
+            ),
+        )
+        self.cache = TranslationCache(
+            max_size=entry.options.get(CONF_CACHE_SIZE, DEFAULT_CACHE_SIZE),
+            ttl=entry.options.get(CONF_CACHE_TTL, DEFAULT_CACHE_TTL),
+        )
+        persistent_size = entry.options.get(
+            CONF_PERSISTENT_CACHE_SIZE, DEFAULT_PERSISTENT_CACHE_SIZE
+        )
+        self.persistent_cache: PersistentTranslationCache | None = (
+            PersistentTranslationCache(
+                hass,
+                entry.entry_id,
+                persistent_size,
+                entry.options.get(CONF_CACHE_TTL, DEFAULT_CACHE_TTL),
+            )
+            if persistent_size > 0
+            else None
         )
+        self.scheduler = RequestScheduler(
+            entry.options.get(CONF_MAX_CONCURRENT, DEFAULT_MAX_CONCURRENT)
+        )
+        self.breaker = CircuitBreaker(CIRCUIT_RESET_TIMEOUT)
+        # Share of calls this server gets when several entries are loaded
+        self.weight: int = entry.options.get(CONF_WEIGHT, DEFAULT_WEIGHT)
+        self._batch_size: int = entry.options.get(CONF_BATCH_SIZE, DEFAULT_BATCH_SIZE)
+        # Texts longer than this are split into chunks; 0 sends them whole
+        self.chunk_size: int = entry.options.get(CONF_CHUNK_SIZE, DEFAULT_CHUNK_SIZE)
+        self._fingerprint: str | None = None
+        self._payload_hash: str | None = None
+        # Round-trip time of the last successful health probe, in seconds
+        self.probe_latency: float | None = None
+        self._in_flight: dict[tuple[str, ...], asyncio.Task[Any]] = {}
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch language data from LibreTranslate."""
+        """Fetch language data from LibreTranslate.
+
+        The poll interval adapts: it doubles (up to MAX_SCAN_INTERVAL) while
+        the payload is unchanged, drops to RETRY_SCAN_INTERVAL after a failure
+        so recovery is noticed quickly, and resets once data changes or the
+        server recovers. An unchanged payload returns the previous data object
+        so entities are not updated and no state is written.
+        """
         try:
             languages = await self.client.async_get_languages()
         except CannotConnectError as err:
+            self.update_interval = timedelta(seconds=RETRY_SCAN_INTERVAL)
+            self.breaker.trip()
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        # The refresh bypasses the breaker so it can notice the server is back
+        self.breaker.reset()
+
+        payload_hash = hashlib.sha256(json_bytes(languages)).hexdigest()
+        if payload_hash == self._payload_hash and self.data is not None:
+            if self.last_update_success:
+                self.update_interval = min(
+                    self.update_interval * 2, timedelta(seconds=MAX_SCAN_INTERVAL)
+                )
+            else:
+                self.update_interval = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+            return self.data
+        self._payload_hash = payload_hash
+        self.update_interval = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+        # Cached translations are only valid for the models they came from —
+        # drop them when a language or pair is installed or removed.
+        fingerprint = _language_fingerprint(languages)
+        if self._fingerprint is not None and fingerprint != self._fingerprint:
+            _LOGGER.debug("Installed languages changed; clearing translation cache")
+            self.cache.clear()
+        self._fingerprint = fingerprint
+        if self.persistent_cache is not None:
+            self.persistent_cache.async_set_fingerprint(fingerprint)
 
         return {
             "languages": languages,
             "language_count": len(languages),
+            "index": LanguageIndex.from_languages(languages),
+            # Changes whenever the payload does; clients cache the catalog on it
+            "version": payload_hash[:16],
         }
 
     async def async_translate(
-        self, text: str, source: str, target: str
+        self,
+        text: str,
+        source: str,
+        target: str,
+        priority: int = PRIORITY_INTERACTIVE,
     ) -> dict[str, Any]:
         """Translate text via the API client.
 
         Convenience method used by the translate service. Returns the full
         response dict from LibreTranslate, including 'detectedLanguage' when
-        source is 'auto'.
+        source is 'auto'. Results are served from the in-memory cache, then the
+        persistent cache, when the same (text, source, target) was translated
+        before. Server calls wait for a scheduler slot at the given priority,
+        and fail fast with CircuitOpenError while the server's circuit is open.
+        Texts longer than the configured chunk size are split into chunks
+        that are translated separately.
         """
-        return await self.client.async_translate(text, source, target)
+        if (chunked := self._split(text)) is not None:
+            return await self._async_translate_chunked(
+                chunked, source, target, priority
+            )
+
+        key = (text, source, target)
+        if (cached := await self._async_get_cached(key)) is not None:
+            return cached
+
+        async def _async_fetch() -> dict[str, Any]:
+            with self.breaker.attempt():
+                async with self.scheduler.slot(priority):
+                    result = await self.client.async_translate(text, source, target)
+            self._async_set_cached(key, result)
+            return result
+
+        return await self._async_coalesce(
+            ("/translate", text, source, target), _async_fetch
+        )
+
+    def has_translation(self, text: str, source: str, target: str) -> bool:
+        """Return whether translating text here needs no new server request.
 
-    async def async_detect_languages(self, text: str) -> list[dict[str, Any]]:
+        True when the result is cached in either tier or already being
+        fetched for another caller; a chunked text counts when all of its
+        chunks do. The router uses this to send repeated calls to the server
+        that can answer them.
+        """
+        chunked = self._split(text)
+        return all(
+            (chunk, source, target) in self.cache
+            or (
+                self.persistent_cache is not None
+                and (chunk, source, target) in self.persistent_cache
+            )
+            or ("/translate", chunk, source, target) in self._in_flight
+            for chunk in (chunked.chunks if chunked is not None else (text,))
+        )
+
+    def _split(self, text: str) -> ChunkedText | None:
+        """Return the chunks of a text too long to send whole, else None."""
+        if not self.chunk_size or len(text) <= self.chunk_size:
+            return None
+        chunked = split_text(text, self.chunk_size)
+        return chunked if len(chunked.chunks) > 1 else None
+
+    async def async_translate_stream(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Translate text, yielding the translation in order as chunks finish.
+
+        Each result holds the next piece of the translated text, whitespace
+        included, so joining the pieces gives the same text async_translate
+        returns. A text short enough to send whole yields a single result.
+        The first result carries 'detectedLanguage' when source is 'auto'.
+        Closing the generator early cancels the chunks not yet awaited; their
+        server calls still finish and are cached.
+        """
+        if (chunked := self._split(text)) is None:
+            yield await self.async_translate(text, source, target, priority)
+            return
+
+        tasks = [
+            asyncio.create_task(self.async_translate(chunk, source, target, priority))
+            for chunk in chunked.chunks
+        ]
+        last = len(tasks) - 1
+        try:
+            for index, task in enumerate(tasks):
+                result = await task
+                piece = chunked.separators[index] + result["translatedText"]
+                if index == last:
+                    piece += chunked.separators[-1]
+                streamed: dict[str, Any] = {"translatedText": piece}
+                if index == 0 and "detectedLanguage" in result:
+                    streamed["detectedLanguage"] = result["detectedLanguage"]
+                yield streamed
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Retrieve errors of chunks after a failed one
+                    task.exception()
+
+    async def _async_translate_chunked(
+        self,
+        chunked: ChunkedText,
+        source: str,
+        target: str,
+        priority: int,
+    ) -> dict[str, Any]:
+        """Translate the chunks of a long text and reassemble them in order.
+
+        Chunks are sent in parallel, up to the scheduler's concurrency cap,
+        and cached one by one: an edited document only re-translates its
+        changed chunks, and a failed call keeps the chunks that finished.
+        With source 'auto' each chunk is detected on its own; the result
+        reports the detection of the first chunk.
+        """
+        results = await asyncio.gather(
+            *(
+                self.async_translate(chunk, source, target, priority)
+                for chunk in chunked.chunks
+            )
+        )
+        combined: dict[str, Any] = {
+            "translatedText": chunked.join(
+                result["translatedText"] for result in results
+            )
+        }
+        if "detectedLanguage" in results[0]:
+            combined["detectedLanguage"] = results[0]["detectedLanguage"]
+        return combined
+
+    async def async_translate_many(
+        self,
+        texts: list[str],
+        source: str,
+        target: str,
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> list[dict[str, Any]]:
+        """Translate several texts, returning one result per text in input order.
+
+        Cached texts are answered locally; the remaining distinct texts are sent
+        to LibreTranslate in batches of the configured batch size.
+        """
+        results: dict[str, dict[str, Any]] = {}
+        missing: list[str] = []
+        for text in dict.fromkeys(texts):
+            cached = await self._async_get_cached((text, source, target))
+            if cached is not None:
+                results[text] = cached
+            else:
+                missing.append(text)
+
+        if missing:
+            with self.breaker.attempt():
+                async with self.scheduler.slot(priority):
+                    translated = await self.client.async_translate_many(
+                        missing, source, target, self._batch_size
+                    )
+            for text, result in zip(missing, translated, strict=True):
+                self._async_set_cached((text, source, target), result)
+                results[text] = result
+
+        return [results[text] for text in texts]
+
+    async def _async_get_cached(self, key: CacheKey) -> dict[str, Any] | None:
+        """Return a cached result from the memory or persistent tier."""
+        if (cached := self.cache.get(key)) is not None:
+            return cached
+        if self.persistent_cache is not None and (
+            stored := await self.persistent_cache.async_get(key)
+        ) is not None:
+            result, age = stored
+            # Keep the original expiry instead of restarting the TTL
+            self.cache.set(key, result, age)
+            return result
+        return None
+
+    @callback
+    def _async_set_cached(self, key: CacheKey, result: dict[str, Any]) -> None:
+        """Store a fresh result in both cache tiers."""
+        self.cache.set(key, result)
+        if self.persistent_cache is not None:
+            self.persistent_cache.async_set(key, result)
+
+    async def async_detect_languages(
+        self, text: str, priority: int = PRIORITY_INTERACTIVE
+    ) -> list[dict[str, Any]]:
         """Detect language candidates for text via the API client."""
-        return await self.client.async_detect_languages(text)
+
+        async def _async_fetch() -> list[dict[str, Any]]:
+            with self.breaker.attempt():
+                async with self.scheduler.slot(priority):
+                    return await self.client.async_detect_languages(text)
+
+        return await self._async_coalesce(("/detect", text), _async_fetch)
+
+    async def _async_coalesce[_T](
+        self, key: tuple[str, ...], request: Callable[[], Coroutine[Any, Any, _T]]
+    ) -> _T:
+        """Share one in-flight request between concurrent identical calls.
+
+        The first caller starts the request as a background task; callers that
+        arrive with the same key while it is pending await the same task. The
+        task is shielded so a cancelled caller does not abort it for the others.
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = self.config_entry.async_create_background_task(
+                self.hass, request(), f"{DOMAIN} {key[0]} request"
+            )
+            if not task.done():
+                self._in_flight[key] = task
+                task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def async_probe(self) -> None:
+        """Check the server is alive between full /languages refreshes.
+
+        A failed probe marks the server offline straight away. A successful
+        probe closes the circuit and, while offline, requests a full refresh
+        which confirms the recovery and brings the status back online.
+        """
+        start = time.monotonic()
+        try:
+            await self.client.async_probe(PROBE_TIMEOUT)
+        except CannotConnectError as err:
+            self.probe_latency = None
+            self.async_set_update_error(err)
+            return
+        self.probe_latency = time.monotonic() - start
+        self.breaker.reset()
+        if not self.last_update_success:
+            await self.async_request_refresh()
+
+    @callback
+    def async_set_update_error(self, err: Exception) -> None:
+        """Mark the server offline, open its circuit and poll again soon."""
+        was_online = self.last_update_success
+        super().async_set_update_error(err)
+        self.breaker.trip()
+        # Only on the first error, so a stream of failing calls can't keep
+        # pushing the next poll further out
+        if was_online:
+            self.update_interval = timedelta(seconds=RETRY_SCAN_INTERVAL)
+            if self._listeners:
+                self._schedule_refresh()
+
+    async def async_close_session(self) -> None:
+        """Close the dedicated client session, if this entry has one."""
+        if self._dedicated_session is not None:
+            await self._dedicated_session.close()
+
+    async def async_shutdown(self) -> None:
+        """Stop polling and write pending persistent cache changes."""
+        await super().async_shutdown()
+        if self.persistent_cache is not None:
+            await self.persistent_cache.async_flush()
+
+
+def _create_dedicated_session(options: Mapping[str, Any]) -> aiohttp.ClientSession:
+    """Create a client session with a connection pool for a single server."""
+    connector = aiohttp.TCPConnector(
+        limit=options.get(CONF_POOL_SIZE, DEFAULT_POOL_SIZE),
+        keepalive_timeout=options.get(
+            CONF_KEEPALIVE_TIMEOUT, DEFAULT_KEEPALIVE_TIMEOUT
+        ),
+        ttl_dns_cache=options.get(CONF_DNS_CACHE_TTL, DEFAULT_DNS_CACHE_TTL),
+        ssl=get_default_context(),
+    )
+    return aiohttp.ClientSession(connector=connector, json_serialize=json_dumps)
+
+
+def _language_fingerprint(languages: list[dict[str, Any]]) -> str:
+    """Return a stable hash of the installed languages and their targets."""
+    installed = sorted(
+        [lang["code"], sorted(lang.get("targets", []))] for lang in languages
+    )
+    return hashlib.sha256(json.dumps(installed).encode()).hexdigest()
@@ -0,0 +1,54 @@
+"""Diagnostics support for Argos Translate."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_API_KEY
+from homeassistant.core import HomeAssistant
+
+from . import ArgosTranslateConfigEntry
+
+TO_REDACT = {CONF_API_KEY}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ArgosTranslateConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data.coordinator
+    client = coordinator.client
+    scheduler = coordinator.scheduler
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "server": {
+            "online": coordinator.last_update_success,
+            "update_interval": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None,
+            "language_count": (coordinator.data or {}).get("language_count"),
+            "probe_latency": coordinator.probe_latency,
+            "circuit": coordinator.breaker.state,
+        },
+        "requests": {
+            "retries": client.retry_count,
+            "retries_exhausted": client.retry_exhausted_count,
+            "in_flight": scheduler.in_flight,
+            "queue_depth": scheduler.queue_depth,
+            "average_wait": scheduler.average_wait,
+        },
+        "endpoints": {
+            endpoint: asdict(metrics.snapshot())
+            for endpoint, metrics in client.metrics.endpoints.items()
+        },
+        "cache": {
+            "size": len(coordinator.cache),
+            "hits": coordinator.cache.hits,
+            "misses": coordinator.cache.misses,
+        },
+    }
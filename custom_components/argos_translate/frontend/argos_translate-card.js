@@ -11,8 +11,58 @@ const LitElement = customElements.get("hui-masonry-view")
 const html = LitElement.prototype.html;
 const css = LitElement.prototype.css;
 
-const CARD_VERSION = "0.5.2";
-const DETECTION_CONFIDENCE_THRESHOLD = 50.0;
+const CARD_VERSION = "0.8.0";
+
+// Live mode: wait this long after the last keystroke before translating,
+// and remember recent results so editing back to an earlier text is instant.
+const LIVE_DEBOUNCE_MS = 500;
+const LIVE_MEMO_TTL_MS = 5 * 60 * 1000;
+const LIVE_MEMO_SIZE = 50;
+
+// Language catalogs by language entity, fetched over the websocket API and
+// shared by every card on the page. They are also kept in localStorage, so a
+// catalog is only fetched again when the sensor's catalog_version changes.
+const CATALOG_STORAGE_PREFIX = "argos_translate_catalog:";
+const catalogs = new Map();
+
+function storedCatalog(entityId) {
+  try {
+    return JSON.parse(localStorage.getItem(CATALOG_STORAGE_PREFIX + entityId));
+  } catch (err) {
+    return null;
+  }
+}
+
+function fetchCatalog(hass, entityId, version) {
+  const cached = catalogs.get(entityId);
+  if (cached && cached.version === version) {
+    return cached.promise;
+  }
+  let promise;
+  const stored = storedCatalog(entityId);
+  if (stored && stored.version === version) {
+    promise = Promise.resolve(stored);
+  } else {
+    promise = hass
+      .callWS({ type: "argos_translate/languages", entity_id: entityId })
+      .then((catalog) => {
+        try {
+          localStorage.setItem(CATALOG_STORAGE_PREFIX + entityId, JSON.stringify(catalog));
+        } catch (err) {
+          // Storage full or disabled: the in-memory copy still serves this page
+        }
+        return catalog;
+      });
+    promise.catch(() => {
+      // Let the next card to ask try again
+      if (catalogs.get(entityId) && catalogs.get(entityId).promise === promise) {
+        catalogs.delete(entityId);
+      }
+    });
+  }
+  catalogs.set(entityId, { version, promise });
+  return promise;
+}
 
 console.info(
   `%c ARGOS-TRANSLATE-CARD %c v${CARD_VERSION} `,
@@ -33,6 +83,7 @@ class ArgosTranslateCard extends LitElement {
       _error: { type: String },
       _detectedLanguage: { type: Object },
       _detectionCandidates: { type: Array },
+      _catalog: { type: Object },
     };
   }
 
@@ -46,6 +97,21 @@ class ArgosTranslateCard extends LitElement {
     this._error = null;
     this._detectedLanguage = null;
     this._detectionCandidates = [];
+    this._catalog = null;
+    this._catalogKey = null;
+    // Live mode state
+    this._requestId = 0;
+    this._lastKey = null;
+    this._livePending = false;
+    this._liveTimer = null;
+    this._cancelStream = null;
+    this._memo = new Map();
+  }
+
+  disconnectedCallback() {
+    super.disconnectedCallback();
+    clearTimeout(this._liveTimer);
+    if (this._cancelStream) this._cancelStream();
   }
 
   static getConfigElement() {
@@ -97,32 +163,75 @@ class ArgosTranslateCard extends LitElement {
     };
   }
 
-  _getLanguages() {
+  _loadCatalog() {
     const langEntity = this.config.language_entity;
     const langState = this.hass && this.hass.states && this.hass.states[langEntity];
-    if (!langState || !langState.attributes) {
-      return { names: [], codes: [], targets: {} };
+    const version = langState && langState.attributes.catalog_version;
+    const key = `${langEntity}:${version}`;
+    if (!version || key === this._catalogKey) {
+      return;
     }
-    return {
-      names: langState.attributes.languages || [],
-      codes: langState.attributes.language_codes || [],
-      targets: langState.attributes.language_targets || {},
+    if (this._catalog && this._catalogKey && !this._catalogKey.startsWith(`${langEntity}:`)) {
+      // Another sensor was picked in the editor: its languages are not ours
+      this._catalog = null;
+    }
+    this._catalogKey = key;
+    fetchCatalog(this.hass, langEntity, version).then(
+      (catalog) => {
+        if (this._catalogKey === key) this._catalog = catalog;
+      },
+      (err) => {
+        if (this._catalogKey === key) this._catalogKey = null;
+        console.warn("argos-translate-card: could not load languages", err);
+      }
+    );
+  }
+
+  _getLanguages() {
+    const catalog = this._catalog;
+    // The catalog object is replaced only when a new version is fetched, so
+    // the lookup tables are rebuilt once per language refresh, not per render.
+    if (this._languageCache && this._languageCache.catalog === catalog) {
+      return this._languageCache.languages;
+    }
+    const list = (catalog && catalog.languages) || [];
+    const languages = {
+      names: list.map((lang) => lang.name),
+      codes: list.map((lang) => lang.code),
+      nameByCode: new Map(list.map((lang) => [lang.code, lang.name])),
+      targetsByCode: new Map(list.map((lang) => [lang.code, lang.targets || []])),
     };
+    this._languageCache = { catalog, languages };
+    return languages;
   }
 
   _getTargetsForSource(sourceCode) {
     if (sourceCode === "auto" || (typeof sourceCode === "string" && sourceCode.startsWith("auto:"))) {
-      const { codes } = this._getLanguages();
-      return codes;
+      return this._getLanguages().codes;
     }
-    const { targets } = this._getLanguages();
-    return targets[sourceCode] || [];
+    return this._getLanguages().targetsByCode.get(sourceCode) || [];
   }
 
   _getLanguageName(code) {
-    const { names, codes } = this._getLanguages();
-    const idx = codes.indexOf(code);
-    return idx >= 0 ? names[idx] : code;
+    return this._getLanguages().nameByCode.get(code) || code;
+  }
+
+  shouldUpdate(changedProperties) {
+    // hass changes on every state change in HA; only the two entities this
+    // card shows (and the UI language) matter.
+    if (changedProperties.size !== 1 || !changedProperties.has("hass")) {
+      return true;
+    }
+    const oldHass = changedProperties.get("hass");
+    if (!oldHass || !this.config) {
+      return true;
+    }
+    return (
+      oldHass.states[this.config.entity] !== this.hass.states[this.config.entity] ||
+      oldHass.states[this.config.language_entity] !==
+        this.hass.states[this.config.language_entity] ||
+      oldHass.language !== this.hass.language
+    );
   }
 
   _getStatus() {
@@ -139,6 +248,13 @@ class ArgosTranslateCard extends LitElement {
   updated(changedProperties) {
     super.updated(changedProperties);
     if (changedProperties.has("hass") || changedProperties.has("config")) {
+      this._loadCatalog();
+    }
+    if (
+      changedProperties.has("hass") ||
+      changedProperties.has("config") ||
+      changedProperties.has("_catalog")
+    ) {
       const { codes } = this._getLanguages();
       if (codes.length > 0 && !this._source) {
         this._source =
@@ -183,17 +299,22 @@ class ArgosTranslateCard extends LitElement {
       if (!validTargets.includes(this._target)) {
         this._target = validTargets[0] || "";
       }
+      this._scheduleLive();
     }
     this.requestUpdate();
   }
 
   _targetChanged(ev) {
     this._target = ev.target.value;
+    this._scheduleLive();
     this.requestUpdate();
   }
 
   _inputChanged(ev) {
-    this._inputText = ev.target.value;
+    const text = ev.target.value;
+    if (text === this._inputText) return;
+    this._inputText = text;
+    this._scheduleLive();
   }
 
   _swapLanguages() {
@@ -221,77 +342,166 @@ class ArgosTranslateCard extends LitElement {
     }
 
     this._error = null;
+    this._scheduleLive();
     this.requestUpdate();
   }
 
+  _liveKey(text, source, target) {
+    return JSON.stringify([text, source, target]);
+  }
+
+  _scheduleLive() {
+    if (!this.config || !this.config.live) return;
+    // Whatever is in flight now answers a question nobody is asking
+    this._requestId += 1;
+    if (this._cancelStream) this._cancelStream();
+    clearTimeout(this._liveTimer);
+    this._liveTimer = setTimeout(() => this._liveTranslate(), LIVE_DEBOUNCE_MS);
+  }
+
+  _liveTranslate() {
+    if (!this._inputText.trim() || !this._source || !this._target) return;
+    if (!this._getStatus().online) return;
+    if (this._loading) {
+      // At most one translation in flight: run again once it is done
+      this._livePending = true;
+      return;
+    }
+    const key = this._liveKey(this._inputText, this._source, this._target);
+    const memo = this._memo.get(key);
+    if (memo && memo.expires > Date.now()) {
+      this._lastKey = key;
+      this._applyView(memo.view);
+      return;
+    }
+    if (key === this._lastKey) return; // Already showing this text's result
+    this._translate();
+  }
+
+  _remember(key, view) {
+    this._memo.delete(key);
+    this._memo.set(key, { view, expires: Date.now() + LIVE_MEMO_TTL_MS });
+    while (this._memo.size > LIVE_MEMO_SIZE) {
+      this._memo.delete(this._memo.keys().next().value);
+    }
+  }
+
+  _currentView() {
+    return {
+      outputText: this._outputText,
+      detectedLanguage: this._detectedLanguage,
+      detectionCandidates: this._detectionCandidates,
+      error: this._error,
+    };
+  }
+
+  _applyView(view) {
+    this._outputText = view.outputText;
+    this._detectedLanguage = view.detectedLanguage;
+    this._detectionCandidates = view.detectionCandidates;
+    this._error = view.error;
+  }
+
+  _viewFromResponse(resp, source) {
+    const view = {
+      outputText: resp.translated_text,
+      detectedLanguage: null,
+      detectionCandidates: [],
+      error: null,
+    };
+
+    // Handle auto-detect feedback
+    if (source === "auto" && resp.detected_language) {
+      view.detectedLanguage = {
+        language: resp.detected_language,
+        confidence: resp.detection_confidence,
+      };
+
+      // Handle uninstalled detected language warning (DTCT-06 — display side)
+      if (resp.uninstalled_detected_language) {
+        view.error = this._uninstalledWarning(resp.uninstalled_detected_language);
+      } else if (resp.error) {
+        view.error = resp.error;
+      }
+
+      // Candidates above the confidence threshold come back with the
+      // translation; empty when the server-side /detect call failed.
+      view.detectionCandidates = resp.detections || [];
+    }
+    return view;
+  }
+
+  _uninstalledWarning(code) {
+    const langName = this._getLanguageName(code) || code;
+    return `Detected language "${langName}" (${code}) is not installed on the LibreTranslate server. Translation may be incomplete.`;
+  }
+
+  _isChunked(text) {
+    // Texts longer than the server's chunk size are translated in chunks, so
+    // streaming them lets the output fill in as each chunk is done. Shorter
+    // ones would arrive in one piece anyway and go through the service, which
+    // also returns the detection candidates.
+    const langState = this.hass.states[this.config.language_entity];
+    const chunkSize = (langState && langState.attributes.chunk_size) || 0;
+    return chunkSize > 0 && text.length > chunkSize;
+  }
+
   async _translate() {
     // Determine actual source to send — "auto" or a specific code
     const sourceToSend = this._source;
+    const text = this._inputText;
+    const target = this._target;
+
+    if (!text || !sourceToSend || !target) return;
 
-    if (!this._inputText || !sourceToSend || !this._target) return;
+    // A response is applied only if no newer input arrived meanwhile
+    const request = ++this._requestId;
+    const isCurrent = () => request === this._requestId;
+    // _lastKey names the text whose result is on screen; it is only set
+    // once a result is actually shown
+    const key = this._liveKey(text, sourceToSend, target);
 
     this._loading = true;
     this._error = null;
 
     try {
+      if (this._isChunked(text)) {
+        this._outputText = "";
+        this._detectedLanguage = null;
+        this._detectionCandidates = [];
+        this._lastKey = null; // Partial output until the stream completes
+        if (await this._streamTranslation(text, sourceToSend, target, isCurrent)) {
+          this._remember(key, this._currentView());
+          this._lastKey = key;
+        }
+        return;
+      }
+
       const result = await this.hass.callService(
         "argos_translate",
         "translate",
         {
-          text: this._inputText,
+          text,
           source: sourceToSend,
-          target: this._target,
+          target,
+          // Ask for the /detect candidates in the same response so the card
+          // needs a single round trip for auto-detect.
+          ...(sourceToSend === "auto" ? { include_candidates: true } : {}),
         },
         {},
         true,
         true
       );
 
-      const resp = result.response;
-      this._outputText = resp.translated_text;
-
-      // Handle auto-detect feedback
-      if (sourceToSend === "auto" && resp.detected_language) {
-        this._detectedLanguage = {
-          language: resp.detected_language,
-          confidence: resp.detection_confidence,
-        };
-
-        // Handle uninstalled detected language warning (DTCT-06 — display side)
-        if (resp.uninstalled_detected_language) {
-          const langName = this._getLanguageName(resp.uninstalled_detected_language) || resp.uninstalled_detected_language;
-          this._error = `Detected language "${langName}" (${resp.uninstalled_detected_language}) is not installed on the LibreTranslate server. Translation may be incomplete.`;
-        } else if (resp.error) {
-          this._error = resp.error;
-        }
-
-        // Fetch detection candidates via the detect HA service (registered in Plan 05-01).
-        // This calls LibreTranslate's /detect endpoint and returns multiple candidates
-        // with confidence scores, enabling the user to pick an alternative detection.
-        try {
-          const detectResult = await this.hass.callService(
-            "argos_translate",
-            "detect",
-            { text: this._inputText },
-            {},
-            true,
-            true
-          );
-          const detections = detectResult.response.detections || [];
-          // Filter to candidates above the confidence threshold
-          this._detectionCandidates = detections.filter(
-            (d) => d.confidence >= DETECTION_CONFIDENCE_THRESHOLD
-          );
-        } catch (_detectErr) {
-          // Detection candidates are best-effort — if /detect fails,
-          // we still have the primary detected language from /translate.
-          this._detectionCandidates = [];
-        }
-      } else {
-        this._detectedLanguage = null;
-        this._detectionCandidates = [];
+      const view = this._viewFromResponse(result.response, sourceToSend);
+      this._remember(key, view);
+      if (isCurrent()) {
+        this._applyView(view);
+        this._lastKey = key;
       }
     } catch (err) {
+      if (!isCurrent()) return;
+      this._lastKey = null; // The error replaced the result on screen
       // Error discrimination from Plan 02 is already in place
       const code = err?.code;
       const msg = err?.message || "";
@@ -313,9 +523,90 @@ class ArgosTranslateCard extends LitElement {
       }
     } finally {
       this._loading = false;
+      if (this._livePending) {
+        this._livePending = false;
+        this._liveTranslate();
+      }
     }
   }
 
+  _streamTranslation(text, source, target, isCurrent) {
+    // Resolves true once the last piece has arrived, or false if newer input
+    // cancelled the stream. Rejects with the command's error (e.g. an
+    // uninstalled pair) or with the error that ended the stream, in the same
+    // shape as a failed service call. A dropped connection rejects too: the
+    // subscription is not sent again on reconnect, which would restart the
+    // translation and append every piece a second time.
+    return new Promise((resolve, reject) => {
+      const connection = this.hass.connection;
+      let finished = false;
+      const onDisconnect = () => {
+        if (finished) return;
+        finish();
+        reject({ message: "Connection to Home Assistant lost." });
+      };
+      const finish = () => {
+        finished = true;
+        this._cancelStream = null;
+        connection.removeEventListener("disconnected", onDisconnect);
+        unsubscribe.then((unsub) => unsub()).catch(() => {});
+      };
+      connection.addEventListener("disconnected", onDisconnect);
+      const unsubscribe = connection.subscribeMessage(
+        (event) => {
+          if (finished) return;
+          if (event.translated_text !== undefined) {
+            this._outputText += event.translated_text;
+            if (event.detected_language) {
+              this._detectedLanguage = {
+                language: event.detected_language,
+                confidence: event.detection_confidence,
+              };
+            }
+            if (event.uninstalled_detected_language) {
+              this._error = this._uninstalledWarning(event.uninstalled_detected_language);
+            }
+            return;
+          }
+          finish();
+          if (event.error && event.detected_language) {
+            // The detected language has no pair to the target: shown like the
+            // translate service's partial response, not as a failure
+            this._applyView(
+              this._viewFromResponse(
+                { ...event, translated_text: "", error: event.error.message },
+                source
+              )
+            );
+            resolve(isCurrent());
+          } else if (event.error) {
+            reject({ code: "home_assistant_error", message: event.error.message });
+          } else {
+            resolve(isCurrent());
+          }
+        },
+        {
+          type: "argos_translate/translate_stream",
+          text,
+          source,
+          target,
+        },
+        { resubscribe: false }
+      );
+      unsubscribe.catch((err) => {
+        if (finished) return;
+        finish();
+        reject(err);
+      });
+      // Newer input stops the server translating the rest
+      this._cancelStream = () => {
+        if (finished) return;
+        finish();
+        resolve(false);
+      };
+    });
+  }
+
   _getDisabledReason() {
     if (this._loading) return null; // button shows "Translating..." spinner instead
     const status = this._getStatus();
@@ -425,8 +716,7 @@ class ArgosTranslateCard extends LitElement {
               @change="${this._targetChanged}"
             >
               ${validTargets.map((targetCode) => {
-                const idx = codes.indexOf(targetCode);
-                const targetName = idx >= 0 ? names[idx] : targetCode;
+                const targetName = this._getLanguageName(targetCode);
                 return html`
                   <option value="${targetCode}" ?selected="${targetCode === this._target}">
                     ${targetName} (${targetCode})
@@ -719,6 +1009,12 @@ class ArgosTranslateCardEditor extends LitElement {
           <mwc-list-item value="horizontal">Horizontal</mwc-list-item>
           <mwc-list-item value="vertical">Vertical</mwc-list-item>
         </ha-select>
+        <ha-formfield label="Live translation (translate while typing)">
+          <ha-switch
+            .checked="${this.config.live === true}"
+            @change="${this._liveChanged}"
+          ></ha-switch>
+        </ha-formfield>
       </div>
     `;
   }
@@ -747,6 +1043,10 @@ class ArgosTranslateCardEditor extends LitElement {
     this._updateConfig("layout", ev.target.value);
   }
 
+  _liveChanged(ev) {
+    this._updateConfig("live", ev.target.checked);
+  }
+
   _updateConfig(key, value) {
     if (!this.config) return;
     const newConfig = { ...this.config, [key]: value };
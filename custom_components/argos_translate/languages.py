@@ -0,0 +1,104 @@
+"""Installed-language lookup tables for Argos Translate."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class LanguageIndex:
+    """Immutable lookup tables built once per /languages refresh.
+
+    Gives O(1) answers to the questions the service handlers ask on every
+    call: is a code installed, can it be translated to a target, what is its
+    display name, and which chain of installed pairs links two languages
+    that have no direct pair.
+    """
+
+    languages: Mapping[str, Mapping[str, Any]]
+    targets: Mapping[str, frozenset[str]]
+    names: Mapping[str, str]
+    pivots: Mapping[tuple[str, str], tuple[str, ...]]
+
+    @classmethod
+    def from_languages(cls, languages: list[dict[str, Any]]) -> LanguageIndex:
+        """Build the index from a LibreTranslate /languages payload."""
+        targets = {
+            lang["code"]: frozenset(lang.get("targets", [])) for lang in languages
+        }
+        return cls(
+            languages=MappingProxyType({lang["code"]: lang for lang in languages}),
+            targets=MappingProxyType(targets),
+            names=MappingProxyType(
+                {lang["code"]: lang.get("name", lang["code"]) for lang in languages}
+            ),
+            pivots=MappingProxyType(_shortest_pivots(targets)),
+        )
+
+    @classmethod
+    def merge(cls, indexes: Iterable[LanguageIndex]) -> LanguageIndex:
+        """Combine the indexes of several servers into one.
+
+        A language is installed if any server has it, and its targets are
+        the union of every server's targets for it.
+        """
+        languages: dict[str, dict[str, Any]] = {}
+        for index in indexes:
+            for code, lang in index.languages.items():
+                merged = languages.setdefault(code, {**lang, "targets": []})
+                merged["targets"] = sorted(
+                    {*merged["targets"], *index.targets.get(code, ())}
+                )
+        return cls.from_languages(list(languages.values()))
+
+    def name(self, code: str) -> str:
+        """Return the display name of a language code, or the code itself."""
+        return self.names.get(code, code)
+
+    def path(self, source: str, target: str) -> tuple[str, ...] | None:
+        """Return the shortest chain of languages from source to target.
+
+        A direct pair gives (source, target); otherwise the chain runs
+        through one or more intermediate languages. None if unreachable.
+        """
+        if target in self.targets.get(source, ()):
+            return (source, target)
+        return self.pivots.get((source, target))
+
+
+def _shortest_pivots(
+    targets: Mapping[str, frozenset[str]],
+) -> dict[tuple[str, str], tuple[str, ...]]:
+    """Return the shortest multi-hop chain for every pair with no direct model.
+
+    Breadth-first search from each source over the installed pairs.
+    Neighbours are visited in code order so the chosen chain is stable
+    across refreshes.
+    """
+    pivots: dict[tuple[str, str], tuple[str, ...]] = {}
+    for source in targets:
+        previous: dict[str, str] = {source: source}
+        queue = deque([source])
+        while queue:
+            code = queue.popleft()
+            for target in sorted(targets.get(code, ())):
+                if target in previous:
+                    continue
+                previous[target] = code
+                queue.append(target)
+
+        for target in previous:
+            if target == source or target in targets[source]:
+                continue
+            chain = [target]
+            while chain[-1] != source:
+                chain.append(previous[chain[-1]])
+            pivots[(source, target)] = tuple(reversed(chain))
+    return pivots
+
+
+EMPTY_INDEX = LanguageIndex.from_languages([])
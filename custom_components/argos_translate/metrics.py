@@ -0,0 +1,182 @@
+"""Latency and throughput of the requests sent to one LibreTranslate server."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+import time
+
+from .const import METRICS_WINDOW
+
+# Latency buckets grow by this factor from _BUCKET_MIN to _BUCKET_MAX, so a
+# percentile read back from a bucket is at most 9% above the true value
+_BUCKET_GROWTH = 2 ** (1 / 8)
+_BUCKET_MIN = 0.001
+_BUCKET_MAX = 120.0
+_BUCKET_COUNT = math.ceil(math.log(_BUCKET_MAX / _BUCKET_MIN, _BUCKET_GROWTH)) + 1
+
+
+class LatencyHistogram:
+    """Streaming histogram of latencies, in seconds, with log-spaced buckets.
+
+    Uses the same fixed memory however many samples it holds. Bucket i
+    counts samples up to _BUCKET_MIN * _BUCKET_GROWTH**i; the last one also
+    takes anything slower than _BUCKET_MAX.
+    """
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = [0] * _BUCKET_COUNT
+        self.total = 0
+
+    def record(self, seconds: float) -> None:
+        """Add one sample."""
+        if seconds <= _BUCKET_MIN:
+            index = 0
+        else:
+            index = min(
+                math.ceil(math.log(seconds / _BUCKET_MIN, _BUCKET_GROWTH)),
+                _BUCKET_COUNT - 1,
+            )
+        self.counts[index] += 1
+        self.total += 1
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add the samples of another histogram to this one."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+        self.total += other.total
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the latency below which fraction of the samples fall.
+
+        The result is the upper bound of the bucket holding that sample, or
+        None when the histogram is empty.
+        """
+        if not self.total:
+            return None
+        rank = max(1, math.ceil(fraction * self.total))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return _BUCKET_MIN * _BUCKET_GROWTH**index
+        raise AssertionError("rank beyond histogram total")
+
+
+@dataclass(slots=True)
+class _Minute:
+    """Samples recorded during one wall-clock minute."""
+
+    minute: int
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    requests: int = 0
+    errors: int = 0
+    chars: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsSnapshot:
+    """Request statistics over the recent window.
+
+    Latencies are in seconds and cover successful requests only; they and
+    error_rate (a percentage) are None when there were no requests.
+    """
+
+    p50: float | None
+    p95: float | None
+    p99: float | None
+    requests_per_minute: float
+    error_rate: float | None
+    chars_per_minute: float
+
+
+class EndpointMetrics:
+    """Requests to one endpoint over the last window minutes.
+
+    Samples go into one slot per minute, reused round-robin, so memory stays
+    fixed and old minutes drop out of the statistics as time passes.
+    """
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        """Initialize the metrics."""
+        self._window = window
+        self._slots: list[_Minute | None] = [None] * window
+        self._started = time.monotonic()
+
+    def record(self, seconds: float, chars: int = 0, error: bool = False) -> None:
+        """Record one finished request and how long it took."""
+        minute = int(time.monotonic() // 60)
+        index = minute % self._window
+        slot = self._slots[index]
+        if slot is None or slot.minute != minute:
+            slot = self._slots[index] = _Minute(minute)
+        slot.requests += 1
+        if error:
+            slot.errors += 1
+        else:
+            slot.latency.record(seconds)
+            slot.chars += chars
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Return the statistics of the current window."""
+        now = time.monotonic()
+        oldest = int(now // 60) - self._window
+        latency = LatencyHistogram()
+        requests = errors = chars = 0
+        for slot in self._slots:
+            if slot is None or slot.minute <= oldest:
+                continue
+            latency.merge(slot.latency)
+            requests += slot.requests
+            errors += slot.errors
+            chars += slot.chars
+
+        # The window is the current, partial minute plus the full ones before
+        # it, or less just after startup; rates never count under a minute
+        span = min(now - self._started, (self._window - 1) * 60 + now % 60)
+        minutes = max(span, 60) / 60
+        return MetricsSnapshot(
+            p50=latency.percentile(0.5),
+            p95=latency.percentile(0.95),
+            p99=latency.percentile(0.99),
+            requests_per_minute=requests / minutes,
+            error_rate=100 * errors / requests if requests else None,
+            chars_per_minute=chars / minutes,
+        )
+
+
+class RequestMetrics:
+    """Per-endpoint request metrics of one API client."""
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        """Initialize the metrics."""
+        self._window = window
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def record(
+        self, endpoint: str, seconds: float, chars: int = 0, error: bool = False
+    ) -> None:
+        """Record one finished request to endpoint."""
+        metrics = self.endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics(self._window)
+        metrics.record(seconds, chars, error)
+
+    def snapshot(self, endpoint: str) -> MetricsSnapshot:
+        """Return the statistics of one endpoint, empty if never called."""
+        metrics = self.endpoints.get(endpoint)
+        if metrics is None:
+            return EMPTY_SNAPSHOT
+        return metrics.snapshot()
+
+
+EMPTY_SNAPSHOT = MetricsSnapshot(
+    p50=None,
+    p95=None,
+    p99=None,
+    requests_per_minute=0.0,
+    error_rate=None,
+    chars_per_minute=0.0,
+)
@@ -0,0 +1,206 @@
+"""Spread service calls across several LibreTranslate servers."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+import logging
+from types import MappingProxyType
+
+from .api import CannotConnectError
+from .const import STRATEGY_LEAST_OUTSTANDING
+from .coordinator import ArgosCoordinator
+from .languages import EMPTY_INDEX, LanguageIndex
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def language_index(coordinator: ArgosCoordinator) -> LanguageIndex:
+    """Return a server's language index (empty before the first refresh)."""
+    if not coordinator.data:
+        return EMPTY_INDEX
+    return coordinator.data.get("index", EMPTY_INDEX)
+
+
+@dataclass(frozen=True, slots=True)
+class RoutingTable:
+    """Languages installed across a set of servers, and who serves each pair.
+
+    index is the merged LanguageIndex used to validate calls and name
+    languages; servers maps each (source, target) pair to the config entries
+    whose server has it installed, and targets each target language to the
+    config entries that can translate into it from some source.
+    """
+
+    index: LanguageIndex
+    servers: Mapping[tuple[str, str], frozenset[str]]
+    targets: Mapping[str, frozenset[str]]
+
+    @classmethod
+    def from_coordinators(
+        cls, coordinators: list[ArgosCoordinator]
+    ) -> RoutingTable:
+        """Build the table from each server's current language index."""
+        servers: dict[tuple[str, str], set[str]] = {}
+        by_target: dict[str, set[str]] = {}
+        indexes = []
+        for coordinator in coordinators:
+            index = language_index(coordinator)
+            indexes.append(index)
+            entry_id = coordinator.config_entry.entry_id
+            for source, targets in index.targets.items():
+                for target in targets:
+                    servers.setdefault((source, target), set()).add(entry_id)
+                    by_target.setdefault(target, set()).add(entry_id)
+        return cls(
+            index=LanguageIndex.merge(indexes),
+            servers=MappingProxyType(
+                {pair: frozenset(ids) for pair, ids in servers.items()}
+            ),
+            targets=MappingProxyType(
+                {target: frozenset(ids) for target, ids in by_target.items()}
+            ),
+        )
+
+    def supporting(
+        self, coordinators: list[ArgosCoordinator], source: str, target: str
+    ) -> list[ArgosCoordinator]:
+        """Return the servers that have the source -> target pair installed."""
+        entry_ids = self.servers.get((source, target), frozenset())
+        return [c for c in coordinators if c.config_entry.entry_id in entry_ids]
+
+    def targeting(
+        self, coordinators: list[ArgosCoordinator], target: str
+    ) -> list[ArgosCoordinator]:
+        """Return the servers that can translate into target from some source."""
+        entry_ids = self.targets.get(target, frozenset())
+        return [c for c in coordinators if c.config_entry.entry_id in entry_ids]
+
+
+def _load(coordinator: ArgosCoordinator) -> float:
+    """Return a server's in-flight plus queued calls, scaled by its weight."""
+    scheduler = coordinator.scheduler
+    return (scheduler.in_flight + scheduler.queue_depth) / coordinator.weight
+
+
+class ServerRouter:
+    """Choose which loaded config entry serves each service call.
+
+    Only servers whose status binary_sensor is on are used; if none are,
+    every server is tried so a recovered one is found without waiting for the
+    next poll. Weighted round-robin uses the smooth algorithm (as in nginx),
+    which interleaves picks instead of sending a weight-3 server three calls
+    in a row. Least-outstanding picks the server with the fewest in-flight
+    and queued calls per unit of weight, breaking ties by the same rotation.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the router."""
+        self._current_weight: dict[str, int] = {}
+        self._tables: dict[
+            tuple[str, ...], tuple[tuple[LanguageIndex, ...], RoutingTable]
+        ] = {}
+
+    def routing_table(self, coordinators: list[ArgosCoordinator]) -> RoutingTable:
+        """Return the routing table for a set of servers.
+
+        Rebuilt only when a server joins or leaves the set or one of them
+        refreshes to a new language index; otherwise the last table is reused.
+        """
+        entry_ids = tuple(c.config_entry.entry_id for c in coordinators)
+        indexes = tuple(language_index(c) for c in coordinators)
+        cached = self._tables.get(entry_ids)
+        if cached is not None and all(
+            old is new for old, new in zip(cached[0], indexes, strict=True)
+        ):
+            return cached[1]
+
+        table = RoutingTable.from_coordinators(coordinators)
+        self._tables[entry_ids] = (indexes, table)
+        return table
+
+    def order(
+        self,
+        coordinators: list[ArgosCoordinator],
+        strategy: str,
+        answers: Callable[[ArgosCoordinator], bool] | None = None,
+    ) -> list[ArgosCoordinator]:
+        """Return the servers to try for one call, preferred server first.
+
+        The rest follow least loaded first as failover targets. A server for
+        which answers returns True (one that has the result cached or in
+        flight) is preferred over the strategy, so identical calls land on
+        the same server instead of missing the cache of each in turn.
+        """
+        pool = [c for c in coordinators if c.last_update_success] or coordinators
+        if answers is not None and len(pool) > 1:
+            if holders := [c for c in pool if answers(c)]:
+                chosen = min(holders, key=_load)
+                failover = sorted((c for c in pool if c is not chosen), key=_load)
+                return [chosen, *failover]
+        if len(pool) == 1:
+            return pool
+
+        candidates = pool
+        if strategy == STRATEGY_LEAST_OUTSTANDING:
+            lowest = min(_load(c) for c in pool)
+            candidates = [c for c in pool if _load(c) == lowest]
+
+        chosen = self._next_round_robin(candidates)
+        failover = sorted((c for c in pool if c is not chosen), key=_load)
+        return [chosen, *failover]
+
+    def _next_round_robin(
+        self, candidates: list[ArgosCoordinator]
+    ) -> ArgosCoordinator:
+        """Return the next server in smooth weighted round-robin order."""
+        total = 0
+        chosen: ArgosCoordinator | None = None
+        for coordinator in candidates:
+            entry_id = coordinator.config_entry.entry_id
+            current = self._current_weight.get(entry_id, 0) + coordinator.weight
+            self._current_weight[entry_id] = current
+            total += coordinator.weight
+            if (
+                chosen is None
+                or current > self._current_weight[chosen.config_entry.entry_id]
+            ):
+                chosen = coordinator
+        assert chosen is not None
+        self._current_weight[chosen.config_entry.entry_id] -= total
+        return chosen
+
+
+async def async_call_with_failover[_T](
+    coordinators: list[ArgosCoordinator],
+    request: Callable[[ArgosCoordinator], Awaitable[_T]],
+    *,
+    report_unreachable: bool = True,
+) -> _T:
+    """Run request on each server in turn until one is reachable.
+
+    A server that raises CannotConnectError is flipped to its error state
+    right away, so its status binary_sensor goes offline and later calls skip
+    it until the next successful refresh; best-effort calls pass
+    report_unreachable=False to leave the status alone. The last server's
+    error is raised when none are reachable; HTTP 4xx errors are raised
+    without failing over.
+    """
+    *failover, last = coordinators
+    for coordinator in failover:
+        try:
+            return await request(coordinator)
+        except CannotConnectError as err:
+            if report_unreachable:
+                coordinator.async_set_update_error(err)
+            _LOGGER.debug(
+                "%s is unreachable, failing over: %s",
+                coordinator.config_entry.title,
+                err,
+            )
+    try:
+        return await request(last)
+    except CannotConnectError as err:
+        if report_unreachable:
+            last.async_set_update_error(err)
+        raise
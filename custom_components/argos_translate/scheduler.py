@@ -0,0 +1,80 @@
+"""Concurrency limiter with a priority queue for LibreTranslate calls."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import heapq
+import itertools
+import time
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+# Weight of the newest sample in the moving average of queue wait times
+_WAIT_SMOOTHING = 0.2
+
+
+class RequestScheduler:
+    """Cap in-flight /translate and /detect calls for one server.
+
+    Callers beyond the cap wait in a queue ordered by priority (lower value
+    first), then arrival order. A finishing call hands its slot directly to
+    the next waiter so a newcomer can never jump the queue.
+    """
+
+    def __init__(self, max_concurrent: int) -> None:
+        """Initialize the scheduler."""
+        self.max_concurrent = max_concurrent
+        self.in_flight = 0
+        self.last_wait = 0.0
+        self.average_wait = 0.0
+        self._queue: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of calls waiting for a slot."""
+        return len(self._queue)
+
+    @asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_INTERACTIVE) -> AsyncIterator[None]:
+        """Hold one of the server's request slots for the duration of a call."""
+        start = time.monotonic()
+        if self.in_flight < self.max_concurrent and not self._queue:
+            self.in_flight += 1
+        else:
+            waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            item = (priority, next(self._sequence), waiter)
+            heapq.heappush(self._queue, item)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # The slot was handed over just as we were cancelled
+                    self._release()
+                else:
+                    self._queue.remove(item)
+                    heapq.heapify(self._queue)
+                raise
+
+        self._record_wait(time.monotonic() - start)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _record_wait(self, wait: float) -> None:
+        """Track how long the last call waited for its slot."""
+        self.last_wait = wait
+        self.average_wait += _WAIT_SMOOTHING * (wait - self.average_wait)
+
+    def _release(self) -> None:
+        """Hand the slot to the next waiter, or free it."""
+        while self._queue:
+            _, _, waiter = heapq.heappop(self._queue)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
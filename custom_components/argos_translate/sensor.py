@@ -2,20 +2,93 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import ArgosTranslateConfigEntry
-from .const import DOMAIN
+from .const import CONF_MINIMAL_ATTRIBUTES, DOMAIN
 from .coordinator import ArgosCoordinator
+from .metrics import MetricsSnapshot
 
 PARALLEL_UPDATES = 0
+# Polling interval for sensors that read live scheduler state and metrics
+SCAN_INTERVAL = timedelta(seconds=10)
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    """Convert a latency to whole milliseconds."""
+    return None if seconds is None else round(seconds * 1000)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ArgosMetricSensorDescription(SensorEntityDescription):
+    """Describes a sensor reading the /translate request metrics."""
+
+    value_fn: Callable[[MetricsSnapshot], float | None]
+
+
+METRIC_SENSORS: tuple[ArgosMetricSensorDescription, ...] = (
+    ArgosMetricSensorDescription(
+        key="translate_latency_p50",
+        name="Translation latency p50",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda snapshot: _milliseconds(snapshot.p50),
+    ),
+    ArgosMetricSensorDescription(
+        key="translate_latency_p95",
+        name="Translation latency p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda snapshot: _milliseconds(snapshot.p95),
+    ),
+    ArgosMetricSensorDescription(
+        key="translate_latency_p99",
+        name="Translation latency p99",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda snapshot: _milliseconds(snapshot.p99),
+    ),
+    ArgosMetricSensorDescription(
+        key="translate_requests_per_minute",
+        name="Translation requests per minute",
+        icon="mdi:speedometer",
+        native_unit_of_measurement="requests/min",
+        suggested_display_precision=1,
+        value_fn=lambda snapshot: snapshot.requests_per_minute,
+    ),
+    ArgosMetricSensorDescription(
+        key="translate_error_rate",
+        name="Translation error rate",
+        icon="mdi:alert-circle-outline",
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=1,
+        value_fn=lambda snapshot: snapshot.error_rate,
+    ),
+    ArgosMetricSensorDescription(
+        key="translate_chars_per_minute",
+        name="Characters translated per minute",
+        icon="mdi:text-long",
+        native_unit_of_measurement="chars/min",
+        suggested_display_precision=0,
+        value_fn=lambda snapshot: snapshot.chars_per_minute,
+    ),
+)
 
 
 async def async_setup_entry(
@@ -25,7 +98,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up sensor entities."""
     coordinator = entry.runtime_data.coordinator
-    async_add_entities([ArgosLanguageCountSensor(coordinator, entry)])
+    async_add_entities(
+        [
+            ArgosLanguageCountSensor(coordinator, entry),
+            ArgosQueueSensor(coordinator, entry),
+            *(
+                ArgosMetricSensor(coordinator, entry, description)
+                for description in METRIC_SENSORS
+            ),
+        ]
+    )
 
 
 class ArgosLanguageCountSensor(CoordinatorEntity[ArgosCoordinator], SensorEntity):
@@ -36,6 +118,8 @@ class ArgosLanguageCountSensor(CoordinatorEntity[ArgosCoordinator], SensorEntity
     _attr_name = "Language Count"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = "languages"
+    # Shown in the UI and templates but not copied into recorder history
+    _unrecorded_attributes = frozenset({"language_codes", "chunk_size"})
 
     def __init__(
         self,
@@ -45,6 +129,7 @@ class ArgosLanguageCountSensor(CoordinatorEntity[ArgosCoordinator], SensorEntity
         """Initialize the language count sensor."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_language_count"
+        self._minimal = entry.options.get(CONF_MINIMAL_ATTRIBUTES, False)
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry.entry_id)},
             entry_type=DeviceEntryType.SERVICE,
@@ -61,14 +146,104 @@ class ArgosLanguageCountSensor(CoordinatorEntity[ArgosCoordinator], SensorEntity
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return language list as extra attributes."""
+        """Return a compact summary of the installed languages.
+
+        The full catalog (names and targets of every language) is served by
+        the argos_translate/languages websocket command instead, so it is not
+        written to the recorder or pushed to every frontend on each update.
+        chunk_size tells the card which texts the server translates in
+        chunks, and so are worth streaming.
+        """
         if self.coordinator.data is None:
             return None
         languages = self.coordinator.data.get("languages", [])
+        attributes: dict[str, Any] = {
+            "pair_count": sum(len(lang.get("targets", [])) for lang in languages),
+            "catalog_version": self.coordinator.data.get("version"),
+            "chunk_size": self.coordinator.chunk_size,
+        }
+        if not self._minimal:
+            attributes["language_codes"] = [lang["code"] for lang in languages]
+        return attributes
+
+
+class ArgosQueueSensor(SensorEntity):
+    """Sensor showing how many translation calls are waiting for a server slot.
+
+    Polled rather than pushed, so bursts of requests do not turn into a state
+    write per request.
+    """
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:tray-full"
+    _attr_name = "Queue Depth"
+    _attr_should_poll = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "requests"
+
+    def __init__(
+        self,
+        coordinator: ArgosCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the queue sensor."""
+        self._scheduler = coordinator.scheduler
+        self._attr_unique_id = f"{entry.entry_id}_queue_depth"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            entry_type=DeviceEntryType.SERVICE,
+            name=entry.title,
+            manufacturer="LibreTranslate",
+        )
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of queued calls."""
+        return self._scheduler.queue_depth
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return concurrency and queue wait details."""
         return {
-            "languages": [lang["name"] for lang in languages],
-            "language_codes": [lang["code"] for lang in languages],
-            "language_targets": {
-                lang["code"]: lang.get("targets", []) for lang in languages
-            },
+            "in_flight": self._scheduler.in_flight,
+            "max_concurrent": self._scheduler.max_concurrent,
+            "last_wait_ms": round(self._scheduler.last_wait * 1000),
+            "average_wait_ms": round(self._scheduler.average_wait * 1000),
         }
+
+
+class ArgosMetricSensor(SensorEntity):
+    """Sensor showing latency or throughput of recent /translate requests.
+
+    Computed over the last METRICS_WINDOW minutes and polled, like the queue
+    sensor, rather than pushed after every request.
+    """
+
+    entity_description: ArgosMetricSensorDescription
+
+    _attr_has_entity_name = True
+    _attr_should_poll = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: ArgosCoordinator,
+        entry: ConfigEntry,
+        description: ArgosMetricSensorDescription,
+    ) -> None:
+        """Initialize the metric sensor."""
+        self.entity_description = description
+        self._metrics = coordinator.client.metrics
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            entry_type=DeviceEntryType.SERVICE,
+            name=entry.title,
+            manufacturer="LibreTranslate",
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the metric for the current window."""
+        return self.entity_description.value_fn(self._metrics.snapshot("/translate"))
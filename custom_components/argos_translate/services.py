@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
+from itertools import pairwise
 import logging
+from typing import Any
 
 import voluptuous as vol
 
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import (
     HomeAssistant,
     ServiceCall,
@@ -17,29 +22,248 @@ from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 
 from .api import CannotConnectError, TranslationError
-from .const import ATTR_SOURCE, ATTR_TARGET, ATTR_TEXT, DOMAIN, SERVICE_DETECT, SERVICE_TRANSLATE
+from .const import (
+    ATTR_ENTRY_ID,
+    ATTR_INCLUDE_CANDIDATES,
+    ATTR_PIVOT,
+    ATTR_SOURCE,
+    ATTR_STRATEGY,
+    ATTR_TARGET,
+    ATTR_TEXT,
+    ATTR_TEXTS,
+    DETECTION_CONFIDENCE_THRESHOLD,
+    DOMAIN,
+    SERVICE_DETECT,
+    SERVICE_TRANSLATE,
+    SERVICE_TRANSLATE_BATCH,
+    STRATEGY_LEAST_OUTSTANDING,
+    STRATEGY_ROUND_ROBIN,
+)
+from .coordinator import ArgosCoordinator
+from .languages import LanguageIndex
+from .router import RoutingTable, ServerRouter, async_call_with_failover
+from .scheduler import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
 
 _LOGGER = logging.getLogger(__name__)
 
 AUTO_SOURCE = "auto"
 
+# Fields shared by every service: which server(s) may handle the call
+ROUTING_FIELDS = {
+    vol.Optional(ATTR_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_STRATEGY, default=STRATEGY_LEAST_OUTSTANDING): vol.In(
+        [STRATEGY_LEAST_OUTSTANDING, STRATEGY_ROUND_ROBIN]
+    ),
+}
+
 SERVICE_SCHEMA = vol.Schema(
     {
+        **ROUTING_FIELDS,
         vol.Required(ATTR_TEXT): cv.string,
         vol.Required(ATTR_SOURCE): cv.string,
         vol.Required(ATTR_TARGET): cv.string,
+        vol.Optional(ATTR_INCLUDE_CANDIDATES, default=False): cv.boolean,
+        vol.Optional(ATTR_PIVOT, default=False): cv.boolean,
+    }
+)
+
+BATCH_SCHEMA = vol.Schema(
+    {
+        **ROUTING_FIELDS,
+        vol.Required(ATTR_TEXTS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_SOURCE): cv.string,
+        vol.Required(ATTR_TARGET): cv.string,
     }
 )
 
 DETECT_SCHEMA = vol.Schema(
     {
+        **ROUTING_FIELDS,
         vol.Required(ATTR_TEXT): cv.string,
     }
 )
 
 
+def get_coordinators(
+    hass: HomeAssistant, data: Mapping[str, Any]
+) -> list[ArgosCoordinator]:
+    """Return the coordinators that may handle a call with the given data.
+
+    An entry_id in the call pins it to that one server; otherwise every
+    loaded config entry is a candidate.
+    """
+    if entry_id := data.get(ATTR_ENTRY_ID):
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if (
+            entry is None
+            or entry.domain != DOMAIN
+            or entry.state is not ConfigEntryState.LOADED
+        ):
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="entry_not_loaded",
+                translation_placeholders={"entry_id": entry_id},
+            )
+        return [entry.runtime_data.coordinator]
+
+    entries = hass.config_entries.async_loaded_entries(DOMAIN)
+    if not entries:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="no_config_entry",
+        )
+    return [entry.runtime_data.coordinator for entry in entries]
+
+
+def route_call(
+    hass: HomeAssistant,
+    router: ServerRouter,
+    data: Mapping[str, Any],
+    source: str = AUTO_SOURCE,
+    target: str = "",
+    pivot: bool = False,
+) -> tuple[list[ArgosCoordinator], RoutingTable]:
+    """Return the servers to try for a call, preferred first, and their table.
+
+    With a fixed source the pair is validated against the languages installed
+    across every candidate server — an unsupported pair is rejected here,
+    before any request is sent — and only servers that have it are kept.
+    With pivot, a pair reachable through intermediate languages is accepted
+    too; each hop of the chain is then routed on its own. With an auto
+    source only servers that can translate into target from some language
+    are kept, and a target no server has is rejected here as well. A
+    translation whose result one server has cached, or is already fetching,
+    goes to that server first.
+    """
+    coordinators = get_coordinators(hass, data)
+    table = router.routing_table(coordinators)
+    if source != AUTO_SOURCE:
+        path = table.index.path(source, target) if pivot else None
+        if path is not None and len(path) > 2:
+            return coordinators, table
+        _validate_language_pair(table.index, source, target)
+        coordinators = table.supporting(coordinators, source, target)
+    elif target:
+        coordinators = table.targeting(coordinators, target)
+        if not coordinators:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="invalid_auto_target",
+                translation_placeholders={"target": target},
+            )
+    if not target:
+        return router.order(coordinators, data[ATTR_STRATEGY]), table
+    texts: list[str] = data.get(ATTR_TEXTS) or [data[ATTR_TEXT]]
+    return (
+        router.order(
+            coordinators,
+            data[ATTR_STRATEGY],
+            lambda c: all(c.has_translation(t, source, target) for t in texts),
+        ),
+        table,
+    )
+
+
+async def _async_translate_path(
+    router: ServerRouter,
+    call: ServiceCall,
+    table: RoutingTable,
+    coordinators: list[ArgosCoordinator],
+    text: str,
+    path: tuple[str, ...],
+    priority: int,
+) -> dict[str, Any]:
+    """Translate text along a chain of languages, one installed pair per hop.
+
+    Each hop goes to a server that has that pair and is cached like any
+    direct translation, so repeating a chain costs no server calls.
+    """
+    for source, target in pairwise(path):
+        hop_servers = router.order(
+            table.supporting(coordinators, source, target),
+            call.data[ATTR_STRATEGY],
+            lambda c: c.has_translation(text, source, target),
+        )
+        result = await async_call_with_failover(
+            hop_servers,
+            lambda c: c.async_translate(text, source, target, priority=priority),
+        )
+        text = result["translatedText"]
+    return {"translatedText": text}
+
+
+def confident_candidates(detections: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return the detection candidates at or above the confidence threshold."""
+    return [
+        d
+        for d in detections
+        if d.get("confidence", 0) >= DETECTION_CONFIDENCE_THRESHOLD
+    ]
+
+
+def pair_unavailable_response(
+    err: TranslationError,
+    index: LanguageIndex,
+    target: str,
+    candidates: list[dict[str, Any]],
+    include_candidates: bool,
+) -> dict[str, Any]:
+    """Return the partial auto-detect response for a pair the server lacks."""
+    response: dict[str, Any] = {"translated_text": "", "error": str(err)}
+    if candidates:
+        top = candidates[0]
+        detected_code = top["language"]
+        response["detected_language"] = detected_code
+        response["detection_confidence"] = top["confidence"]
+
+        # Compose a descriptive error naming the detected language
+        # and the unsupported pair instead of a raw HTTP error.
+        detected_name = index.name(detected_code)
+        target_name = index.name(target)
+
+        response["error"] = (
+            f"Detected {detected_name} but {detected_name} \u2192"
+            f" {target_name} translation pair is not available."
+        )
+
+        # Check if detected language is installed (DTCT-06)
+        if detected_code not in index.languages:
+            response["uninstalled_detected_language"] = detected_code
+
+    if include_candidates:
+        response["detections"] = candidates
+    return response
+
+
+def _call_priority(call: ServiceCall) -> int:
+    """Return the scheduling priority of a service call.
+
+    Calls made by a logged-in user (the card, Developer Tools) go ahead of
+    calls made by automations, which carry no user id.
+    """
+    return PRIORITY_INTERACTIVE if call.context.user_id else PRIORITY_BACKGROUND
+
+
+def _validate_language_pair(index: LanguageIndex, source: str, target: str) -> None:
+    """Raise ServiceValidationError unless source -> target is installed."""
+    targets = index.targets.get(source)
+    if targets is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_source",
+            translation_placeholders={"source": source},
+        )
+
+    if target not in targets:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_target",
+            translation_placeholders={"source": source, "target": target},
+        )
+
+
 @callback
-def async_register_services(hass: HomeAssistant) -> None:
+def async_register_services(hass: HomeAssistant, router: ServerRouter) -> None:
     """Register integration service actions for Argos Translate."""
 
     async def _async_handle_translate(call: ServiceCall) -> ServiceResponse:
@@ -47,106 +271,116 @@ def async_register_services(hass: HomeAssistant) -> None:
         text: str = call.data[ATTR_TEXT]
         source: str = call.data[ATTR_SOURCE]
         target: str = call.data[ATTR_TARGET]
+        include_candidates: bool = call.data[ATTR_INCLUDE_CANDIDATES]
+        pivot: bool = call.data[ATTR_PIVOT]
+        priority = _call_priority(call)
 
-        # Look up coordinator from first config entry
-        entries = hass.config_entries.async_entries(DOMAIN)
-        if not entries:
-            raise ServiceValidationError(
-                translation_domain=DOMAIN,
-                translation_key="no_config_entry",
-            )
-
-        entry = entries[0]
-        coordinator = entry.runtime_data.coordinator
-
-        # Validate language pair against coordinator data
-        languages = coordinator.data.get("languages", []) if coordinator.data else []
-
-        if source != AUTO_SOURCE:
-            source_lang = None
-            for lang in languages:
-                if lang["code"] == source:
-                    source_lang = lang
-                    break
+        # Servers to try, preferred first, and the languages installed on them
+        coordinators, table = route_call(
+            hass, router, call.data, source, target, pivot
+        )
+        index = table.index
 
-            if source_lang is None:
-                raise ServiceValidationError(
-                    translation_domain=DOMAIN,
-                    translation_key="invalid_source",
-                    translation_placeholders={"source": source},
-                )
-
-            if target not in source_lang.get("targets", []):
-                raise ServiceValidationError(
-                    translation_domain=DOMAIN,
-                    translation_key="invalid_target",
-                    translation_placeholders={"source": source, "target": target},
-                )
+        # Detection candidates above the confidence threshold (auto source only)
+        candidates: list[dict[str, Any]] = []
+        # Languages the text went through, reported in pivot mode
+        path: tuple[str, ...] | None = None
 
         # Call translation API
         if source == AUTO_SOURCE:
-            # Detect-first: call /detect before /translate so we can surface the
-            # detected language even when the translation pair is unavailable (HTTP 400).
+            # Run /detect alongside /translate so we can surface the detected
+            # language even when the translation pair is unavailable (HTTP 400),
+            # without adding a second round trip to the service latency.
+            detect_outcome, translate_outcome = await asyncio.gather(
+                # /detect is best-effort here: its failure alone must not
+                # mark a server offline while /translate may still succeed.
+                async_call_with_failover(
+                    coordinators,
+                    lambda c: c.async_detect_languages(text, priority=priority),
+                    report_unreachable=False,
+                ),
+                async_call_with_failover(
+                    coordinators,
+                    lambda c: c.async_translate(
+                        text, source, target, priority=priority
+                    ),
+                ),
+                return_exceptions=True,
+            )
+
             detect_result: list = []
-            try:
-                detect_result = await coordinator.async_detect_languages(text)
-            except (CannotConnectError, TranslationError):
-                pass  # Best-effort — if /detect fails, still attempt /translate
+            if isinstance(detect_outcome, (CannotConnectError, TranslationError)):
+                pass  # Best-effort — if /detect fails, still use /translate
+            elif isinstance(detect_outcome, BaseException):
+                raise detect_outcome
+            else:
+                detect_result = detect_outcome
+            candidates = confident_candidates(detect_result)
 
             try:
-                result = await coordinator.async_translate(text, source, target)
+                if isinstance(translate_outcome, BaseException):
+                    raise translate_outcome
+                result = translate_outcome
             except TranslationError as err:
                 # Server returned HTTP 4xx (e.g., pair not available).
                 # Server IS reachable — do NOT mark coordinator as failed.
-                # Surface the detection result from the pre-flight /detect call
-                # instead of raising, so the card can show what was detected.
-                response: dict = {"translated_text": "", "error": str(err)}
-                if detect_result:
-                    top = next(
-                        (d for d in detect_result if d.get("confidence", 0) >= 50.0),
-                        None,
-                    )
-                    if top:
-                        detected_code = top["language"]
-                        response["detected_language"] = detected_code
-                        response["detection_confidence"] = top["confidence"]
-
-                        # Compose a descriptive error naming the detected language
-                        # and the unsupported pair instead of a raw HTTP error.
-                        detected_name = detected_code
-                        target_name = target
-                        for lang in languages:
-                            if lang["code"] == detected_code:
-                                detected_name = lang.get("name", detected_code)
-                            if lang["code"] == target:
-                                target_name = lang.get("name", target)
-
-                        response["error"] = (
-                            f"Detected {detected_name} but {detected_name} \u2192"
-                            f" {target_name} translation pair is not available."
+                # In pivot mode, chain from the detected language instead.
+                if pivot and candidates:
+                    path = index.path(candidates[0]["language"], target)
+                if path is not None:
+                    try:
+                        # Hops may need servers without the target itself
+                        result = await _async_translate_path(
+                            router,
+                            call,
+                            table,
+                            get_coordinators(hass, call.data),
+                            text,
+                            path,
+                            priority,
                         )
-
-                        # Check if detected language is installed (DTCT-06)
-                        installed_codes = [lang["code"] for lang in languages]
-                        if detected_code not in installed_codes:
-                            response["uninstalled_detected_language"] = detected_code
-
-                return response
+                    except CannotConnectError as chain_err:
+                        raise HomeAssistantError(
+                            f"Translation failed: {chain_err}"
+                        ) from chain_err
+                    except TranslationError:
+                        path = None
+                    else:
+                        result["detectedLanguage"] = candidates[0]
+
+                if path is None:
+                    # Surface the detection result from the concurrent /detect
+                    # call instead of raising, so the card can show what was
+                    # detected.
+                    return pair_unavailable_response(
+                        err, index, target, candidates, include_candidates
+                    )
             except CannotConnectError as err:
-                # True connection failure — server unreachable.
-                # Flip coordinator to error state immediately.
-                coordinator.async_set_update_error(err)
+                # True connection failure — no server reachable. The router
+                # has already flipped each coordinator to its error state.
                 raise HomeAssistantError(
                     f"Translation failed: {err}"
                 ) from err
         else:
-            # Non-auto source — validate pair and translate directly.
+            # Non-auto source — pair already validated; translate directly,
+            # or hop by hop when pivot mode found no direct pair.
+            if pivot:
+                path = index.path(source, target)
             try:
-                result = await coordinator.async_translate(text, source, target)
+                if path is not None and len(path) > 2:
+                    result = await _async_translate_path(
+                        router, call, table, coordinators, text, path, priority
+                    )
+                else:
+                    result = await async_call_with_failover(
+                        coordinators,
+                        lambda c: c.async_translate(
+                            text, source, target, priority=priority
+                        ),
+                    )
             except CannotConnectError as err:
-                # Immediately flip coordinator to error state so binary_sensor goes
+                # Every server unreachable — each binary_sensor already went
                 # offline without waiting for the 5-min poll cycle.
-                coordinator.async_set_update_error(err)
                 raise HomeAssistantError(
                     f"Translation failed: {err}"
                 ) from err
@@ -166,10 +400,17 @@ def async_register_services(hass: HomeAssistant) -> None:
             response["detection_confidence"] = detected_confidence
 
             # Check if detected language is installed (DTCT-06)
-            if detected_code:
-                installed_codes = [lang["code"] for lang in languages]
-                if detected_code not in installed_codes:
-                    response["uninstalled_detected_language"] = detected_code
+            if detected_code and detected_code not in index.languages:
+                response["uninstalled_detected_language"] = detected_code
+
+        if include_candidates and source == AUTO_SOURCE:
+            response["detections"] = candidates
+
+        if pivot:
+            if path is None and response.get("detected_language"):
+                path = (response["detected_language"], target)
+            if path is not None:
+                response["translation_path"] = list(path)
 
         return response
 
@@ -181,27 +422,67 @@ def async_register_services(hass: HomeAssistant) -> None:
         supports_response=SupportsResponse.ONLY,
     )
 
+    async def _async_handle_translate_batch(call: ServiceCall) -> ServiceResponse:
+        """Handle the translate_batch service call — many texts, one pair."""
+        texts: list[str] = call.data[ATTR_TEXTS]
+        source: str = call.data[ATTR_SOURCE]
+        target: str = call.data[ATTR_TARGET]
+
+        coordinators, _table = route_call(hass, router, call.data, source, target)
+
+        try:
+            # Batches are bulk work — never let them delay interactive calls
+            results = await async_call_with_failover(
+                coordinators,
+                lambda c: c.async_translate_many(
+                    texts, source, target, priority=PRIORITY_BACKGROUND
+                ),
+            )
+        except CannotConnectError as err:
+            raise HomeAssistantError(
+                f"Translation failed: {err}"
+            ) from err
+        except TranslationError as err:
+            raise HomeAssistantError(
+                f"Translation failed: {err}"
+            ) from err
+
+        translations: list[dict[str, Any]] = []
+        for result in results:
+            item: dict[str, Any] = {"translated_text": result["translatedText"]}
+            if "detectedLanguage" in result:
+                item["detected_language"] = result["detectedLanguage"].get("language")
+                item["detection_confidence"] = result["detectedLanguage"].get(
+                    "confidence"
+                )
+            translations.append(item)
+
+        return {"translations": translations}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_TRANSLATE_BATCH,
+        _async_handle_translate_batch,
+        schema=BATCH_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
     async def _async_handle_detect(call: ServiceCall) -> ServiceResponse:
         """Handle the detect service call — returns language detection candidates."""
         text: str = call.data[ATTR_TEXT]
 
-        entries = hass.config_entries.async_entries(DOMAIN)
-        if not entries:
-            raise ServiceValidationError(
-                translation_domain=DOMAIN,
-                translation_key="no_config_entry",
-            )
-
-        entry = entries[0]
-        coordinator = entry.runtime_data.coordinator
+        coordinators, _table = route_call(hass, router, call.data)
+        priority = _call_priority(call)
 
         try:
-            candidates = await coordinator.async_detect_languages(text)
+            candidates = await async_call_with_failover(
+                coordinators,
+                lambda c: c.async_detect_languages(text, priority=priority),
+            )
         except CannotConnectError as err:
-            # Immediately flip coordinator to error state so binary_sensor goes
-            # offline without waiting for the 5-min poll cycle. async_set_update_error
-            # is a synchronous @callback — no await needed, no debouncer delay.
-            coordinator.async_set_update_error(err)
+            # Every server unreachable — the router already flipped each
+            # coordinator to its error state so its binary_sensor goes offline
+            # without waiting for the 5-min poll cycle.
             raise HomeAssistantError(
                 f"Language detection failed: {err}"
             ) from err
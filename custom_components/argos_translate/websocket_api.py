@@ -0,0 +1,216 @@
+"""Websocket commands for the Argos Translate card."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+
+from .api import CannotConnectError, InvalidAuthError, TranslationError
+from .const import ATTR_SOURCE, ATTR_TARGET, ATTR_TEXT, DOMAIN
+from .coordinator import ArgosCoordinator
+from .languages import LanguageIndex
+from .router import ServerRouter, async_call_with_failover
+from .scheduler import PRIORITY_INTERACTIVE
+from .services import (
+    AUTO_SOURCE,
+    ROUTING_FIELDS,
+    confident_candidates,
+    pair_unavailable_response,
+    route_call,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+WS_LANGUAGES = f"{DOMAIN}/languages"
+WS_TRANSLATE_STREAM = f"{DOMAIN}/translate_stream"
+
+
+@callback
+def async_register_websocket_commands(
+    hass: HomeAssistant, router: ServerRouter
+) -> None:
+    """Register the websocket commands used by the card."""
+
+    @websocket_api.websocket_command(
+        {
+            vol.Required("type"): WS_TRANSLATE_STREAM,
+            **ROUTING_FIELDS,
+            vol.Required(ATTR_TEXT): cv.string,
+            vol.Required(ATTR_SOURCE): cv.string,
+            vol.Required(ATTR_TARGET): cv.string,
+        }
+    )
+    @callback
+    def _handle_translate_stream(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict[str, Any],
+    ) -> None:
+        """Subscribe to a translation delivered piece by piece.
+
+        Validation errors are returned as the command's error. Once
+        subscribed, each event holds the next piece of translated_text in
+        order; the last event is {"done": true}, or {"error": {...}} if the
+        translation failed part way. With source 'auto' the first event also
+        carries the detected language, and uninstalled_detected_language
+        when it is not installed, as the translate service's response does.
+        """
+        coordinators, table = route_call(
+            hass, router, msg, msg[ATTR_SOURCE], msg[ATTR_TARGET]
+        )
+        # Subscribed before the first piece, which may be ready at once
+        connection.send_result(msg["id"])
+        task = hass.async_create_background_task(
+            _async_stream_translation(connection, msg, coordinators, table.index),
+            f"{DOMAIN} translate stream",
+        )
+        connection.subscriptions[msg["id"]] = task.cancel
+
+    websocket_api.async_register_command(hass, _handle_translate_stream)
+    websocket_api.async_register_command(hass, _handle_languages)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_LANGUAGES,
+        vol.Required("entity_id"): cv.entity_id,
+    }
+)
+@callback
+def _handle_languages(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the language catalog of the server behind one of its entities.
+
+    The result is {"version": ..., "languages": [{code, name, targets}]}.
+    version matches the catalog_version attribute of the language count
+    sensor, so a client only needs to fetch again when that changes.
+    """
+    entity = er.async_get(hass).async_get(msg["entity_id"])
+    entry = (
+        hass.config_entries.async_get_entry(entity.config_entry_id)
+        if entity is not None and entity.config_entry_id
+        else None
+    )
+    if (
+        entry is None
+        or entry.domain != DOMAIN
+        or entry.state is not ConfigEntryState.LOADED
+    ):
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"{msg['entity_id']} is not a loaded Argos Translate entity",
+        )
+        return
+
+    data = entry.runtime_data.coordinator.data or {}
+    connection.send_result(
+        msg["id"],
+        {"version": data.get("version"), "languages": data.get("languages", [])},
+    )
+
+
+async def _async_stream_translation(
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    coordinators: list[ArgosCoordinator],
+    index: LanguageIndex,
+) -> None:
+    """Send the pieces of a translation to a subscriber as they arrive.
+
+    A server that cannot be reached before the first piece is sent is marked
+    offline and the next one is tried, like a service call; once pieces have
+    been sent the stream cannot switch servers and ends with an error.
+    Every stream ends with a done or an error event, so the subscriber is
+    never left waiting.
+    """
+    msg_id: int = msg["id"]
+    text: str = msg[ATTR_TEXT]
+    source: str = msg[ATTR_SOURCE]
+    target: str = msg[ATTR_TARGET]
+    last = coordinators[-1]
+    sent = False
+    for coordinator in coordinators:
+        try:
+            async for result in coordinator.async_translate_stream(
+                text, source, target, PRIORITY_INTERACTIVE
+            ):
+                event: dict[str, Any] = {"translated_text": result["translatedText"]}
+                if detected := result.get("detectedLanguage"):
+                    code = detected.get("language")
+                    event["detected_language"] = code
+                    event["detection_confidence"] = detected.get("confidence")
+                    if code and code not in index.languages:
+                        event["uninstalled_detected_language"] = code
+                connection.send_event(msg_id, event)
+                sent = True
+        except CannotConnectError as err:
+            coordinator.async_set_update_error(err)
+            if coordinator is not last and not sent:
+                continue
+            connection.send_event(
+                msg_id, {"error": {"code": "cannot_connect", "message": str(err)}}
+            )
+        except TranslationError as err:
+            if source == AUTO_SOURCE and not sent:
+                event = await _async_pair_unavailable_event(
+                    err, coordinators, text, target, index
+                )
+            else:
+                event = {"error": {"code": "translation_error", "message": str(err)}}
+            connection.send_event(msg_id, event)
+        except InvalidAuthError as err:
+            connection.send_event(
+                msg_id, {"error": {"code": "invalid_auth", "message": str(err)}}
+            )
+        except Exception as err:
+            _LOGGER.exception("Unexpected error streaming a translation")
+            connection.send_event(
+                msg_id, {"error": {"code": "unknown_error", "message": str(err)}}
+            )
+        else:
+            connection.send_event(msg_id, {"done": True})
+        return
+
+
+async def _async_pair_unavailable_event(
+    err: TranslationError,
+    coordinators: list[ArgosCoordinator],
+    text: str,
+    target: str,
+    index: LanguageIndex,
+) -> dict[str, Any]:
+    """Return the error event for an auto-detected source with no pair to target.
+
+    Like the translate service, the event names the detected language and
+    carries it, with uninstalled_detected_language when it is not
+    installed. Detection is best-effort: without it the server's error is
+    sent as is.
+    """
+    try:
+        detections = await async_call_with_failover(
+            coordinators,
+            lambda c: c.async_detect_languages(text, priority=PRIORITY_INTERACTIVE),
+            report_unreachable=False,
+        )
+    except Exception:  # noqa: BLE001
+        _LOGGER.debug("Could not detect the language of a stream", exc_info=True)
+        detections = []
+    response = pair_unavailable_response(
+        err, index, target, confident_candidates(detections), False
+    )
+    del response["translated_text"]
+    return {
+        **response,
+        "error": {"code": "translation_error", "message": response["error"]},
+    }
@@ -1,11 +1,13 @@
 """Common fixtures for the Argos Translate tests."""
 
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from homeassistant.const import CONF_API_KEY, CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.core import HomeAssistant
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -34,17 +36,39 @@ def mock_setup_entry() -> Generator[AsyncMock]:
         yield mock_setup_entry
 
 
+MOCK_ENTRY_DATA = {
+    CONF_HOST: "192.168.1.100",
+    CONF_PORT: 5000,
+    CONF_API_KEY: "",
+    CONF_NAME: "Test LibreTranslate",
+    CONF_USE_SSL: False,
+}
+
+
 @pytest.fixture
 def mock_config_entry() -> MockConfigEntry:
     """Return a mock config entry for testing."""
     return MockConfigEntry(
         domain=DOMAIN,
         title="Test LibreTranslate",
-        data={
-            CONF_HOST: "192.168.1.100",
-            CONF_PORT: 5000,
-            CONF_API_KEY: "",
-            CONF_NAME: "Test LibreTranslate",
-            CONF_USE_SSL: False,
-        },
+        data=MOCK_ENTRY_DATA,
     )
+
+
+@pytest.fixture
+def mock_entry(
+    hass: HomeAssistant,
+) -> Callable[[dict[str, Any] | None], MockConfigEntry]:
+    """Return a factory adding a config entry with the given options to hass."""
+
+    def _mock_entry(options: dict[str, Any] | None = None) -> MockConfigEntry:
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title="Test LibreTranslate",
+            data=MOCK_ENTRY_DATA,
+            options=options or {},
+        )
+        entry.add_to_hass(hass)
+        return entry
+
+    return _mock_entry
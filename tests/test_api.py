@@ -0,0 +1,409 @@
+"""Tests for the Argos Translate API client."""
+
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+from yarl import URL
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+    AiohttpClientMockResponse,
+)
+
+from custom_components.argos_translate.api import (
+    ArgosTranslateApiClient,
+    CannotConnectError,
+    InvalidAuthError,
+    TimeoutProfile,
+    TranslationError,
+    _RetryableError,
+)
+
+BASE_URL = "http://localhost:5000"
+
+
+def _make_client(hass: HomeAssistant, **kwargs: Any) -> ArgosTranslateApiClient:
+    """Create an API client bound to the mocked HA client session."""
+    return ArgosTranslateApiClient(
+        host="localhost",
+        port=5000,
+        api_key="",
+        session=async_get_clientsession(hass),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def no_backoff():
+    """Retry immediately instead of waiting out the backoff."""
+    with patch(
+        "custom_components.argos_translate.api.random.uniform", return_value=0
+    ):
+        yield
+
+
+async def test_translate_many_splits_batches(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test oversized batches are split and results keep input order."""
+
+    async def _translate(
+        method: str, url: URL, data: dict[str, Any]
+    ) -> AiohttpClientMockResponse:
+        return AiohttpClientMockResponse(
+            method,
+            url,
+            json={"translatedText": [text.upper() for text in data["q"]]},
+        )
+
+    aioclient_mock.post(f"{BASE_URL}/translate", side_effect=_translate)
+
+    client = _make_client(hass)
+    results = await client.async_translate_many(
+        ["a", "b", "c", "d", "e"], "en", "es", batch_size=2
+    )
+
+    assert [result["translatedText"] for result in results] == [
+        "A",
+        "B",
+        "C",
+        "D",
+        "E",
+    ]
+    assert [call[2]["q"] for call in aioclient_mock.mock_calls] == [
+        ["a", "b"],
+        ["c", "d"],
+        ["e"],
+    ]
+
+
+async def test_translate_many_auto_detected_languages(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test per-text detected languages are attached to each result."""
+    aioclient_mock.post(
+        f"{BASE_URL}/translate",
+        json={
+            "translatedText": ["Hello", "Good day"],
+            "detectedLanguage": [
+                {"language": "fr", "confidence": 90.0},
+                {"language": "de", "confidence": 85.0},
+            ],
+        },
+    )
+
+    client = _make_client(hass)
+    results = await client.async_translate_many(["Bonjour", "Guten Tag"], "auto", "en")
+
+    assert results == [
+        {
+            "translatedText": "Hello",
+            "detectedLanguage": {"language": "fr", "confidence": 90.0},
+        },
+        {
+            "translatedText": "Good day",
+            "detectedLanguage": {"language": "de", "confidence": 85.0},
+        },
+    ]
+
+
+async def test_retry_on_dropped_connection(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, no_backoff: None
+) -> None:
+    """Test a stale keep-alive connection is retried instead of failing the call."""
+    calls = 0
+
+    async def _translate(
+        method: str, url: URL, data: dict[str, Any]
+    ) -> AiohttpClientMockResponse:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise aiohttp.ServerDisconnectedError
+        return AiohttpClientMockResponse(method, url, json={"translatedText": "Hola"})
+
+    aioclient_mock.post(f"{BASE_URL}/translate", side_effect=_translate)
+
+    client = _make_client(hass)
+    result = await client.async_translate("Hello", "en", "es")
+
+    assert result == {"translatedText": "Hola"}
+    assert calls == 2
+    assert client.retry_count == 1
+    assert client.retry_exhausted_count == 0
+
+
+async def test_retry_unavailable_gives_up(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, no_backoff: None
+) -> None:
+    """Test HTTP 503 is retried, then raised as CannotConnectError."""
+    aioclient_mock.get(f"{BASE_URL}/languages", status=503)
+
+    client = _make_client(hass, retries=2)
+    with pytest.raises(CannotConnectError, match="HTTP 503"):
+        await client.async_get_languages()
+
+    assert aioclient_mock.call_count == 3
+    assert client.retry_count == 2
+    assert client.retry_exhausted_count == 1
+
+
+async def test_translate_timeout_not_retried(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, no_backoff: None
+) -> None:
+    """Test a timed out /translate is not sent again; /detect is."""
+    aioclient_mock.post(f"{BASE_URL}/translate", exc=TimeoutError)
+    aioclient_mock.post(f"{BASE_URL}/detect", exc=TimeoutError)
+
+    client = _make_client(hass, retries=2)
+    with pytest.raises(CannotConnectError):
+        await client.async_translate("Hello", "en", "es")
+    assert aioclient_mock.call_count == 1
+
+    with pytest.raises(CannotConnectError):
+        await client.async_detect_languages("Hello")
+    assert aioclient_mock.call_count == 4
+
+
+async def test_retries_stop_at_deadline(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test no retry is made once its backoff would overrun the call's budget."""
+    aioclient_mock.get(f"{BASE_URL}/languages", status=502)
+
+    client = _make_client(
+        hass, connect_timeout=0.05, languages_timeout=0.05, retries=5
+    )
+    with (
+        patch(
+            "custom_components.argos_translate.api.random.uniform",
+            return_value=0.25,
+        ),
+        pytest.raises(CannotConnectError),
+    ):
+        await client.async_get_languages()
+
+    # Six attempts of 0.1s make a 0.6s budget: 0.25s backoffs fit twice
+    assert aioclient_mock.call_count == 3
+    assert client.retry_exhausted_count == 1
+
+
+async def test_requests_recorded_per_endpoint(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test each call's outcome and characters are recorded under its endpoint."""
+    aioclient_mock.post(f"{BASE_URL}/translate", json={"translatedText": "Hola"})
+    aioclient_mock.post(f"{BASE_URL}/detect", status=401)
+
+    client = _make_client(hass)
+    await client.async_translate("Hello", "en", "es")
+    with pytest.raises(InvalidAuthError):
+        await client.async_detect_languages("Hello")
+
+    translate = client.metrics.snapshot("/translate")
+    assert translate.chars_per_minute == 5
+    assert translate.error_rate == 0
+    assert translate.p50 is not None
+    detect = client.metrics.snapshot("/detect")
+    assert detect.error_rate == 100
+    assert detect.p50 is None
+
+
+def test_timeout_profile_scales_with_length():
+    """Test the read timeout and deadline grow with the characters sent."""
+    profile = TimeoutProfile(connect=1, read=30, read_per_char=0.02)
+
+    assert profile.client_timeout().sock_connect == 1
+    assert profile.client_timeout().sock_read == 30
+    assert profile.client_timeout(chars=1000).sock_read == 50
+    assert profile.deadline(chars=1000) == 51
+    assert profile.deadline(chars=1000, attempts=3) == 153
+
+
+async def test_per_endpoint_timeouts(socket_enabled: None) -> None:
+    """Test each endpoint gets its own read timeout, scaled for translations."""
+
+    async def _slow(request: web.Request) -> web.Response:
+        await asyncio.sleep(0.3)
+        if request.path == "/languages":
+            return web.json_response([])
+        return web.json_response({"translatedText": "Hola"})
+
+    app = web.Application()
+    app.router.add_get("/languages", _slow)
+    app.router.add_post("/translate", _slow)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+
+    session = aiohttp.ClientSession()
+    client = ArgosTranslateApiClient(
+        host="127.0.0.1",
+        port=server.port,
+        api_key="",
+        session=session,
+        retries=0,
+        languages_timeout=0.1,
+        translate_timeout=0.1,
+    )
+    try:
+        with pytest.raises(CannotConnectError, match="timed out"):
+            await client.async_get_languages()
+        with pytest.raises(CannotConnectError, match="timed out"):
+            await client.async_translate("Hi", "en", "es")
+        # 50 characters earn about a second more than the short text
+        assert await client.async_translate("x" * 50, "en", "es") == {
+            "translatedText": "Hola"
+        }
+    finally:
+        await session.close()
+        await server.close()
+
+
+async def test_read_timeout_retried_within_deadline(
+    socket_enabled: None, no_backoff: None
+) -> None:
+    """Test a /languages read timeout leaves the retry a full attempt's time."""
+    calls = 0
+
+    async def _languages(request: web.Request) -> web.Response:
+        nonlocal calls
+        calls += 1
+        # Too slow for the read timeout at first, then well within it
+        await asyncio.sleep(0.5 if calls == 1 else 0.1)
+        return web.json_response([])
+
+    app = web.Application()
+    app.router.add_get("/languages", _languages)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+
+    session = aiohttp.ClientSession()
+    client = ArgosTranslateApiClient(
+        host="127.0.0.1",
+        port=server.port,
+        api_key="",
+        session=session,
+        retries=1,
+        connect_timeout=0.05,
+        languages_timeout=0.2,
+    )
+    try:
+        # The first attempt uses up 0.2s of its 0.25s; the retry still gets
+        # a full attempt's time to answer
+        assert await client.async_get_languages() == []
+        assert calls == 2
+        assert client.retry_count == 1
+    finally:
+        await session.close()
+        await server.close()
+
+
+async def test_deadline_expiry_counts_as_exhausted(
+    hass: HomeAssistant, no_backoff: None
+) -> None:
+    """Test a call cut off by its deadline during a retry counts as exhausted."""
+    client = _make_client(
+        hass, retries=1, connect_timeout=0.05, languages_timeout=0.05
+    )
+    attempts = 0
+
+    async def _send(*args: Any, **kwargs: Any) -> Any:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise _RetryableError(CannotConnectError("Server unavailable"))
+        await asyncio.sleep(1)
+
+    with (
+        patch.object(client, "_send", side_effect=_send),
+        pytest.raises(CannotConnectError, match="timed out"),
+    ):
+        await client.async_get_languages()
+
+    assert attempts == 2
+    assert client.retry_exhausted_count == 1
+
+
+async def test_probe_any_response_is_alive(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test the health probe treats any HTTP answer, even a 401, as a live server."""
+    aioclient_mock.get(f"{BASE_URL}/frontend/settings", status=401)
+
+    await _make_client(hass).async_probe(timeout=5)
+
+    assert aioclient_mock.call_count == 1
+
+
+async def test_probe_timeout(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test the health probe raises CannotConnectError when the server is silent."""
+    aioclient_mock.get(f"{BASE_URL}/frontend/settings", exc=TimeoutError)
+
+    with pytest.raises(CannotConnectError):
+        await _make_client(hass).async_probe(timeout=5)
+
+
+async def test_failing_requests_release_connections(socket_enabled: None) -> None:
+    """Test 10k HTTP 400 responses reuse pooled connections instead of leaking.
+
+    Runs against a local LibreTranslate stand-in that rejects every
+    translation. With responses released, the client never opens more
+    connections than its pool allows and none stay checked out.
+    """
+    pool_size = 10
+    peers: set[tuple[str, int]] = set()
+
+    async def _translate(request: web.Request) -> web.StreamResponse:
+        peers.add(request.transport.get_extra_info("peername"))
+        # Send the headers before the body, like a slow proxy would, so the
+        # client sees the status while the body is still in flight and
+        # aiohttp cannot release the connection on its own.
+        response = web.StreamResponse(status=400, reason="Bad Request")
+        response.content_type = "application/json"
+        await response.prepare(request)
+        await asyncio.sleep(0.001)
+        await response.write(b'{"error": "es is not supported"}')
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_post("/translate", _translate)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+
+    connector = aiohttp.TCPConnector(limit=pool_size)
+    session = aiohttp.ClientSession(connector=connector)
+    client = ArgosTranslateApiClient(
+        host="127.0.0.1", port=server.port, api_key="", session=session
+    )
+
+    async def _failing_translate() -> None:
+        with pytest.raises(TranslationError):
+            await client.async_translate("Hello", "en", "es")
+
+    # asyncio debug mode (enabled by the HA test harness) makes 10k requests
+    # take minutes; the behavior under test does not depend on it.
+    loop = asyncio.get_running_loop()
+    debug = loop.get_debug()
+    loop.set_debug(False)
+    try:
+        for _ in range(100):
+            await asyncio.gather(*(_failing_translate() for _ in range(100)))
+            # Connection count stays flat: never more than the pool allows,
+            # and nothing is left checked out between waves.
+            assert len(peers) <= pool_size
+            assert not connector._acquired
+    finally:
+        loop.set_debug(debug)
+        await session.close()
+        await server.close()
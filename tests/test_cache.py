@@ -0,0 +1,213 @@
+"""Tests for the Argos Translate translation cache."""
+
+import time
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.argos_translate.cache import (
+    STORAGE_VERSION,
+    PersistentTranslationCache,
+    TranslationCache,
+    storage_key,
+)
+
+KEY = ("Hello", "en", "es")
+
+
+def test_cache_hit_and_miss():
+    """Test a stored result is returned and unknown keys miss."""
+    cache = TranslationCache(max_size=10, ttl=0)
+    cache.set(KEY, {"translatedText": "Hola"})
+
+    assert cache.get(KEY) == {"translatedText": "Hola"}
+    assert cache.get(("Hello", "en", "fr")) is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_cache_evicts_least_recently_used():
+    """Test the oldest untouched entry is evicted when the cache is full."""
+    cache = TranslationCache(max_size=2, ttl=0)
+    cache.set(("a", "en", "es"), {"translatedText": "A"})
+    cache.set(("b", "en", "es"), {"translatedText": "B"})
+    # Touch "a" so "b" becomes the least recently used entry
+    cache.get(("a", "en", "es"))
+    cache.set(("c", "en", "es"), {"translatedText": "C"})
+
+    assert len(cache) == 2
+    assert cache.get(("b", "en", "es")) is None
+    assert cache.get(("a", "en", "es")) is not None
+    assert cache.get(("c", "en", "es")) is not None
+
+
+def test_cache_ttl_expiry():
+    """Test entries expire once their TTL has elapsed."""
+    cache = TranslationCache(max_size=10, ttl=60)
+    with patch(
+        "custom_components.argos_translate.cache.time.monotonic", return_value=1000.0
+    ):
+        cache.set(KEY, {"translatedText": "Hola"})
+
+    with patch(
+        "custom_components.argos_translate.cache.time.monotonic", return_value=1059.0
+    ):
+        assert cache.get(KEY) is not None
+
+    with patch(
+        "custom_components.argos_translate.cache.time.monotonic", return_value=1060.0
+    ):
+        assert cache.get(KEY) is None
+    assert len(cache) == 0
+
+
+def test_cache_disabled():
+    """Test a max_size of 0 disables caching."""
+    cache = TranslationCache(max_size=0, ttl=0)
+    cache.set(KEY, {"translatedText": "Hola"})
+
+    assert cache.get(KEY) is None
+    assert len(cache) == 0
+
+
+def test_cache_clear():
+    """Test clear drops every entry."""
+    cache = TranslationCache(max_size=10, ttl=0)
+    cache.set(KEY, {"translatedText": "Hola"})
+    cache.clear()
+
+    assert cache.get(KEY) is None
+
+
+# --- PersistentTranslationCache tests ---
+
+
+def _stored(entries: list, fingerprint: str | None = "abc") -> dict[str, Any]:
+    """Return .storage contents for the persistent cache."""
+    return {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": storage_key("entry_1"),
+        "data": {"fingerprint": fingerprint, "entries": entries},
+    }
+
+
+async def test_persistent_cache_loads_lazily(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test stored entries are read on first lookup."""
+    hass_storage[storage_key("entry_1")] = _stored(
+        [["Hello", "en", "es", {"translatedText": "Hola"}, time.time()]]
+    )
+    cache = PersistentTranslationCache(hass, "entry_1", max_entries=10)
+    cache.async_set_fingerprint("abc")
+
+    result, _age = await cache.async_get(KEY)
+    assert result == {"translatedText": "Hola"}
+    assert await cache.async_get(("Hello", "en", "fr")) is None
+
+
+async def test_persistent_cache_discards_stale_fingerprint(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test entries stored for a different language set are discarded."""
+    hass_storage[storage_key("entry_1")] = _stored(
+        [["Hello", "en", "es", {"translatedText": "Hola"}, time.time()]],
+        fingerprint="old",
+    )
+    cache = PersistentTranslationCache(hass, "entry_1", max_entries=10)
+    cache.async_set_fingerprint("new")
+
+    assert await cache.async_get(KEY) is None
+    await cache.async_flush()
+    assert hass_storage[storage_key("entry_1")]["data"]["entries"] == []
+
+
+async def test_persistent_cache_flush_compacts(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test writes trim the cache to its entry limit, oldest first."""
+    cache = PersistentTranslationCache(hass, "entry_1", max_entries=2)
+    cache.async_set_fingerprint("abc")
+    await cache.async_get(KEY)
+
+    for text in ("a", "b", "c"):
+        cache.async_set((text, "en", "es"), {"translatedText": text.upper()})
+    await cache.async_flush()
+
+    data = hass_storage[storage_key("entry_1")]["data"]
+    assert data["fingerprint"] == "abc"
+    assert [entry[:4] for entry in data["entries"]] == [
+        ["b", "en", "es", {"translatedText": "B"}],
+        ["c", "en", "es", {"translatedText": "C"}],
+    ]
+
+
+async def test_persistent_cache_set_before_load_ignored(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test writes before the first load never overwrite the stored file."""
+    stored = [["Hello", "en", "es", {"translatedText": "Hola"}, time.time()]]
+    hass_storage[storage_key("entry_1")] = _stored(stored, fingerprint=None)
+    cache = PersistentTranslationCache(hass, "entry_1", max_entries=10)
+    cache.async_set(("a", "en", "es"), {"translatedText": "A"})
+    await cache.async_flush()
+
+    assert hass_storage[storage_key("entry_1")]["data"]["entries"] == stored
+
+
+async def test_persistent_cache_saves_lazily(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the delayed save writes the entries as they are when it runs.
+
+    Scheduling a save copies nothing; Store calls the data function on the
+    event loop once the delay expires.
+    """
+    cache = PersistentTranslationCache(hass, "entry_1", max_entries=10)
+    cache.async_set_fingerprint("abc")
+    await cache.async_get(KEY)
+
+    with patch.object(cache._store, "async_delay_save") as delay_save:
+        cache.async_set(("a", "en", "es"), {"translatedText": "A"})
+        data_func = delay_save.call_args.args[0]
+        cache.async_set(("b", "en", "es"), {"translatedText": "B"})
+
+    assert delay_save.call_count == 2
+    assert [entry[:4] for entry in data_func()["entries"]] == [
+        ["a", "en", "es", {"translatedText": "A"}],
+        ["b", "en", "es", {"translatedText": "B"}],
+    ]
+
+
+async def test_persistent_cache_ttl(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test stored entries expire by their write time, as in the memory tier."""
+    now = time.time()
+    hass_storage[storage_key("entry_1")] = _stored(
+        [
+            ["Hello", "en", "es", {"translatedText": "Hola"}, now - 100],
+            ["Bye", "en", "es", {"translatedText": "Adiós"}, now - 10],
+        ]
+    )
+    cache = PersistentTranslationCache(hass, "entry_1", max_entries=10, ttl=60)
+    cache.async_set_fingerprint("abc")
+
+    assert await cache.async_get(KEY) is None
+    result, age = await cache.async_get(("Bye", "en", "es"))
+    assert result == {"translatedText": "Adiós"}
+    assert 10 <= age < 20
+
+
+def test_cache_set_with_age_keeps_original_expiry():
+    """Test a promoted result expires when it would have in the first place."""
+    cache = TranslationCache(max_size=10, ttl=60)
+
+    with patch(
+        "custom_components.argos_translate.cache.time.monotonic",
+        side_effect=[1000.0, 1021.0],
+    ):
+        cache.set(KEY, {"translatedText": "Hola"}, age=40)
+        assert cache.get(KEY) is None
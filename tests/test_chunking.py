@@ -0,0 +1,61 @@
+"""Tests for splitting long texts into chunks."""
+
+from custom_components.argos_translate.chunking import split_text
+
+
+def test_split_packs_paragraphs_and_keeps_whitespace():
+    """Test paragraphs are packed up to max_chars and whitespace is kept verbatim."""
+    text = "  First paragraph.\n\n\tSecond paragraph.\r\n\r\nThird.\n"
+
+    chunked = split_text(text, max_chars=30)
+
+    assert chunked.chunks == ("First paragraph.", "Second paragraph.\r\n\r\nThird.")
+    assert chunked.separators == ("  ", "\n\n\t", "\n")
+    assert chunked.join(chunked.chunks) == text
+
+
+def test_split_keeps_hard_wrapped_lines_together():
+    """Test single line breaks are wrapping, not paragraph breaks."""
+    text = (
+        "Hi Anna,\nthanks for the notes from\nTuesday. I will send the\n"
+        "figures by Friday.\n\nBest,\nJo"
+    )
+
+    chunked = split_text(text, max_chars=60)
+
+    assert chunked.chunks == (
+        "Hi Anna,\nthanks for the notes from\nTuesday.",
+        "I will send the\nfigures by Friday.",
+        "Best,\nJo",
+    )
+    assert chunked.separators == ("", " ", "\n\n", "")
+    assert chunked.join(chunked.chunks) == text
+
+
+def test_split_long_paragraph_at_sentences():
+    """Test a long paragraph is packed with whole sentences up to max_chars."""
+    text = "One fish. Two fish! Red fish? Blue fish."
+
+    chunked = split_text(text, max_chars=20)
+
+    assert chunked.chunks == ("One fish. Two fish!", "Red fish? Blue fish.")
+    assert chunked.join(chunked.chunks) == text
+
+
+def test_split_long_sentence_at_words_then_cut():
+    """Test words are the fallback, and unbroken runs are cut."""
+    assert split_text("alpha beta gamma", max_chars=11).chunks == (
+        "alpha beta",
+        "gamma",
+    )
+    chunked = split_text("abcdefghijkl", max_chars=5)
+    assert chunked.chunks == ("abcde", "fghij", "kl")
+    assert chunked.join(chunked.chunks) == "abcdefghijkl"
+
+
+def test_split_blank_text():
+    """Test a text with nothing to translate has no chunks."""
+    chunked = split_text(" \n ", max_chars=5)
+
+    assert chunked.chunks == ()
+    assert chunked.join([]) == " \n "
@@ -0,0 +1,82 @@
+"""Tests for the Argos Translate circuit breaker."""
+
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.argos_translate.api import CannotConnectError, TranslationError
+from custom_components.argos_translate.circuit import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+MONOTONIC = "custom_components.argos_translate.circuit.time.monotonic"
+
+
+def _fail(breaker: CircuitBreaker) -> None:
+    """Make one call through the breaker that cannot connect."""
+    with pytest.raises(CannotConnectError), breaker.attempt():
+        raise CannotConnectError("timeout")
+
+
+def test_connection_error_opens_circuit():
+    """Test a connection failure opens the circuit and later calls fail fast."""
+    breaker = CircuitBreaker(reset_timeout=30)
+    with patch(MONOTONIC, return_value=1000.0):
+        _fail(breaker)
+        assert breaker.state == STATE_OPEN
+
+        with pytest.raises(CircuitOpenError), breaker.attempt():
+            pytest.fail("call should not go through")
+
+
+def test_http_error_keeps_circuit_closed():
+    """Test an HTTP 4xx counts as a live server."""
+    breaker = CircuitBreaker(reset_timeout=30)
+
+    with pytest.raises(TranslationError), breaker.attempt():
+        raise TranslationError("HTTP 400")
+
+    assert breaker.state == STATE_CLOSED
+
+
+def test_half_open_trial_closes_circuit():
+    """Test a single trial goes through after the timeout and closes the circuit."""
+    breaker = CircuitBreaker(reset_timeout=30)
+    with patch(MONOTONIC, return_value=1000.0):
+        _fail(breaker)
+
+    with patch(MONOTONIC, return_value=1030.0), breaker.attempt():
+        assert breaker.state == STATE_HALF_OPEN
+        # Only one trial at a time
+        with pytest.raises(CircuitOpenError), breaker.attempt():
+            pytest.fail("second trial should not go through")
+
+    assert breaker.state == STATE_CLOSED
+
+
+def test_failed_trial_reopens_circuit():
+    """Test a failed trial reopens the circuit with a fresh timeout."""
+    breaker = CircuitBreaker(reset_timeout=30)
+    with patch(MONOTONIC, return_value=1000.0):
+        _fail(breaker)
+    with patch(MONOTONIC, return_value=1030.0):
+        _fail(breaker)
+        assert breaker.state == STATE_OPEN
+    with patch(MONOTONIC, return_value=1059.0):
+        with pytest.raises(CircuitOpenError), breaker.attempt():
+            pytest.fail("call should not go through")
+
+
+def test_trip_while_open_keeps_timer():
+    """Test repeated trips do not postpone the next trial."""
+    breaker = CircuitBreaker(reset_timeout=30)
+    with patch(MONOTONIC, return_value=1000.0):
+        breaker.trip()
+    with patch(MONOTONIC, return_value=1020.0):
+        breaker.trip()
+    with patch(MONOTONIC, return_value=1030.0), breaker.attempt():
+        assert breaker.state == STATE_HALF_OPEN
@@ -14,7 +14,12 @@ from custom_components.argos_translate.config_flow import (
     InvalidAuth,
     NoLanguages,
 )
-from custom_components.argos_translate.const import CONF_USE_SSL, DOMAIN
+from custom_components.argos_translate.const import (
+    CONF_CACHE_SIZE,
+    CONF_CACHE_TTL,
+    CONF_USE_SSL,
+    DOMAIN,
+)
 
 
 async def test_form(hass: HomeAssistant, mock_setup_entry: AsyncMock) -> None:
@@ -212,6 +217,49 @@ async def test_options_flow(hass: HomeAssistant) -> None:
     mock_reload.assert_called_once_with(entry.entry_id)
 
 
+async def test_options_flow_tuning_options(hass: HomeAssistant) -> None:
+    """Test tuning settings are stored in entry.options, not entry.data."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_NAME: "My LibreTranslate",
+            CONF_HOST: "192.168.1.100",
+            CONF_PORT: 5000,
+            CONF_USE_SSL: False,
+            CONF_API_KEY: "",
+        },
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] == FlowResultType.FORM
+
+    with patch(
+        "custom_components.argos_translate.config_flow._async_validate_connection",
+        return_value=None,
+    ), patch.object(
+        hass.config_entries,
+        "async_reload",
+        return_value=True,
+    ):
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            user_input={
+                CONF_HOST: "192.168.1.100",
+                CONF_PORT: 5000,
+                CONF_USE_SSL: False,
+                CONF_API_KEY: "",
+                CONF_CACHE_SIZE: 50,
+                CONF_CACHE_TTL: 600,
+            },
+        )
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_CACHE_SIZE] == 50
+    assert entry.options[CONF_CACHE_TTL] == 600
+    assert CONF_CACHE_SIZE not in entry.data
+
+
 async def test_options_flow_no_reload_on_connection_error(hass: HomeAssistant) -> None:
     """Test that async_reload is NOT called when connection validation fails."""
     entry = MockConfigEntry(
@@ -1,33 +1,42 @@
 """Tests for Argos Translate coordinator."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from homeassistant.const import CONF_API_KEY, CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.argos_translate import async_setup_entry
 from custom_components.argos_translate.api import CannotConnectError
-from custom_components.argos_translate.const import CONF_USE_SSL, DOMAIN
+from custom_components.argos_translate.circuit import STATE_OPEN, CircuitOpenError
+from custom_components.argos_translate.const import (
+    CONF_CHUNK_SIZE,
+    CONF_DEDICATED_SESSION,
+    CONF_KEEPALIVE_TIMEOUT,
+    CONF_POOL_SIZE,
+    DEFAULT_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    RETRY_SCAN_INTERVAL,
+)
 from custom_components.argos_translate.coordinator import ArgosCoordinator
+from custom_components.argos_translate.languages import LanguageIndex
 
 
-async def test_coordinator_update(hass: HomeAssistant) -> None:
+async def test_coordinator_update(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
     """Test successful data refresh from mocked API client."""
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={
-            CONF_HOST: "192.168.1.100",
-            CONF_PORT: 5000,
-            CONF_API_KEY: "test-key",
-            CONF_NAME: "Test",
-            CONF_USE_SSL: False,
-        },
-    )
-    entry.add_to_hass(hass)
+    entry = mock_entry()
 
     mock_languages = [
         {"code": "en", "name": "English", "targets": ["es"]},
@@ -45,22 +54,17 @@ async def test_coordinator_update(hass: HomeAssistant) -> None:
     assert coordinator.data == {
         "languages": mock_languages,
         "language_count": 2,
+        "index": LanguageIndex.from_languages(mock_languages),
+        "version": coordinator.data["version"],
     }
+    assert len(coordinator.data["version"]) == 16
 
 
-async def test_coordinator_update_failed(hass: HomeAssistant) -> None:
+async def test_coordinator_update_failed(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
     """Test failed refresh sets last_update_success to False."""
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={
-            CONF_HOST: "192.168.1.100",
-            CONF_PORT: 5000,
-            CONF_API_KEY: "test-key",
-            CONF_NAME: "Test",
-            CONF_USE_SSL: False,
-        },
-    )
-    entry.add_to_hass(hass)
+    entry = mock_entry()
 
     with patch(
         "custom_components.argos_translate.coordinator.ArgosTranslateApiClient.async_get_languages",
@@ -71,3 +75,475 @@ async def test_coordinator_update_failed(hass: HomeAssistant) -> None:
         await coordinator.async_refresh()
 
     assert coordinator.last_update_success is False
+
+
+async def test_coordinator_translate_cached(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
+    """Test repeated translations are served from the cache without an API call."""
+    entry = mock_entry()
+
+    with patch(
+        "custom_components.argos_translate.coordinator.ArgosTranslateApiClient.async_translate",
+        new_callable=AsyncMock,
+        return_value={"translatedText": "Hola"},
+    ) as mock_translate:
+        coordinator = ArgosCoordinator(hass, entry)
+        first = await coordinator.async_translate("Hello", "en", "es")
+        second = await coordinator.async_translate("Hello", "en", "es")
+        await coordinator.async_translate("Hello", "en", "fr")
+
+    assert first == second == {"translatedText": "Hola"}
+    assert mock_translate.await_count == 2
+
+
+async def test_coordinator_cache_cleared_on_language_change(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
+    """Test the translation cache is invalidated when installed languages change."""
+    entry = mock_entry()
+
+    languages = [
+        {"code": "en", "name": "English", "targets": ["es"]},
+        {"code": "es", "name": "Spanish", "targets": ["en"]},
+    ]
+    mock_get_languages = AsyncMock(return_value=languages)
+
+    with patch(
+        "custom_components.argos_translate.coordinator.ArgosTranslateApiClient.async_get_languages",
+        mock_get_languages,
+    ):
+        coordinator = ArgosCoordinator(hass, entry)
+        await coordinator.async_refresh()
+        coordinator.cache.set(("Hello", "en", "es"), {"translatedText": "Hola"})
+
+        # Unchanged language set keeps the cache
+        await coordinator.async_refresh()
+        assert len(coordinator.cache) == 1
+
+        # A newly installed pair invalidates it
+        mock_get_languages.return_value = [
+            {"code": "en", "name": "English", "targets": ["es", "fr"]},
+            *languages[1:],
+        ]
+        await coordinator.async_refresh()
+        assert len(coordinator.cache) == 0
+
+
+async def test_coordinator_translate_chunked(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
+    """Test long texts are translated chunk by chunk and reassembled."""
+    entry = mock_entry({CONF_CHUNK_SIZE: 20})
+
+    async def _translate(text: str, source: str, target: str) -> dict[str, Any]:
+        return {
+            "translatedText": text.upper(),
+            "detectedLanguage": {"language": "en", "confidence": 90.0},
+        }
+
+    with patch(
+        "custom_components.argos_translate.coordinator.ArgosTranslateApiClient.async_translate",
+        side_effect=_translate,
+    ) as mock_translate:
+        coordinator = ArgosCoordinator(hass, entry)
+        result = await coordinator.async_translate(
+            "First paragraph.\n\n  Second paragraph.\nThird.", "auto", "es"
+        )
+        assert result == {
+            "translatedText": "FIRST PARAGRAPH.\n\n  SECOND PARAGRAPH.\nTHIRD.",
+            "detectedLanguage": {"language": "en", "confidence": 90.0},
+        }
+        assert mock_translate.call_count == 3
+
+        # Only the edited chunk goes back to the server
+        result = await coordinator.async_translate(
+            "First paragraph.\n\n  Second paragraph.\nFourth.", "auto", "es"
+        )
+        assert result["translatedText"].endswith("\nFOURTH.")
+        assert mock_translate.call_count == 4
+        assert mock_translate.call_args.args == ("Fourth.", "auto", "es")
+
+
+async def test_coordinator_translate_persistent_cache(
+    hass: HomeAssistant,
+    hass_storage: dict,
+    mock_entry: Callable[..., MockConfigEntry],
+) -> None:
+    """Test translations survive a coordinator rebuild via the persistent cache."""
+    entry = mock_entry()
+
+    with patch(
+        "custom_components.argos_translate.coordinator.ArgosTranslateApiClient.async_translate",
+        new_callable=AsyncMock,
+        return_value={"translatedText": "Hola"},
+    ) as mock_translate:
+        coordinator = ArgosCoordinator(hass, entry)
+        await coordinator.async_translate("Hello", "en", "es")
+        await coordinator.async_shutdown()
+
+        # A fresh coordinator (e.g. after a reload) starts with an empty memory cache
+        coordinator = ArgosCoordinator(hass, entry)
+        result = await coordinator.async_translate("Hello", "en", "es")
+
+    assert result == {"translatedText": "Hola"}
+    assert mock_translate.await_count == 1
+
+
+async def test_coordinator_translate_many(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
+    """Test batch translation sends only uncached distinct texts, in order."""
+    entry = mock_entry()
+
+    with patch(
+        "custom_components.argos_translate.coordinator.ArgosTranslateApiClient.async_translate_many",
+        new_callable=AsyncMock,
+        return_value=[{"translatedText": "Uno"}, {"translatedText": "Tres"}],
+    ) as mock_translate_many:
+        coordinator = ArgosCoordinator(hass, entry)
+        coordinator.cache.set(("two", "en", "es"), {"translatedText": "Dos"})
+        results = await coordinator.async_translate_many(
+            ["one", "two", "three", "one"], "en", "es"
+        )
+
+    assert [result["translatedText"] for result in results] == [
+        "Uno",
+        "Dos",
+        "Tres",
+        "Uno",
+    ]
+    mock_translate_many.assert_awaited_once_with(["one", "three"], "en", "es", 25)
+    assert coordinator.cache.get(("three", "en", "es")) == {"translatedText": "Tres"}
+
+
+async def test_coordinator_coalesces_identical_requests(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
+    """Test concurrent identical translate/detect calls share one API request."""
+    entry = mock_entry()
+
+    release = asyncio.Event()
+
+    async def _translate(text, source, target):
+        await release.wait()
+        return {"translatedText": f"{text}:{target}"}
+
+    async def _detect(text):
+        await release.wait()
+        return [{"language": "fr", "confidence": 90.0}]
+
+    with patch(
+        "custom_components.argos_translate.coordinator.ArgosTranslateApiClient.async_translate",
+        side_effect=_translate,
+    ) as mock_translate, patch(
+        "custom_components.argos_translate.coordinator.ArgosTranslateApiClient.async_detect_languages",
+        side_effect=_detect,
+    ) as mock_detect:
+        coordinator = ArgosCoordinator(hass, entry)
+        calls = asyncio.gather(
+            coordinator.async_translate("Bonjour", "fr", "en"),
+            coordinator.async_translate("Bonjour", "fr", "en"),
+            coordinator.async_translate("Bonjour", "fr", "es"),
+            coordinator.async_detect_languages("Bonjour"),
+            coordinator.async_detect_languages("Bonjour"),
+        )
+        await asyncio.sleep(0)
+        release.set()
+        results = await calls
+
+    assert results[0] == results[1] == {"translatedText": "Bonjour:en"}
+    assert results[2] == {"translatedText": "Bonjour:es"}
+    assert results[3] == results[4]
+    assert mock_translate.call_count == 2
+    assert mock_detect.call_count == 1
+
+
+async def test_coordinator_has_translation(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
+    """Test a result counts as available while in flight and once cached."""
+    entry = mock_entry({CONF_CHUNK_SIZE: 20})
+
+    release = asyncio.Event()
+
+    async def _translate(text, source, target):
+        await release.wait()
+        return {"translatedText": text.upper()}
+
+    with patch(
+        "custom_components.argos_translate.coordinator.ArgosTranslateApiClient.async_translate",
+        side_effect=_translate,
+    ):
+        coordinator = ArgosCoordinator(hass, entry)
+        assert not coordinator.has_translation("Bonjour", "fr", "en")
+
+        call = hass.async_create_task(
+            coordinator.async_translate("Bonjour", "fr", "en")
+        )
+        await asyncio.sleep(0)
+        assert coordinator.has_translation("Bonjour", "fr", "en")
+        release.set()
+        await call
+
+        assert coordinator.has_translation("Bonjour", "fr", "en")
+        assert not coordinator.has_translation("Bonjour", "fr", "es")
+        # A chunked text needs every chunk
+        text = "Bonjour\n\nAu revoir, à demain."
+        assert not coordinator.has_translation(text, "fr", "en")
+        await coordinator.async_translate("Au revoir, à demain.", "fr", "en")
+        assert coordinator.has_translation(text, "fr", "en")
+
+
+async def test_coordinator_coalesced_error_shared(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
+    """Test a failing coalesced request raises for every waiting caller."""
+    entry = mock_entry()
+
+    release = asyncio.Event()
+
+    async def _detect(text):
+        await release.wait()
+        raise CannotConnectError("Connection refused")
+
+    with patch(
+        "custom_components.argos_translate.coordinator.ArgosTranslateApiClient.async_detect_languages",
+        side_effect=_detect,
+    ) as mock_detect:
+        coordinator = ArgosCoordinator(hass, entry)
+        calls = asyncio.gather(
+            coordinator.async_detect_languages("Bonjour"),
+            coordinator.async_detect_languages("Bonjour"),
+            return_exceptions=True,
+        )
+        await asyncio.sleep(0)
+        release.set()
+        results = await calls
+
+    assert all(isinstance(result, CannotConnectError) for result in results)
+    assert mock_detect.call_count == 1
+
+
+async def test_coordinator_dedicated_session(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
+    """Test the dedicated session option creates and closes its own pool."""
+    entry = mock_entry(
+        {
+            CONF_DEDICATED_SESSION: True,
+            CONF_POOL_SIZE: 4,
+            CONF_KEEPALIVE_TIMEOUT: 120,
+        }
+    )
+
+    coordinator = ArgosCoordinator(hass, entry)
+    session = coordinator.client._session
+
+    assert session is not async_get_clientsession(hass)
+    assert session.connector.limit == 4
+
+    await coordinator.async_close_session()
+    assert session.closed
+
+
+async def test_dedicated_session_closed_on_stop(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
+    """Test the dedicated session is closed when Home Assistant stops."""
+    entry = mock_entry({CONF_DEDICATED_SESSION: True})
+    entry.mock_state(hass, ConfigEntryState.SETUP_IN_PROGRESS)
+
+    with (
+        patch(
+            "custom_components.argos_translate.coordinator.ArgosTranslateApiClient.async_get_languages",
+            return_value=[],
+        ),
+        patch.object(hass.config_entries, "async_forward_entry_setups"),
+    ):
+        assert await async_setup_entry(hass, entry)
+    session = entry.runtime_data.coordinator.client._session
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+
+    assert session.closed
+
+
+async def test_coordinator_shared_session_not_closed(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
+    """Test the shared HA session is used by default and never closed."""
+    entry = mock_entry()
+
+    coordinator = ArgosCoordinator(hass, entry)
+    await coordinator.async_close_session()
+
+    assert coordinator.client._session is async_get_clientsession(hass)
+    assert not coordinator.client._session.closed
+
+
+async def test_coordinator_adaptive_interval(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
+    """Test polling backs off while unchanged and speeds up after a failure."""
+    entry = mock_entry()
+    languages = [{"code": "en", "name": "English", "targets": ["es"]}]
+
+    with patch(
+        "custom_components.argos_translate.coordinator.ArgosTranslateApiClient.async_get_languages",
+        new_callable=AsyncMock,
+        return_value=languages,
+    ) as mock_languages:
+        coordinator = ArgosCoordinator(hass, entry)
+        listener = MagicMock()
+        unsub = coordinator.async_add_listener(listener)
+
+        await coordinator.async_refresh()
+        data = coordinator.data
+        assert coordinator.update_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+        assert listener.call_count == 1
+
+        # Unchanged payload: same data object, no listener update, slower polling
+        await coordinator.async_refresh()
+        assert coordinator.data is data
+        assert listener.call_count == 1
+        assert coordinator.update_interval == timedelta(
+            seconds=DEFAULT_SCAN_INTERVAL * 2
+        )
+        for _ in range(10):
+            await coordinator.async_refresh()
+        assert coordinator.update_interval == timedelta(seconds=MAX_SCAN_INTERVAL)
+
+        # Failure: poll quickly until the server is back
+        mock_languages.side_effect = CannotConnectError("refused")
+        await coordinator.async_refresh()
+        assert not coordinator.last_update_success
+        assert coordinator.update_interval == timedelta(seconds=RETRY_SCAN_INTERVAL)
+
+        # Recovery with the same payload resets the interval
+        mock_languages.side_effect = None
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        assert coordinator.data is data
+        assert coordinator.update_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+        # Changed payload: new data, listeners notified
+        calls = listener.call_count
+        mock_languages.return_value = [
+            *languages,
+            {"code": "es", "name": "Spanish", "targets": ["en"]},
+        ]
+        await coordinator.async_refresh()
+        assert coordinator.data is not data
+        assert coordinator.data["language_count"] == 2
+        assert listener.call_count == calls + 1
+        unsub()
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_set_update_error_polls_soon(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
+    """Test a failed service call shortens the poll interval once."""
+    entry = mock_entry()
+    coordinator = ArgosCoordinator(hass, entry)
+    coordinator.update_interval = timedelta(seconds=MAX_SCAN_INTERVAL)
+
+    coordinator.async_set_update_error(CannotConnectError("refused"))
+
+    assert not coordinator.last_update_success
+    assert coordinator.update_interval == timedelta(seconds=RETRY_SCAN_INTERVAL)
+
+
+async def test_coordinator_probe(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
+    """Test the health probe flips status within one probe of outage or recovery."""
+    entry = mock_entry()
+    languages = [{"code": "en", "name": "English", "targets": ["es"]}]
+
+    with (
+        patch(
+            "custom_components.argos_translate.coordinator.ArgosTranslateApiClient.async_get_languages",
+            new_callable=AsyncMock,
+            return_value=languages,
+        ) as mock_languages,
+        patch(
+            "custom_components.argos_translate.coordinator.ArgosTranslateApiClient.async_probe",
+            new_callable=AsyncMock,
+        ) as mock_probe,
+    ):
+        coordinator = ArgosCoordinator(hass, entry)
+        await coordinator.async_refresh()
+        assert mock_languages.await_count == 1
+
+        # Healthy probe: latency recorded, no extra /languages fetch
+        await coordinator.async_probe()
+        assert coordinator.last_update_success
+        assert coordinator.probe_latency is not None
+        assert mock_languages.await_count == 1
+
+        # Outage: offline immediately
+        mock_probe.side_effect = CannotConnectError("timeout")
+        await coordinator.async_probe()
+        assert not coordinator.last_update_success
+        assert coordinator.probe_latency is None
+
+        # Recovery: a full refresh brings the status back online
+        mock_probe.side_effect = None
+        await coordinator.async_probe()
+        assert coordinator.last_update_success
+        assert mock_languages.await_count == 2
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_circuit_fails_fast(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
+    """Test calls fail fast without reaching the server while it is down."""
+    entry = mock_entry()
+
+    with (
+        patch(
+            "custom_components.argos_translate.coordinator.ArgosTranslateApiClient.async_translate",
+            new_callable=AsyncMock,
+            side_effect=CannotConnectError("timeout"),
+        ) as mock_translate,
+        patch(
+            "custom_components.argos_translate.coordinator.ArgosTranslateApiClient.async_get_languages",
+            new_callable=AsyncMock,
+            return_value=[{"code": "en", "name": "English", "targets": ["es"]}],
+        ),
+    ):
+        coordinator = ArgosCoordinator(hass, entry)
+        with pytest.raises(CannotConnectError):
+            await coordinator.async_translate("Hello", "en", "es")
+        assert coordinator.breaker.state == STATE_OPEN
+
+        with pytest.raises(CircuitOpenError):
+            await coordinator.async_detect_languages("Hello")
+        with pytest.raises(CircuitOpenError):
+            await coordinator.async_translate("Goodbye", "en", "es")
+        assert mock_translate.await_count == 1
+
+        # A successful refresh means the server is back
+        mock_translate.side_effect = None
+        mock_translate.return_value = {"translatedText": "Adiós"}
+        await coordinator.async_refresh()
+        assert await coordinator.async_translate("Goodbye", "en", "es") == {
+            "translatedText": "Adiós"
+        }
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_update_error_opens_circuit(
+    hass: HomeAssistant, mock_entry: Callable[..., MockConfigEntry]
+) -> None:
+    """Test marking the server offline also opens its circuit."""
+    entry = mock_entry()
+    coordinator = ArgosCoordinator(hass, entry)
+
+    coordinator.async_set_update_error(CannotConnectError("refused"))
+
+    assert coordinator.breaker.state == STATE_OPEN
@@ -0,0 +1,41 @@
+"""Tests for Argos Translate diagnostics."""
+
+from unittest.mock import MagicMock
+
+from homeassistant.const import CONF_API_KEY
+from homeassistant.core import HomeAssistant
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.argos_translate.const import CONF_RETRIES
+from custom_components.argos_translate.coordinator import ArgosCoordinator
+from custom_components.argos_translate.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+async def test_diagnostics(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test diagnostics report request stats and redact the API key."""
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry,
+        data={**mock_config_entry.data, CONF_API_KEY: "secret"},
+        options={CONF_RETRIES: 3},
+    )
+    coordinator = ArgosCoordinator(hass, mock_config_entry)
+    coordinator.client.retry_count = 4
+    coordinator.client.retry_exhausted_count = 1
+    coordinator.client.metrics.record("/translate", 0.2, chars=30)
+    mock_config_entry.runtime_data = MagicMock(coordinator=coordinator)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+
+    assert diagnostics["entry"]["data"][CONF_API_KEY] == "**REDACTED**"
+    assert diagnostics["entry"]["options"] == {CONF_RETRIES: 3}
+    assert diagnostics["server"]["circuit"] == "closed"
+    assert diagnostics["requests"]["retries"] == 4
+    assert diagnostics["requests"]["retries_exhausted"] == 1
+    assert diagnostics["endpoints"]["/translate"]["chars_per_minute"] == 30
+    assert diagnostics["cache"] == {"size": 0, "hits": 0, "misses": 0}
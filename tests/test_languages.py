@@ -0,0 +1,72 @@
+"""Tests for the Argos Translate language index."""
+
+import pytest
+
+from custom_components.argos_translate.languages import EMPTY_INDEX, LanguageIndex
+
+MOCK_LANGUAGES = [
+    {"code": "en", "name": "English", "targets": ["es", "fr"]},
+    {"code": "es", "name": "Spanish", "targets": ["en"]},
+    {"code": "fr", "name": "French", "targets": ["en", "es"]},
+]
+
+
+def test_index_lookups():
+    """Test the index answers installed, target and name lookups."""
+    index = LanguageIndex.from_languages(MOCK_LANGUAGES)
+
+    assert "en" in index.languages
+    assert "de" not in index.languages
+    assert index.targets["en"] == frozenset({"es", "fr"})
+    assert index.name("fr") == "French"
+    assert index.name("de") == "de"
+
+
+def test_index_is_immutable():
+    """Test the index tables cannot be modified by callers."""
+    index = LanguageIndex.from_languages(MOCK_LANGUAGES)
+
+    with pytest.raises(TypeError):
+        index.targets["de"] = frozenset()  # type: ignore[index]
+
+
+def test_empty_index():
+    """Test the empty index knows no languages."""
+    assert EMPTY_INDEX.targets.get("en") is None
+    assert EMPTY_INDEX.name("en") == "en"
+
+
+def test_merge_unions_languages_and_targets():
+    """Test merging keeps every language and unions the targets of each."""
+    european = LanguageIndex.from_languages(MOCK_LANGUAGES)
+    cjk = LanguageIndex.from_languages(
+        [
+            {"code": "en", "name": "English", "targets": ["ja", "zh"]},
+            {"code": "ja", "name": "Japanese", "targets": ["en"]},
+        ]
+    )
+
+    merged = LanguageIndex.merge([european, cjk])
+
+    assert merged.targets["en"] == frozenset({"es", "fr", "ja", "zh"})
+    assert merged.targets["ja"] == frozenset({"en"})
+    assert merged.name("ja") == "Japanese"
+    assert "es" in merged.languages
+
+
+def test_path_direct_and_pivot():
+    """Test path returns the direct pair or the shortest chain through pivots."""
+    index = LanguageIndex.from_languages(
+        [
+            {"code": "de", "name": "German", "targets": ["en"]},
+            {"code": "en", "name": "English", "targets": ["de", "ja"]},
+            {"code": "ja", "name": "Japanese", "targets": ["en"]},
+            {"code": "ko", "name": "Korean", "targets": []},
+        ]
+    )
+
+    assert index.path("de", "en") == ("de", "en")
+    assert index.path("de", "ja") == ("de", "en", "ja")
+    assert index.path("ja", "de") == ("ja", "en", "de")
+    assert index.path("de", "ko") is None
+    assert index.path("xx", "en") is None
@@ -0,0 +1,89 @@
+"""Tests for the request latency and throughput metrics."""
+
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.argos_translate.metrics import (
+    EndpointMetrics,
+    LatencyHistogram,
+    RequestMetrics,
+)
+
+
+@pytest.fixture
+def clock():
+    """Control the monotonic clock the metrics read."""
+    now = [1_000_000.0]
+    with patch(
+        "custom_components.argos_translate.metrics.time.monotonic",
+        side_effect=lambda: now[0],
+    ):
+        yield now
+
+
+def test_histogram_percentiles_within_bucket_error():
+    """Test percentiles land within one bucket (9%) above the true value."""
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+
+    for fraction, expected in ((0.5, 0.5), (0.95, 0.95), (0.99, 0.99)):
+        value = histogram.percentile(fraction)
+        assert expected <= value <= expected * 1.091
+
+
+def test_histogram_fixed_memory():
+    """Test the histogram does not grow with the number of samples."""
+    histogram = LatencyHistogram()
+    size = len(histogram.counts)
+    for _ in range(10_000):
+        histogram.record(0.25)
+    histogram.record(0.0)
+    histogram.record(3600.0)
+
+    assert len(histogram.counts) == size
+    assert histogram.total == 10_002
+    assert histogram.percentile(1.0) >= 120
+    assert LatencyHistogram().percentile(0.5) is None
+
+
+def test_rates_and_error_rate(clock: list[float]):
+    """Test rates are per minute of window and errors are excluded from latency."""
+    metrics = EndpointMetrics(window=5)
+    clock[0] += 120
+    for _ in range(9):
+        metrics.record(0.1, chars=100)
+    metrics.record(30.0, error=True)
+
+    snapshot = metrics.snapshot()
+
+    # Two minutes since startup
+    assert snapshot.requests_per_minute == 5
+    assert snapshot.chars_per_minute == 450
+    assert snapshot.error_rate == 10
+    assert snapshot.p99 < 0.11
+
+
+def test_old_minutes_leave_the_window(clock: list[float]):
+    """Test requests older than the window no longer count."""
+    metrics = EndpointMetrics(window=5)
+    metrics.record(2.0)
+    clock[0] += 4 * 60
+    metrics.record(0.2)
+    assert metrics.snapshot().p99 >= 2
+
+    clock[0] += 2 * 60
+    snapshot = metrics.snapshot()
+
+    assert snapshot.p99 < 0.25
+    assert snapshot.requests_per_minute == pytest.approx(1 / 5, rel=0.25)
+
+
+def test_unknown_endpoint_is_empty():
+    """Test an endpoint never called reports no latency and zero rates."""
+    snapshot = RequestMetrics().snapshot("/translate")
+
+    assert snapshot.p50 is None
+    assert snapshot.error_rate is None
+    assert snapshot.requests_per_minute == 0
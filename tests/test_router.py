@@ -0,0 +1,195 @@
+"""Tests for routing service calls across several LibreTranslate servers."""
+
+from collections import Counter
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.argos_translate.api import CannotConnectError, TranslationError
+from custom_components.argos_translate.const import (
+    STRATEGY_LEAST_OUTSTANDING,
+    STRATEGY_ROUND_ROBIN,
+)
+from custom_components.argos_translate.languages import LanguageIndex
+from custom_components.argos_translate.router import (
+    RoutingTable,
+    ServerRouter,
+    async_call_with_failover,
+)
+from custom_components.argos_translate.scheduler import RequestScheduler
+
+
+EUROPEAN = [
+    {"code": "en", "name": "English", "targets": ["de", "fr"]},
+    {"code": "de", "name": "German", "targets": ["en"]},
+    {"code": "fr", "name": "French", "targets": ["en"]},
+]
+CJK = [
+    {"code": "en", "name": "English", "targets": ["ja", "zh"]},
+    {"code": "ja", "name": "Japanese", "targets": ["en"]},
+    {"code": "zh", "name": "Chinese", "targets": ["en"]},
+]
+
+
+def _server(
+    entry_id: str,
+    weight: int = 1,
+    healthy: bool = True,
+    languages: list[dict] | None = None,
+) -> MagicMock:
+    """Return a stand-in coordinator for one server."""
+    coordinator = MagicMock()
+    coordinator.data = {"index": LanguageIndex.from_languages(languages or [])}
+    coordinator.config_entry.entry_id = entry_id
+    coordinator.config_entry.title = entry_id
+    coordinator.weight = weight
+    coordinator.last_update_success = healthy
+    coordinator.scheduler = RequestScheduler(max_concurrent=2)
+    return coordinator
+
+
+def test_round_robin_follows_weights():
+    """Test weighted round-robin interleaves servers in proportion to weight."""
+    router = ServerRouter()
+    a, b = _server("a", weight=3), _server("b", weight=1)
+
+    picks = [router.order([a, b], STRATEGY_ROUND_ROBIN)[0] for _ in range(8)]
+
+    assert Counter(p.config_entry.entry_id for p in picks) == {"a": 6, "b": 2}
+    # Smooth: picks are interleaved rather than a, a, a, b
+    assert [p.config_entry.entry_id for p in picks[:4]] == ["a", "a", "b", "a"]
+
+
+def test_least_outstanding_prefers_idle_server():
+    """Test the server with the fewest in-flight calls per weight goes first."""
+    router = ServerRouter()
+    busy, idle = _server("busy"), _server("idle")
+    busy.scheduler.in_flight = 2
+
+    order = router.order([busy, idle], STRATEGY_LEAST_OUTSTANDING)
+
+    assert order == [idle, busy]
+
+
+def test_least_outstanding_ties_rotate():
+    """Test equally loaded servers take turns."""
+    router = ServerRouter()
+    a, b = _server("a"), _server("b")
+
+    picks = [router.order([a, b], STRATEGY_LEAST_OUTSTANDING)[0] for _ in range(4)]
+
+    assert picks == [a, b, a, b]
+
+
+def test_unhealthy_servers_skipped():
+    """Test servers whose status is offline are not used while others are up."""
+    router = ServerRouter()
+    up, down = _server("up"), _server("down", healthy=False)
+
+    assert router.order([down, up], STRATEGY_ROUND_ROBIN) == [up]
+
+
+def test_all_unhealthy_tries_every_server():
+    """Test every server is tried when none is marked healthy."""
+    router = ServerRouter()
+    a, b = _server("a", healthy=False), _server("b", healthy=False)
+
+    assert set(router.order([a, b], STRATEGY_LEAST_OUTSTANDING)) == {a, b}
+
+
+def test_server_with_result_preferred():
+    """Test a server that can answer from its cache goes first, whatever the load."""
+    router = ServerRouter()
+    a, b = _server("a"), _server("b")
+    b.scheduler.in_flight = 2
+
+    for _ in range(3):
+        order = router.order([a, b], STRATEGY_LEAST_OUTSTANDING, lambda c: c is b)
+        assert order == [b, a]
+    # Without a holder the strategy applies again
+    assert router.order([a, b], STRATEGY_LEAST_OUTSTANDING, lambda c: False) == [a, b]
+
+
+def test_routing_table_maps_pairs_to_servers():
+    """Test each pair is served only by the servers that have it installed."""
+    european = _server("european", languages=EUROPEAN)
+    cjk = _server("cjk", languages=CJK)
+
+    table = RoutingTable.from_coordinators([european, cjk])
+
+    assert table.supporting([european, cjk], "en", "ja") == [cjk]
+    assert table.supporting([european, cjk], "de", "en") == [european]
+    assert table.supporting([european, cjk], "ja", "de") == []
+    assert table.index.targets["en"] == frozenset({"de", "fr", "ja", "zh"})
+
+
+def test_routing_table_servers_by_target():
+    """Test auto-detect calls can find every server that translates into a target."""
+    european = _server("european", languages=EUROPEAN)
+    cjk = _server("cjk", languages=CJK)
+
+    table = RoutingTable.from_coordinators([european, cjk])
+
+    assert table.targeting([european, cjk], "ja") == [cjk]
+    assert table.targeting([european, cjk], "en") == [european, cjk]
+    assert table.targeting([european, cjk], "es") == []
+
+
+def test_routing_table_rebuilt_on_new_index():
+    """Test the table is reused until a server refreshes to new languages."""
+    router = ServerRouter()
+    european = _server("european", languages=EUROPEAN)
+    cjk = _server("cjk", languages=CJK)
+
+    table = router.routing_table([european, cjk])
+    assert router.routing_table([european, cjk]) is table
+
+    cjk.data = {"index": LanguageIndex.from_languages(CJK[:2])}
+    rebuilt = router.routing_table([european, cjk])
+    assert rebuilt is not table
+    assert ("zh", "en") not in rebuilt.servers
+
+
+async def test_failover_on_connection_error():
+    """Test an unreachable server is marked offline and the next one answers."""
+    a, b = _server("a"), _server("b")
+    a.async_translate = AsyncMock(side_effect=CannotConnectError("refused"))
+    b.async_translate = AsyncMock(return_value={"translatedText": "Hola"})
+
+    result = await async_call_with_failover(
+        [a, b], lambda c: c.async_translate("Hello", "en", "es")
+    )
+
+    assert result == {"translatedText": "Hola"}
+    a.async_set_update_error.assert_called_once()
+    b.async_set_update_error.assert_not_called()
+
+
+async def test_failover_all_unreachable():
+    """Test the last error is raised once every server has failed."""
+    a, b = _server("a"), _server("b")
+    a.async_translate = AsyncMock(side_effect=CannotConnectError("refused"))
+    b.async_translate = AsyncMock(side_effect=CannotConnectError("timeout"))
+
+    with pytest.raises(CannotConnectError, match="timeout"):
+        await async_call_with_failover(
+            [a, b], lambda c: c.async_translate("Hello", "en", "es")
+        )
+
+    a.async_set_update_error.assert_called_once()
+    b.async_set_update_error.assert_called_once()
+
+
+async def test_no_failover_on_http_error():
+    """Test an HTTP 4xx is raised straight away — the server is reachable."""
+    a, b = _server("a"), _server("b")
+    a.async_translate = AsyncMock(side_effect=TranslationError("HTTP 400"))
+    b.async_translate = AsyncMock(return_value={"translatedText": "Hola"})
+
+    with pytest.raises(TranslationError):
+        await async_call_with_failover(
+            [a, b], lambda c: c.async_translate("Hello", "en", "es")
+        )
+
+    b.async_translate.assert_not_called()
+    a.async_set_update_error.assert_not_called()
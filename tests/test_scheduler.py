@@ -0,0 +1,101 @@
+"""Tests for the Argos Translate request scheduler."""
+
+import asyncio
+
+import pytest
+
+from custom_components.argos_translate.scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    RequestScheduler,
+)
+
+
+async def test_scheduler_caps_concurrency() -> None:
+    """Test no more than max_concurrent calls hold a slot at once."""
+    scheduler = RequestScheduler(max_concurrent=2)
+    release = asyncio.Event()
+    peak = 0
+
+    async def _call() -> None:
+        nonlocal peak
+        async with scheduler.slot():
+            peak = max(peak, scheduler.in_flight)
+            await release.wait()
+
+    tasks = [asyncio.create_task(_call()) for _ in range(5)]
+    await asyncio.sleep(0)
+
+    assert scheduler.in_flight == 2
+    assert scheduler.queue_depth == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert peak == 2
+    assert scheduler.in_flight == 0
+    assert scheduler.queue_depth == 0
+
+
+async def test_scheduler_interactive_first() -> None:
+    """Test queued interactive calls run before earlier background calls."""
+    scheduler = RequestScheduler(max_concurrent=1)
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def _call(name: str, priority: int) -> None:
+        async with scheduler.slot(priority):
+            order.append(name)
+            await release.wait()
+
+    blocker = asyncio.create_task(_call("blocker", PRIORITY_BACKGROUND))
+    await asyncio.sleep(0)
+    queued = [
+        asyncio.create_task(_call("batch-1", PRIORITY_BACKGROUND)),
+        asyncio.create_task(_call("batch-2", PRIORITY_BACKGROUND)),
+        asyncio.create_task(_call("card", PRIORITY_INTERACTIVE)),
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(blocker, *queued)
+
+    assert order == ["blocker", "card", "batch-1", "batch-2"]
+
+
+async def test_scheduler_cancelled_waiter_leaves_queue() -> None:
+    """Test a cancelled waiter is removed and does not consume a slot."""
+    scheduler = RequestScheduler(max_concurrent=1)
+    release = asyncio.Event()
+
+    async def _call() -> None:
+        async with scheduler.slot():
+            await release.wait()
+
+    running = asyncio.create_task(_call())
+    await asyncio.sleep(0)
+    waiting = asyncio.create_task(_call())
+    await asyncio.sleep(0)
+    assert scheduler.queue_depth == 1
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert scheduler.queue_depth == 0
+
+    release.set()
+    await running
+    assert scheduler.in_flight == 0
+
+
+async def test_scheduler_records_wait() -> None:
+    """Test queue wait time is tracked for queued calls."""
+    scheduler = RequestScheduler(max_concurrent=1)
+
+    async def _call(delay: float) -> None:
+        async with scheduler.slot():
+            await asyncio.sleep(delay)
+
+    await asyncio.gather(_call(0.05), _call(0))
+
+    assert scheduler.last_wait >= 0.04
+    assert scheduler.average_wait > 0
@@ -3,12 +3,27 @@
 from unittest.mock import MagicMock
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers.json import json_bytes
 
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    MockEntityPlatform,
+)
 
 from custom_components.argos_translate.binary_sensor import ArgosStatusSensor
-from custom_components.argos_translate.const import DOMAIN
-from custom_components.argos_translate.sensor import ArgosLanguageCountSensor
+from custom_components.argos_translate.circuit import CircuitBreaker
+from custom_components.argos_translate.const import CONF_MINIMAL_ATTRIBUTES, DOMAIN
+from custom_components.argos_translate.scheduler import RequestScheduler
+from custom_components.argos_translate.metrics import RequestMetrics
+from custom_components.argos_translate.sensor import (
+    METRIC_SENSORS,
+    ArgosLanguageCountSensor,
+    ArgosMetricSensor,
+    ArgosQueueSensor,
+)
 
 MOCK_LANGUAGES = [
     {"code": "en", "name": "English", "targets": ["es"]},
@@ -23,11 +38,13 @@ def _make_coordinator(languages=None, success=True):
 
     coordinator = MagicMock()
     coordinator.last_update_success = success
+    coordinator.chunk_size = 1000
 
     if success:
         coordinator.data = {
             "languages": languages,
             "language_count": len(languages),
+            "version": "0123456789abcdef",
         }
     else:
         coordinator.data = None
@@ -35,11 +52,12 @@ def _make_coordinator(languages=None, success=True):
     return coordinator
 
 
-def _make_entry(entry_id="test_entry_123"):
+def _make_entry(entry_id="test_entry_123", options=None):
     """Create a mock config entry."""
     return MockConfigEntry(
         domain=DOMAIN,
         data={},
+        options=options or {},
         entry_id=entry_id,
     )
 
@@ -57,16 +75,61 @@ def test_language_count_value():
 
 
 def test_language_count_attributes():
-    """Test language count sensor returns language details as attributes."""
+    """Test language count sensor summarizes the catalog in its attributes."""
     coordinator = _make_coordinator()
     entry = _make_entry()
     sensor = ArgosLanguageCountSensor(coordinator, entry)
 
     attrs = sensor.extra_state_attributes
-    assert attrs is not None
-    assert attrs["languages"] == ["English", "Spanish"]
-    assert attrs["language_codes"] == ["en", "es"]
-    assert attrs["language_targets"] == {"en": ["es"], "es": ["en"]}
+    assert attrs == {
+        "language_codes": ["en", "es"],
+        "pair_count": 2,
+        "catalog_version": "0123456789abcdef",
+        "chunk_size": 1000,
+    }
+
+
+def test_language_count_minimal_attributes():
+    """Test the minimal option drops the language code list."""
+    coordinator = _make_coordinator()
+    entry = _make_entry(options={CONF_MINIMAL_ATTRIBUTES: True})
+    sensor = ArgosLanguageCountSensor(coordinator, entry)
+
+    assert sensor.extra_state_attributes == {
+        "pair_count": 2,
+        "catalog_version": "0123456789abcdef",
+        "chunk_size": 1000,
+    }
+
+
+async def test_language_count_recorded_attribute_size(hass: HomeAssistant) -> None:
+    """Test the language codes are kept out of each recorded state write.
+
+    With 40 installed languages the state carries about 430 bytes of
+    attributes, of which the recorder stores under 200 (the unit, icon,
+    name, pair count and catalog version), whatever the number of languages.
+    """
+    languages = [
+        {"code": f"l{i:02}", "name": f"Language {i}", "targets": ["en"]}
+        for i in range(40)
+    ]
+    sensor = ArgosLanguageCountSensor(_make_coordinator(languages), _make_entry())
+    platform = MockEntityPlatform(hass, domain="sensor", platform_name=DOMAIN)
+    await platform.async_add_entities([sensor])
+
+    state = hass.states.get(sensor.entity_id)
+    event = Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": sensor.entity_id, "old_state": None, "new_state": state},
+    )
+    written = json_bytes(dict(state.attributes))
+    recorded = StateAttributes.shared_attrs_bytes_from_event(event, None)
+
+    assert "language_codes" in state.attributes
+    assert b"language_codes" not in recorded
+    assert b"chunk_size" not in recorded
+    assert len(written) > 400
+    assert len(recorded) < 200
 
 
 def test_language_count_no_data():
@@ -97,6 +160,38 @@ def test_language_count_enabled_by_default():
     assert sensor.entity_registry_enabled_default is True
 
 
+# --- ArgosQueueSensor tests ---
+
+
+def test_queue_sensor_values():
+    """Test queue sensor reports queue depth and wait details from the scheduler."""
+    coordinator = _make_coordinator()
+    scheduler = RequestScheduler(max_concurrent=2)
+    scheduler.in_flight = 2
+    scheduler.last_wait = 0.25
+    scheduler.average_wait = 0.1
+    coordinator.scheduler = scheduler
+    sensor = ArgosQueueSensor(coordinator, _make_entry())
+
+    assert sensor.native_value == 0
+    assert sensor.extra_state_attributes == {
+        "in_flight": 2,
+        "max_concurrent": 2,
+        "last_wait_ms": 250,
+        "average_wait_ms": 100,
+    }
+    assert sensor.should_poll is True
+
+
+def test_queue_sensor_unique_id():
+    """Test queue sensor unique_id format."""
+    coordinator = _make_coordinator()
+    coordinator.scheduler = RequestScheduler(max_concurrent=2)
+    sensor = ArgosQueueSensor(coordinator, _make_entry(entry_id="test_entry_123"))
+
+    assert sensor.unique_id == "test_entry_123_queue_depth"
+
+
 # --- ArgosStatusSensor tests ---
 
 
@@ -134,3 +229,63 @@ def test_status_sensor_device_class():
     sensor = ArgosStatusSensor(coordinator, entry)
 
     assert sensor.device_class == BinarySensorDeviceClass.CONNECTIVITY
+
+
+def test_status_sensor_attributes():
+    """Test status binary sensor reports the circuit but not the probe latency."""
+    coordinator = _make_coordinator()
+    coordinator.probe_latency = 0.01234
+    coordinator.breaker = CircuitBreaker(reset_timeout=30)
+    sensor = ArgosStatusSensor(coordinator, _make_entry())
+
+    assert sensor.should_poll is True
+    assert sensor.extra_state_attributes == {"circuit": "closed"}
+
+    coordinator.breaker.trip()
+    assert sensor.extra_state_attributes == {"circuit": "open"}
+
+
+# --- ArgosMetricSensor tests ---
+
+
+def test_metric_sensors_read_translate_metrics():
+    """Test metric sensors report latency in ms and rates for /translate."""
+    coordinator = MagicMock()
+    coordinator.client.metrics = RequestMetrics()
+    for _ in range(3):
+        coordinator.client.metrics.record("/translate", 0.2, chars=40)
+    coordinator.client.metrics.record("/translate", 5.0, error=True)
+    coordinator.client.metrics.record("/detect", 9.0)
+    entry = _make_entry()
+
+    values = {
+        description.key: ArgosMetricSensor(
+            coordinator, entry, description
+        ).native_value
+        for description in METRIC_SENSORS
+    }
+
+    assert 200 <= values["translate_latency_p50"] <= 220
+    assert 200 <= values["translate_latency_p99"] <= 220
+    assert values["translate_requests_per_minute"] == 4
+    assert values["translate_error_rate"] == 25
+    assert values["translate_chars_per_minute"] == 120
+
+
+def test_metric_sensors_empty():
+    """Test latency and error rate are unknown before any translation."""
+    coordinator = MagicMock()
+    coordinator.client.metrics = RequestMetrics()
+    entry = _make_entry()
+    sensors = {
+        description.key: ArgosMetricSensor(coordinator, entry, description)
+        for description in METRIC_SENSORS
+    }
+
+    assert sensors["translate_latency_p95"].native_value is None
+    assert sensors["translate_error_rate"].native_value is None
+    assert sensors["translate_requests_per_minute"].native_value == 0
+    assert (
+        sensors["translate_latency_p95"].unique_id
+        == "test_entry_123_translate_latency_p95"
+    )
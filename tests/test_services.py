@@ -1,17 +1,29 @@
 """Tests for Argos Translate translate service."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 import pytest
 
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_API_KEY, CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Context, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.argos_translate.api import CannotConnectError, TranslationError
-from custom_components.argos_translate.const import DOMAIN
+from custom_components.argos_translate.const import CONF_USE_SSL, DOMAIN
+from custom_components.argos_translate.coordinator import ArgosCoordinator
+from custom_components.argos_translate.languages import LanguageIndex
+from custom_components.argos_translate.router import ServerRouter
+from custom_components.argos_translate.scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    RequestScheduler,
+)
 from custom_components.argos_translate.services import async_register_services
 
 MOCK_LANGUAGES = [
@@ -31,12 +43,16 @@ async def _setup_service(
     mock_coordinator.data = {
         "languages": MOCK_LANGUAGES,
         "language_count": len(MOCK_LANGUAGES),
+        "index": LanguageIndex.from_languages(MOCK_LANGUAGES),
     }
     mock_coordinator.async_translate = AsyncMock(return_value=mock_result)
+    mock_coordinator.async_translate_many = AsyncMock(return_value=[mock_result])
     mock_coordinator.async_detect_languages = AsyncMock(return_value=[])
+    mock_coordinator.has_translation = MagicMock(return_value=False)
     mock_coordinator.async_request_refresh = AsyncMock()
     # async_set_update_error is a synchronous @callback (not a coroutine)
     mock_coordinator.async_set_update_error = MagicMock()
+    mock_coordinator.async_close_session = AsyncMock()
 
     mock_runtime_data = MagicMock()
     mock_runtime_data.coordinator = mock_coordinator
@@ -50,9 +66,13 @@ async def _setup_service(
         },
     )
     entry.add_to_hass(hass)
+    entry.mock_state(hass, ConfigEntryState.LOADED)
     entry.runtime_data = mock_runtime_data
+    mock_coordinator.config_entry = entry
+    mock_coordinator.weight = 1
+    mock_coordinator.scheduler = RequestScheduler(max_concurrent=2)
 
-    async_register_services(hass)
+    async_register_services(hass, ServerRouter())
 
     return entry, mock_coordinator
 
@@ -70,7 +90,27 @@ async def test_translate_success(hass: HomeAssistant) -> None:
     )
 
     assert result == {"translated_text": "Hola"}
-    mock_coordinator.async_translate.assert_called_once_with("Hello", "en", "es")
+    mock_coordinator.async_translate.assert_called_once_with(
+        "Hello", "en", "es", priority=PRIORITY_BACKGROUND
+    )
+
+
+async def test_translate_user_call_interactive_priority(hass: HomeAssistant) -> None:
+    """Test calls made by a user (e.g. from the card) get interactive priority."""
+    _entry, mock_coordinator = await _setup_service(hass)
+
+    await hass.services.async_call(
+        DOMAIN,
+        "translate",
+        {"text": "Hello", "source": "en", "target": "es"},
+        blocking=True,
+        return_response=True,
+        context=Context(user_id="user-1"),
+    )
+
+    mock_coordinator.async_translate.assert_called_once_with(
+        "Hello", "en", "es", priority=PRIORITY_INTERACTIVE
+    )
 
 
 async def test_translate_invalid_source(hass: HomeAssistant) -> None:
@@ -125,7 +165,7 @@ async def test_translate_api_error(hass: HomeAssistant) -> None:
 async def test_translate_no_config_entry(hass: HomeAssistant) -> None:
     """Test translate when no config entry exists raises ServiceValidationError."""
     # Register service without adding any config entry
-    async_register_services(hass)
+    async_register_services(hass, ServerRouter())
 
     with pytest.raises(ServiceValidationError):
         await hass.services.async_call(
@@ -156,7 +196,9 @@ async def test_translate_auto_detect_success(hass: HomeAssistant) -> None:
     assert result["translated_text"] == "Hello"
     assert result["detected_language"] == "fr"
     assert result["detection_confidence"] == 92.0
-    mock_coordinator.async_translate.assert_called_once_with("Bonjour", "auto", "en")
+    mock_coordinator.async_translate.assert_called_once_with(
+        "Bonjour", "auto", "en", priority=PRIORITY_BACKGROUND
+    )
 
 
 async def test_translate_auto_detect_uninstalled_language(hass: HomeAssistant) -> None:
@@ -265,6 +307,190 @@ async def test_translate_auto_detect_pair_unavailable_no_detect(hass: HomeAssist
     mock_coordinator.async_set_update_error.assert_not_called()
 
 
+async def test_translate_auto_detect_include_candidates(hass: HomeAssistant) -> None:
+    """Test include_candidates returns /detect candidates above the threshold inline."""
+    mock_result = {
+        "translatedText": "Hello",
+        "detectedLanguage": {"language": "fr", "confidence": 92.0},
+    }
+    _entry, mock_coordinator = await _setup_service(hass, mock_result)
+    mock_coordinator.async_detect_languages = AsyncMock(
+        return_value=[
+            {"language": "fr", "confidence": 92.0},
+            {"language": "it", "confidence": 61.0},
+            {"language": "es", "confidence": 12.0},
+        ]
+    )
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        "translate",
+        {
+            "text": "Bonjour",
+            "source": "auto",
+            "target": "en",
+            "include_candidates": True,
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    assert result["translated_text"] == "Hello"
+    assert result["detected_language"] == "fr"
+    assert result["detections"] == [
+        {"language": "fr", "confidence": 92.0},
+        {"language": "it", "confidence": 61.0},
+    ]
+    mock_coordinator.async_detect_languages.assert_called_once()
+
+
+async def test_translate_include_candidates_omitted_by_default(
+    hass: HomeAssistant,
+) -> None:
+    """Test detections are only added to the response when asked for."""
+    _entry, mock_coordinator = await _setup_service(hass)
+    mock_coordinator.async_detect_languages = AsyncMock(
+        return_value=[{"language": "fr", "confidence": 92.0}]
+    )
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        "translate",
+        {"text": "Bonjour", "source": "auto", "target": "en"},
+        blocking=True,
+        return_response=True,
+    )
+    assert "detections" not in result
+
+    # A fixed source never runs /detect, so there are no candidates to return
+    result = await hass.services.async_call(
+        DOMAIN,
+        "translate",
+        {"text": "Hello", "source": "en", "target": "es", "include_candidates": True},
+        blocking=True,
+        return_response=True,
+    )
+    assert "detections" not in result
+
+
+async def test_translate_include_candidates_pair_unavailable(
+    hass: HomeAssistant,
+) -> None:
+    """Test candidates are returned alongside the pair-unavailable error."""
+    _entry, mock_coordinator = await _setup_service(hass)
+    mock_coordinator.async_translate = AsyncMock(
+        side_effect=TranslationError("Server returned HTTP 400: Bad Request")
+    )
+    mock_coordinator.async_detect_languages = AsyncMock(
+        return_value=[
+            {"language": "fr", "confidence": 92.0},
+            {"language": "it", "confidence": 61.0},
+        ]
+    )
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        "translate",
+        {
+            "text": "Bonjour le monde",
+            "source": "auto",
+            "target": "es",
+            "include_candidates": True,
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    assert result["translated_text"] == ""
+    assert result["detected_language"] == "fr"
+    assert result["detections"] == [
+        {"language": "fr", "confidence": 92.0},
+        {"language": "it", "confidence": 61.0},
+    ]
+
+
+async def test_translate_auto_detect_overlaps_requests(
+    hass: HomeAssistant, socket_enabled: None
+) -> None:
+    """Test auto-detect sends /detect and /translate at the same time.
+
+    Runs against a local LibreTranslate stand-in. Each endpoint records when
+    it starts and then holds its response until both have started, so the
+    call only completes (and both starts come before either end) when the
+    service overlaps the two requests instead of sending them back to back.
+    """
+    events: list[str] = []
+    both_started = asyncio.Event()
+
+    async def _hold(name: str) -> None:
+        events.append(f"start {name}")
+        if len(events) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=5)
+        events.append(f"end {name}")
+
+    async def _languages(request: web.Request) -> web.Response:
+        return web.json_response(MOCK_LANGUAGES)
+
+    async def _detect(request: web.Request) -> web.Response:
+        await _hold("/detect")
+        return web.json_response([{"language": "en", "confidence": 90.0}])
+
+    async def _translate(request: web.Request) -> web.Response:
+        await _hold("/translate")
+        return web.json_response(
+            {
+                "translatedText": "Hola",
+                "detectedLanguage": {"language": "en", "confidence": 90.0},
+            }
+        )
+
+    app = web.Application()
+    app.router.add_get("/languages", _languages)
+    app.router.add_post("/detect", _detect)
+    app.router.add_post("/translate", _translate)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_HOST: "127.0.0.1",
+            CONF_PORT: server.port,
+            CONF_API_KEY: "",
+            CONF_USE_SSL: False,
+        },
+    )
+    entry.add_to_hass(hass)
+    coordinator = ArgosCoordinator(hass, entry)
+    try:
+        await coordinator.async_refresh()
+        entry.mock_state(hass, ConfigEntryState.LOADED)
+        entry.runtime_data = MagicMock(coordinator=coordinator)
+        async_register_services(hass, ServerRouter())
+
+        result = await hass.services.async_call(
+            DOMAIN,
+            "translate",
+            {
+                "text": "Good evening",
+                "source": "auto",
+                "target": "es",
+                "include_candidates": True,
+            },
+            blocking=True,
+            return_response=True,
+        )
+    finally:
+        await coordinator.async_shutdown()
+        await server.close()
+
+    assert result["translated_text"] == "Hola"
+    assert result["detections"] == [{"language": "en", "confidence": 90.0}]
+    assert sorted(events[:2]) == ["start /detect", "start /translate"]
+    assert sorted(events[2:]) == ["end /detect", "end /translate"]
+
+
 async def test_translate_translation_error_non_auto(hass: HomeAssistant) -> None:
     """Test that TranslationError on non-auto source raises HomeAssistantError.
 
@@ -288,3 +514,364 @@ async def test_translate_translation_error_non_auto(hass: HomeAssistant) -> None
 
     # Server IS reachable (returned 4xx) — coordinator must NOT be marked as failed
     mock_coordinator.async_set_update_error.assert_not_called()
+
+
+async def test_translate_batch_success(hass: HomeAssistant) -> None:
+    """Test batch translation returns one result per text in input order."""
+    _entry, mock_coordinator = await _setup_service(hass)
+    mock_coordinator.async_translate_many = AsyncMock(
+        return_value=[{"translatedText": "Hola"}, {"translatedText": "Adiós"}]
+    )
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        "translate_batch",
+        {"texts": ["Hello", "Goodbye"], "source": "en", "target": "es"},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert result == {
+        "translations": [
+            {"translated_text": "Hola"},
+            {"translated_text": "Adiós"},
+        ]
+    }
+    mock_coordinator.async_translate_many.assert_called_once_with(
+        ["Hello", "Goodbye"], "en", "es", priority=PRIORITY_BACKGROUND
+    )
+
+
+async def test_translate_batch_invalid_target(hass: HomeAssistant) -> None:
+    """Test batch translation validates the language pair before any API call."""
+    _entry, mock_coordinator = await _setup_service(hass)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "translate_batch",
+            {"texts": ["Hello"], "source": "en", "target": "xx"},
+            blocking=True,
+            return_response=True,
+        )
+
+    mock_coordinator.async_translate_many.assert_not_called()
+
+
+async def test_translate_batch_api_error(hass: HomeAssistant) -> None:
+    """Test batch translation connection failure flips status offline."""
+    _entry, mock_coordinator = await _setup_service(hass)
+    mock_coordinator.async_translate_many = AsyncMock(
+        side_effect=CannotConnectError("timeout")
+    )
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN,
+            "translate_batch",
+            {"texts": ["Hello"], "source": "en", "target": "es"},
+            blocking=True,
+            return_response=True,
+        )
+
+    mock_coordinator.async_set_update_error.assert_called_once()
+
+
+# --- Multi-server routing tests ---
+
+
+async def test_translate_spreads_across_servers(hass: HomeAssistant) -> None:
+    """Test round-robin sends consecutive calls to different servers."""
+    _entry_a, coordinator_a = await _setup_service(hass, {"translatedText": "A"})
+    _entry_b, coordinator_b = await _setup_service(hass, {"translatedText": "B"})
+
+    results = [
+        await hass.services.async_call(
+            DOMAIN,
+            "translate",
+            {"text": "Hello", "source": "en", "target": "es", "strategy": "round_robin"},
+            blocking=True,
+            return_response=True,
+        )
+        for _ in range(4)
+    ]
+
+    assert sorted(r["translated_text"] for r in results) == ["A", "A", "B", "B"]
+    assert coordinator_a.async_translate.call_count == 2
+    assert coordinator_b.async_translate.call_count == 2
+
+
+async def test_translate_prefers_server_with_cached_result(
+    hass: HomeAssistant,
+) -> None:
+    """Test a call goes to the server that already has its result."""
+    _entry_a, coordinator_a = await _setup_service(hass, {"translatedText": "A"})
+    _entry_b, coordinator_b = await _setup_service(hass, {"translatedText": "B"})
+    coordinator_b.has_translation = MagicMock(return_value=True)
+
+    for _ in range(3):
+        result = await hass.services.async_call(
+            DOMAIN,
+            "translate",
+            {"text": "Hello", "source": "en", "target": "es"},
+            blocking=True,
+            return_response=True,
+        )
+        assert result["translated_text"] == "B"
+
+    coordinator_a.async_translate.assert_not_called()
+    coordinator_b.has_translation.assert_called_with("Hello", "en", "es")
+
+
+async def test_translate_fails_over_to_next_server(hass: HomeAssistant) -> None:
+    """Test an unreachable server is marked offline and the next one answers."""
+    _entry_a, coordinator_a = await _setup_service(hass, {"translatedText": "A"})
+    _entry_b, coordinator_b = await _setup_service(hass, {"translatedText": "B"})
+    # Both servers are idle, so the first call goes to the first entry
+    coordinator_a.async_translate = AsyncMock(side_effect=CannotConnectError("down"))
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        "translate",
+        {"text": "Hello", "source": "en", "target": "es"},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert result["translated_text"] == "B"
+    coordinator_a.async_translate.assert_called_once()
+    coordinator_a.async_set_update_error.assert_called_once()
+    coordinator_b.async_set_update_error.assert_not_called()
+
+
+async def test_translate_entry_id_override(hass: HomeAssistant) -> None:
+    """Test entry_id pins the call to one server."""
+    _entry_a, coordinator_a = await _setup_service(hass, {"translatedText": "A"})
+    entry_b, coordinator_b = await _setup_service(hass, {"translatedText": "B"})
+
+    for _ in range(3):
+        result = await hass.services.async_call(
+            DOMAIN,
+            "translate",
+            {
+                "text": "Hello",
+                "source": "en",
+                "target": "es",
+                "entry_id": entry_b.entry_id,
+            },
+            blocking=True,
+            return_response=True,
+        )
+        assert result["translated_text"] == "B"
+
+    coordinator_a.async_translate.assert_not_called()
+
+
+async def test_detect_entry_not_loaded(hass: HomeAssistant) -> None:
+    """Test an unknown entry_id is rejected before any server is called."""
+    _entry, mock_coordinator = await _setup_service(hass)
+
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await hass.services.async_call(
+            DOMAIN,
+            "detect",
+            {"text": "Hello", "entry_id": "missing"},
+            blocking=True,
+            return_response=True,
+        )
+
+    assert exc_info.value.translation_key == "entry_not_loaded"
+    mock_coordinator.async_detect_languages.assert_not_called()
+
+
+async def test_translate_routes_pair_to_server_with_it(hass: HomeAssistant) -> None:
+    """Test each pair goes to a server that has it installed."""
+    _entry_a, european = await _setup_service(hass, {"translatedText": "Hola"})
+    _entry_b, cjk = await _setup_service(hass, {"translatedText": "こんにちは"})
+    cjk_languages = [
+        {"code": "en", "name": "English", "targets": ["ja"]},
+        {"code": "ja", "name": "Japanese", "targets": ["en"]},
+    ]
+    cjk.data = {"index": LanguageIndex.from_languages(cjk_languages)}
+
+    for _ in range(2):
+        result = await hass.services.async_call(
+            DOMAIN,
+            "translate",
+            {"text": "Hello", "source": "en", "target": "ja"},
+            blocking=True,
+            return_response=True,
+        )
+        assert result["translated_text"] == "こんにちは"
+
+    european.async_translate.assert_not_called()
+    assert cjk.async_translate.call_count == 2
+
+
+async def test_translate_unsupported_pair_rejected_locally(
+    hass: HomeAssistant,
+) -> None:
+    """Test a pair no server has is rejected without contacting any server."""
+    _entry_a, european = await _setup_service(hass)
+    _entry_b, cjk = await _setup_service(hass)
+    cjk.data = {
+        "index": LanguageIndex.from_languages(
+            [{"code": "ja", "name": "Japanese", "targets": ["en"]}]
+        )
+    }
+
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await hass.services.async_call(
+            DOMAIN,
+            "translate",
+            {"text": "こんにちは", "source": "ja", "target": "es"},
+            blocking=True,
+            return_response=True,
+        )
+
+    assert exc_info.value.translation_key == "invalid_target"
+    european.async_translate.assert_not_called()
+    cjk.async_translate.assert_not_called()
+
+
+async def test_translate_auto_routes_to_server_with_target(
+    hass: HomeAssistant,
+) -> None:
+    """Test auto-detect calls skip servers that cannot translate into the target."""
+    _entry_a, european = await _setup_service(hass, {"translatedText": "Hola"})
+    _entry_b, cjk = await _setup_service(hass, {"translatedText": "こんにちは"})
+    cjk.data = {
+        "index": LanguageIndex.from_languages(
+            [
+                {"code": "en", "name": "English", "targets": ["ja"]},
+                {"code": "ja", "name": "Japanese", "targets": ["en"]},
+            ]
+        )
+    }
+
+    for _ in range(2):
+        result = await hass.services.async_call(
+            DOMAIN,
+            "translate",
+            {"text": "Hello", "source": "auto", "target": "ja"},
+            blocking=True,
+            return_response=True,
+        )
+        assert result["translated_text"] == "こんにちは"
+
+    european.async_translate.assert_not_called()
+
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await hass.services.async_call(
+            DOMAIN,
+            "translate",
+            {"text": "Hello", "source": "auto", "target": "ko"},
+            blocking=True,
+            return_response=True,
+        )
+    assert exc_info.value.translation_key == "invalid_auto_target"
+
+
+# --- Pivot translation tests ---
+
+PIVOT_LANGUAGES = [
+    {"code": "de", "name": "German", "targets": ["en"]},
+    {"code": "en", "name": "English", "targets": ["de", "ja"]},
+    {"code": "ja", "name": "Japanese", "targets": ["en"]},
+]
+
+
+async def test_translate_pivot_chains_through_intermediate(
+    hass: HomeAssistant,
+) -> None:
+    """Test pivot mode translates de -> en -> ja and reports the path."""
+    _entry, mock_coordinator = await _setup_service(hass)
+    mock_coordinator.data = {"index": LanguageIndex.from_languages(PIVOT_LANGUAGES)}
+
+    async def _translate(text, source, target, priority):
+        return {"translatedText": f"{text}>{target}"}
+
+    mock_coordinator.async_translate = AsyncMock(side_effect=_translate)
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        "translate",
+        {"text": "Hallo", "source": "de", "target": "ja", "pivot": True},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert result == {
+        "translated_text": "Hallo>en>ja",
+        "translation_path": ["de", "en", "ja"],
+    }
+    # Each hop goes through the coordinator, so intermediate results are cached
+    assert [c.args for c in mock_coordinator.async_translate.call_args_list] == [
+        ("Hallo", "de", "en"),
+        ("Hallo>en", "en", "ja"),
+    ]
+
+
+async def test_translate_without_pivot_rejects_missing_pair(
+    hass: HomeAssistant,
+) -> None:
+    """Test a pair with no direct model still fails unless pivot is enabled."""
+    _entry, mock_coordinator = await _setup_service(hass)
+    mock_coordinator.data = {"index": LanguageIndex.from_languages(PIVOT_LANGUAGES)}
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "translate",
+            {"text": "Hallo", "source": "de", "target": "ja"},
+            blocking=True,
+            return_response=True,
+        )
+
+    mock_coordinator.async_translate.assert_not_called()
+
+
+async def test_translate_pivot_direct_pair(hass: HomeAssistant) -> None:
+    """Test pivot mode uses a direct pair when one exists."""
+    _entry, mock_coordinator = await _setup_service(hass)
+    mock_coordinator.data = {"index": LanguageIndex.from_languages(PIVOT_LANGUAGES)}
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        "translate",
+        {"text": "Hallo", "source": "de", "target": "en", "pivot": True},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert result["translation_path"] == ["de", "en"]
+    mock_coordinator.async_translate.assert_called_once()
+
+
+async def test_translate_pivot_auto_detected_language(hass: HomeAssistant) -> None:
+    """Test auto source with pivot chains from the detected language."""
+    _entry, mock_coordinator = await _setup_service(hass)
+    mock_coordinator.data = {"index": LanguageIndex.from_languages(PIVOT_LANGUAGES)}
+
+    async def _translate(text, source, target, priority):
+        if source == "auto":
+            raise TranslationError("Server returned HTTP 400: Bad Request")
+        return {"translatedText": f"{text}>{target}"}
+
+    mock_coordinator.async_translate = AsyncMock(side_effect=_translate)
+    mock_coordinator.async_detect_languages = AsyncMock(
+        return_value=[{"language": "de", "confidence": 95.0}]
+    )
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        "translate",
+        {"text": "Hallo", "source": "auto", "target": "ja", "pivot": True},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert result["translated_text"] == "Hallo>en>ja"
+    assert result["detected_language"] == "de"
+    assert result["detection_confidence"] == 95.0
+    assert result["translation_path"] == ["de", "en", "ja"]
@@ -0,0 +1,230 @@
+"""Tests for the Argos Translate websocket commands."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_API_KEY, CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.typing import WebSocketGenerator
+
+from custom_components.argos_translate.api import (
+    CannotConnectError,
+    TranslationError,
+)
+from custom_components.argos_translate.const import CONF_CHUNK_SIZE, DOMAIN
+from custom_components.argos_translate.coordinator import ArgosCoordinator
+from custom_components.argos_translate.router import ServerRouter
+from custom_components.argos_translate.websocket_api import (
+    WS_LANGUAGES,
+    WS_TRANSLATE_STREAM,
+    async_register_websocket_commands,
+)
+
+MOCK_LANGUAGES = [
+    {"code": "en", "name": "English", "targets": ["es", "fr"]},
+    {"code": "es", "name": "Spanish", "targets": ["en"]},
+]
+TEXT = "First paragraph.\n\nSecond paragraph.\nThird."
+
+
+async def _setup_coordinator(hass: HomeAssistant) -> ArgosCoordinator:
+    """Set up one loaded entry that splits texts into small chunks."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: "localhost", CONF_PORT: 5000, CONF_API_KEY: ""},
+        options={CONF_CHUNK_SIZE: 20},
+    )
+    entry.add_to_hass(hass)
+    coordinator = ArgosCoordinator(hass, entry)
+    with patch.object(
+        coordinator.client,
+        "async_get_languages",
+        AsyncMock(return_value=MOCK_LANGUAGES),
+    ):
+        await coordinator.async_refresh()
+    entry.mock_state(hass, ConfigEntryState.LOADED)
+    entry.runtime_data = MagicMock(coordinator=coordinator)
+    async_register_websocket_commands(hass, ServerRouter())
+    return coordinator
+
+
+async def test_translate_stream_in_order(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test pieces arrive in input order even when later chunks finish first."""
+    coordinator = await _setup_coordinator(hass)
+
+    async def _translate(text: str, source: str, target: str) -> dict[str, Any]:
+        if text == "First paragraph.":
+            await asyncio.sleep(0.05)
+        return {"translatedText": text.upper()}
+
+    coordinator.client.async_translate = AsyncMock(side_effect=_translate)
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {"type": WS_TRANSLATE_STREAM, "text": TEXT, "source": "en", "target": "es"}
+    )
+    assert (await client.receive_json())["success"]
+
+    pieces = []
+    while "translated_text" in (event := (await client.receive_json())["event"]):
+        pieces.append(event["translated_text"])
+
+    assert event == {"done": True}
+    assert pieces == ["FIRST PARAGRAPH.", "\n\nSECOND PARAGRAPH.", "\nTHIRD."]
+    await coordinator.async_shutdown()
+
+
+async def test_translate_stream_rejects_invalid_pair(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test an uninstalled pair is rejected before subscribing."""
+    coordinator = await _setup_coordinator(hass)
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": WS_TRANSLATE_STREAM, "text": TEXT, "source": "es", "target": "fr"}
+    )
+    response = await client.receive_json()
+
+    assert not response["success"]
+    assert response["error"]["translation_key"] == "invalid_target"
+    await coordinator.async_shutdown()
+
+
+async def test_translate_stream_error_event(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test an unreachable server ends the stream with an error event."""
+    coordinator = await _setup_coordinator(hass)
+    coordinator.client.async_translate = AsyncMock(
+        side_effect=CannotConnectError("refused")
+    )
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": WS_TRANSLATE_STREAM, "text": TEXT, "source": "en", "target": "es"}
+    )
+    assert (await client.receive_json())["success"]
+    event = (await client.receive_json())["event"]
+
+    assert event["error"]["code"] == "cannot_connect"
+    assert not coordinator.last_update_success
+    await coordinator.async_shutdown()
+
+
+async def test_translate_stream_unexpected_error_ends_stream(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test an unexpected failure still ends the stream with an error event."""
+    coordinator = await _setup_coordinator(hass)
+    coordinator.client.async_translate = AsyncMock(side_effect=KeyError("q"))
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": WS_TRANSLATE_STREAM, "text": TEXT, "source": "en", "target": "es"}
+    )
+    assert (await client.receive_json())["success"]
+    event = (await client.receive_json())["event"]
+
+    assert event["error"]["code"] == "unknown_error"
+    await coordinator.async_shutdown()
+
+
+async def test_translate_stream_auto_pair_unavailable(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test an auto source with no pair to target ends with the detection."""
+    coordinator = await _setup_coordinator(hass)
+    coordinator.client.async_translate = AsyncMock(
+        side_effect=TranslationError("Server returned HTTP 400")
+    )
+    coordinator.client.async_detect_languages = AsyncMock(
+        return_value=[{"language": "de", "confidence": 92.0}]
+    )
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": WS_TRANSLATE_STREAM, "text": TEXT, "source": "auto", "target": "es"}
+    )
+    assert (await client.receive_json())["success"]
+    event = (await client.receive_json())["event"]
+
+    assert event == {
+        "error": {
+            "code": "translation_error",
+            "message": "Detected de but de \u2192 Spanish translation pair is not"
+            " available.",
+        },
+        "detected_language": "de",
+        "detection_confidence": 92.0,
+        "uninstalled_detected_language": "de",
+    }
+    await coordinator.async_shutdown()
+
+
+async def test_translate_stream_auto_uninstalled_language(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the first piece flags a detected language that is not installed."""
+    coordinator = await _setup_coordinator(hass)
+
+    async def _translate(text: str, source: str, target: str) -> dict[str, Any]:
+        return {
+            "translatedText": text.upper(),
+            "detectedLanguage": {"language": "de", "confidence": 80.0},
+        }
+
+    coordinator.client.async_translate = AsyncMock(side_effect=_translate)
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": WS_TRANSLATE_STREAM, "text": TEXT, "source": "auto", "target": "es"}
+    )
+    assert (await client.receive_json())["success"]
+    event = (await client.receive_json())["event"]
+
+    assert event == {
+        "translated_text": "FIRST PARAGRAPH.",
+        "detected_language": "de",
+        "detection_confidence": 80.0,
+        "uninstalled_detected_language": "de",
+    }
+    await coordinator.async_shutdown()
+
+
+async def test_languages_catalog(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the catalog is served by entity, tagged with the sensor's version."""
+    coordinator = await _setup_coordinator(hass)
+    registry = er.async_get(hass)
+    entity = registry.async_get_or_create(
+        "sensor",
+        DOMAIN,
+        "language_count",
+        config_entry=coordinator.config_entry,
+    )
+    other = registry.async_get_or_create("sensor", "demo", "other")
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": WS_LANGUAGES, "entity_id": entity.entity_id}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "version": coordinator.data["version"],
+        "languages": MOCK_LANGUAGES,
+    }
+
+    await client.send_json_auto_id({"type": WS_LANGUAGES, "entity_id": other.entity_id})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+    await coordinator.async_shutdown()